@@ -3,5 +3,15 @@
 from algorithms.base_pathfinder import BasePathfinder
 from algorithms.a_star import AStarPathfinder
 from algorithms.dijkstra import DijkstraPathfinder
+from algorithms.jump_point_search import JumpPointSearchPathfinder
+from algorithms.bidirectional import BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder
+from algorithms.d_star_lite import DStarLitePathfinder
+from algorithms.hpa_star import HPAStarPathfinder
+from algorithms.batch import find_paths_batch
+from algorithms.workspace import SearchWorkspace
+from algorithms.open_list import OPEN_LISTS, OpenList
 
-__all__ = ['BasePathfinder', 'AStarPathfinder', 'DijkstraPathfinder']
\ No newline at end of file
+__all__ = ['BasePathfinder', 'AStarPathfinder', 'DijkstraPathfinder', 'JumpPointSearchPathfinder',
+           'BidirectionalAStarPathfinder', 'BidirectionalDijkstraPathfinder', 'DStarLitePathfinder',
+           'HPAStarPathfinder', 'find_paths_batch', 'SearchWorkspace',
+           'OPEN_LISTS', 'OpenList']
\ No newline at end of file
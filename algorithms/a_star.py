@@ -4,55 +4,69 @@ A* pathfinding algorithm implementation.
 Uses f(n) = g(n) + h(n) where:
 - g(n) = cost from start to n
 - h(n) = heuristic estimate from n to goal
+
+h(n) is the Manhattan distance, optionally tightened by landmark (ALT)
+lower bounds.
 """
 
-from queue import PriorityQueue
-from typing import List, Dict
-from blocks.block import Block
-from algorithms.base_pathfinder import BasePathfinder, PathfindingResult
+from typing import Callable, Iterator, Optional, Union
+from blocks.grid_graph import GridGraph
+from algorithms.base_pathfinder import (
+    BasePathfinder, PathfindingResult, SearchEvent, Grid, Node, TRACE_FULL, TRACE_SUMMARY
+)
+from algorithms.landmarks import LandmarkTable
 
 
 class AStarPathfinder(BasePathfinder):
-    """A* pathfinding algorithm with heuristic optimization."""
-
-    def find_path(self, grid: List[List[Block]], start: Block, end: Block) -> PathfindingResult:
-        count = 0
-        open_set = PriorityQueue()
-        open_set.put((0, count, start))
-
-        came_from: Dict[Block, Block] = {}
-        g_score = {block: float("inf") for row in grid for block in row}
-        g_score[start] = 0
+    """
+    A* pathfinding algorithm with heuristic optimization.
 
-        f_score = {block: float("inf") for row in grid for block in row}
-        f_score[start] = self.manhattan_distance(start.get_position(), end.get_position())
+    Args:
+        open_list: Key of the open-list backend in OPEN_LISTS
+        landmarks: Number of ALT landmarks to build per grid, or a prebuilt
+            (e.g. loaded) LandmarkTable. None uses Manhattan distance only.
+    """
 
-        open_set_hash = {start}
-        visited = []
+    def __init__(self, open_list: str = 'heap', landmarks: Union[None, int, LandmarkTable] = None):
+        super().__init__(open_list)
+        if isinstance(landmarks, LandmarkTable):
+            self.landmarks: Optional[LandmarkTable] = landmarks
+            self.landmark_count = max(len(landmarks.landmarks), 1)
+        else:
+            if landmarks is not None and landmarks < 1:
+                raise ValueError("landmarks must be at least 1")
+            self.landmarks = None
+            self.landmark_count = landmarks
 
-        while not open_set.empty():
-            current = open_set.get()[2]
-            open_set_hash.remove(current)
+    def find_path(self, grid: Grid, start: Node, end: Node, trace: str = TRACE_FULL) -> PathfindingResult:
+        return self.drain(self.best_first_search(grid, start, end, trace, False, self.heuristic))
 
-            if current == end:
-                path = self.reconstruct_path(came_from, end)
-                return PathfindingResult(path, came_from, visited)
+    def find_path_iter(self, grid: Grid, start: Node, end: Node,
+                       trace: str = TRACE_SUMMARY) -> Iterator[SearchEvent]:
+        return self.best_first_search(grid, start, end, trace, True, self.heuristic)
 
-            visited.append(current)
+    def heuristic(self, graph: GridGraph, end: int) -> Callable[[int], int]:
+        """Return h(n) towards end: Manhattan distance, raised to the landmark bound when enabled."""
+        cols = graph.cols
+        end_row, end_col = divmod(end, cols)
+        if self.landmark_count is None:
+            return lambda cell: self.manhattan_distance(divmod(cell, cols), (end_row, end_col))
 
-            for neighbor in current.neighbors:
-                temp_g_score = g_score[current] + 1
+        target_tables = self.landmark_table(graph).target_tables(end)
 
-                if temp_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = temp_g_score
-                    f_score[neighbor] = temp_g_score + self.manhattan_distance(
-                        neighbor.get_position(), end.get_position()
-                    )
+        def landmark_heuristic(cell: int) -> int:
+            row, col = divmod(cell, cols)
+            bound = abs(row - end_row) + abs(col - end_col)
+            for table, to_target in target_tables:
+                difference = abs(to_target - table[cell])
+                if difference > bound:
+                    bound = difference
+            return bound
 
-                    if neighbor not in open_set_hash:
-                        count += 1
-                        open_set.put((f_score[neighbor], count, neighbor))
-                        open_set_hash.add(neighbor)
+        return landmark_heuristic
 
-        return PathfindingResult(None, came_from, visited)
\ No newline at end of file
+    def landmark_table(self, graph: GridGraph) -> LandmarkTable:
+        """Landmark tables for graph, rebuilt only when its occupancy has changed."""
+        if self.landmarks is None or not self.landmarks.matches(graph):
+            self.landmarks = LandmarkTable.build(graph, self.landmark_count)
+        return self.landmarks
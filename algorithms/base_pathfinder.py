@@ -5,46 +5,229 @@ Separates algorithm logic from visualization concerns.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple
+from array import array
+from typing import Any, Callable, Iterable, Iterator, List, Dict, NamedTuple, Optional, Tuple, Union
 from blocks.block import Block
+from blocks.grid_graph import GridGraph
+from algorithms.open_list import OPEN_LISTS, OpenList, create_open_list
+from algorithms.workspace import SearchWorkspace
+
+# A search node is either a Block or an integer cell id of a GridGraph
+Node = Union[Block, int]
+Grid = Union[List[List[Block]], GridGraph]
+
+# Search side tags for bidirectional algorithms
+FORWARD = 0
+BACKWARD = 1
+
+# Search event kinds
+OPEN = 'open'        # Node pushed onto the open list
+EXPAND = 'expand'    # Node popped and expanded
+DONE = 'done'        # Search finished; the payload is the PathfindingResult
+
+# Trace levels: how much of the search a result keeps
+TRACE_NONE = 'none'          # Path only
+TRACE_SUMMARY = 'summary'    # Path and expansion count
+TRACE_FULL = 'full'          # Path, came_from and the visit order
+TRACE_LEVELS = (TRACE_NONE, TRACE_SUMMARY, TRACE_FULL)
+
+
+class SearchTrace:
+    """
+    Flat-array record of a search over a GridGraph.
+
+    ``reached`` and ``parents`` are parallel arrays: every cell given a
+    parent during the search, and that parent. Cells are stored as integer
+    ids and converted to nodes only on access: Blocks when ``blocks`` is
+    set, cell ids otherwise.
+    """
+
+    def __init__(self, cols: int, path_cells: Optional[array], reached: Optional[array] = None,
+                 parents: Optional[array] = None, visit_log: Optional[array] = None,
+                 blocks: Optional[List[List[Block]]] = None):
+        self.cols = cols
+        self.path_cells = path_cells
+        self.reached = reached
+        self.parents = parents
+        self.visit_log = visit_log
+        self.blocks = blocks
+
+    def node(self, cell: int) -> Node:
+        if self.blocks is None:
+            return cell
+        row, col = divmod(cell, self.cols)
+        return self.blocks[row][col]
+
+    def path(self) -> Optional[List[Node]]:
+        if self.path_cells is None:
+            return None
+        return [self.node(cell) for cell in self.path_cells]
+
+    def came_from(self) -> Dict[Node, Node]:
+        if self.reached is None:
+            return {}
+        node = self.node
+        return {node(cell): node(parent) for cell, parent in zip(self.reached, self.parents)}
+
+    def visited(self) -> List[Node]:
+        if self.visit_log is None:
+            return []
+        return [self.node(cell) for cell in self.visit_log]
 
 
 class PathfindingResult:
-    """Container for pathfinding algorithm results."""
+    """
+    Container for pathfinding algorithm results.
+
+    ``visited_sides`` is set by bidirectional searches and tags each visited
+    node with the side (FORWARD or BACKWARD) that expanded it. ``expanded``
+    counts expansions, or is None when the trace level did not record it.
+
+    Results built from a SearchTrace keep flat arrays and create ``path``,
+    ``came_from`` and ``visited`` (as Blocks or cell ids) on first access.
+    """
+
+    def __init__(self, path: Optional[List[Node]], came_from: Dict[Node, Node], visited: List[Node],
+                 visited_sides: Optional[List[int]] = None, expanded: Optional[int] = None):
+        self._path = path
+        self._came_from = came_from
+        self._visited = visited
+        self._trace: Optional[SearchTrace] = None
+        self.visited_sides = visited_sides
+        self.expanded = len(visited) if expanded is None and visited else expanded
+        self.found = path is not None
+
+    @classmethod
+    def from_trace(cls, trace: SearchTrace, expanded: Optional[int] = None) -> 'PathfindingResult':
+        result = cls(None, {}, [], expanded=expanded)
+        result._trace = trace
+        result.found = trace.path_cells is not None
+        return result
+
+    def _materialize(self) -> None:
+        """Turn the flat trace into node collections; later accesses are plain attributes."""
+        trace = self._trace
+        if trace is not None:
+            self._trace = None
+            self._path, self._came_from, self._visited = trace.path(), trace.came_from(), trace.visited()
 
-    def __init__(self, path: Optional[List[Block]], came_from: Dict[Block, Block], visited: List[Block]):
-        self.path = path
-        self.came_from = came_from
-        self.visited = visited
+    @property
+    def path(self) -> Optional[List[Node]]:
+        self._materialize()
+        return self._path
+
+    @path.setter
+    def path(self, path: Optional[List[Node]]) -> None:
+        self._materialize()
+        self._path = path
         self.found = path is not None
 
+    @property
+    def came_from(self) -> Dict[Node, Node]:
+        self._materialize()
+        return self._came_from
+
+    @came_from.setter
+    def came_from(self, came_from: Dict[Node, Node]) -> None:
+        self._materialize()
+        self._came_from = came_from
+
+    @property
+    def visited(self) -> List[Node]:
+        self._materialize()
+        return self._visited
+
+    @visited.setter
+    def visited(self, visited: List[Node]) -> None:
+        self._materialize()
+        self._visited = visited
+
     def get_path_length(self) -> int:
-        return len(self.path) if self.path else 0
+        if self._trace is not None:
+            return len(self._trace.path_cells) if self._trace.path_cells is not None else 0
+        return len(self._path) if self._path else 0
+
+
+class SearchEvent(NamedTuple):
+    """One step of a streaming search. ``payload`` is a node, or the PathfindingResult for DONE."""
+    kind: str
+    payload: Any
+    side: int = FORWARD
 
 
 class BasePathfinder(ABC):
-    """Abstract base class for pathfinding algorithms."""
+    """
+    Abstract base class for pathfinding algorithms.
 
-    def __init__(self):
-        self.came_from: Dict[Block, Block] = {}
-        self.visited: List[Block] = []
+    Args:
+        open_list: Key of the open-list backend in OPEN_LISTS ('heap', 'bucket' or 'radix')
+    """
+
+    def __init__(self, open_list: str = 'heap'):
+        if open_list not in OPEN_LISTS:
+            raise ValueError(f"Unknown open list '{open_list}', expected one of {sorted(OPEN_LISTS)}")
+        self.open_list = open_list
+        self.workspace = SearchWorkspace()
+        self.came_from: Dict[Node, Node] = {}
+        self.visited: List[Node] = []
 
     @abstractmethod
-    def find_path(self, grid: List[List[Block]], start: Block, end: Block) -> PathfindingResult:
+    def find_path(self, grid: Grid, start: Node, end: Node, trace: str = TRACE_FULL) -> PathfindingResult:
         """
         Find path from start to end.
 
         Args:
-            grid: 2D list of blocks
-            start: Starting block
-            end: Goal block
+            grid: 2D list of blocks, or a GridGraph
+            start: Starting block (or cell id when grid is a GridGraph)
+            end: Goal block (or cell id when grid is a GridGraph)
+            trace: How much of the search to keep, one of TRACE_LEVELS
 
         Returns:
             PathfindingResult containing path and metadata
         """
         pass
 
-    def reconstruct_path(self, came_from: Dict[Block, Block], current: Block) -> List[Block]:
+    def find_path_iter(self, grid: Grid, start: Node, end: Node,
+                       trace: str = TRACE_SUMMARY) -> Iterator[SearchEvent]:
+        """
+        Find path from start to end, yielding search events as they happen.
+
+        Yields OPEN and EXPAND events and finishes with a DONE event carrying
+        the PathfindingResult at the given trace level. The default keeps no
+        visit log, so callers that consume events need not store them.
+        Closing the generator early stops the search.
+
+        Pathfinders that do not stream search first and then replay their
+        expansions as EXPAND events.
+        """
+        result = self.find_path(grid, start, end)
+        sides = result.visited_sides
+        for i, node in enumerate(result.visited):
+            yield SearchEvent(EXPAND, node, FORWARD if sides is None else sides[i])
+        yield SearchEvent(DONE, self.trim_result(result, trace))
+
+    @staticmethod
+    def drain(events: Iterable[SearchEvent]) -> PathfindingResult:
+        """Run an event stream to completion and return its result."""
+        event = None
+        for event in events:
+            pass
+        return event.payload
+
+    def notify_changed(self, cells: Iterable[Node]) -> None:
+        """
+        Report cells whose walkability changed since the last search.
+
+        Stateless pathfinders ignore this; incremental ones repair their
+        search state from it on the next find_path call.
+        """
+        pass
+
+    def create_open_list(self) -> OpenList:
+        """Create an empty frontier of the configured backend."""
+        return create_open_list(self.open_list)
+
+    def reconstruct_path(self, came_from: Dict[Node, Node], current: Node) -> List[Node]:
         """Reconstruct path from came_from dictionary."""
         path = []
         while current in came_from:
@@ -55,4 +238,169 @@ class BasePathfinder(ABC):
 
     def manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
         """Calculate Manhattan distance heuristic."""
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
\ No newline at end of file
+        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+    @staticmethod
+    def check_trace(trace: str) -> None:
+        if trace not in TRACE_LEVELS:
+            raise ValueError(f"Unknown trace level '{trace}', expected one of {TRACE_LEVELS}")
+
+    def trim_result(self, result: PathfindingResult, trace: str) -> PathfindingResult:
+        """Drop what the trace level does not keep from an eagerly built result."""
+        self.check_trace(trace)
+        if trace == TRACE_FULL:
+            return result
+        expanded = len(result.visited) if trace == TRACE_SUMMARY else None
+        return PathfindingResult(result.path, {}, [], expanded=expanded)
+
+    def trace_result(self, grid: Grid, graph: GridGraph, end: Optional[int], reached: Optional[array],
+                     visit_log: Optional[array], expanded: int, trace: str) -> PathfindingResult:
+        """
+        Build an array-backed result from a cell-id search in self.workspace.
+
+        Args:
+            end: Goal cell id if it was reached, otherwise None
+            reached: Cells given a parent during the search (kept only for TRACE_FULL)
+            visit_log: Expanded cells in order (kept only for TRACE_FULL)
+        """
+        parent = self.workspace.parent
+        path_cells = None
+        if end is not None:
+            path_cells = array('i')
+            cell = end
+            while parent[cell] != -1:
+                path_cells.append(cell)
+                cell = parent[cell]
+            path_cells.reverse()
+
+        blocks = None if isinstance(grid, GridGraph) else grid
+        if trace == TRACE_FULL:
+            # Copy parents out of the workspace; the next search reuses it
+            parents = array('i', (parent[cell] for cell in reached))
+            search_trace = SearchTrace(graph.cols, path_cells, reached, parents, visit_log, blocks)
+        else:
+            search_trace = SearchTrace(graph.cols, path_cells, blocks=blocks)
+        return PathfindingResult.from_trace(search_trace, None if trace == TRACE_NONE else expanded)
+
+    def best_first_search(self, grid: Grid, start: Node, end: Node, trace: str, stream: bool,
+                          heuristic: Optional[Callable[[GridGraph, int], Callable[[int], int]]]
+                          ) -> Iterator[SearchEvent]:
+        """
+        Unit-cost best-first search over cell ids, shared by A* and Dijkstra.
+
+        Args:
+            heuristic: Builds h(n) for a graph and goal cell; None searches with h = 0
+            stream: Yield OPEN and EXPAND events as well; otherwise only DONE is yielded
+        """
+        self.check_trace(trace)
+        if self.is_unreachable(grid, start, end):
+            yield SearchEvent(DONE, self.unreachable_result(trace))
+            return
+
+        graph = self.as_graph(grid)
+        start_cell, end_cell = self.node_index(graph, start), self.node_index(graph, end)
+        node_of = self.node_view(grid, graph)
+        neighbors_of = graph.neighbors
+        h = None if heuristic is None else heuristic(graph, end_cell)
+
+        open_set = self.create_open_list()
+        open_set.push(0, start_cell)
+
+        workspace = self.workspace
+        generation = workspace.begin(graph.size)
+        g_score, parent, seen, closed = workspace.g_score, workspace.parent, workspace.seen, workspace.closed
+        g_score[start_cell] = 0
+        parent[start_cell] = -1
+        seen[start_cell] = generation
+        full = trace == TRACE_FULL
+        visit_log = array('i') if full else None
+        reached = array('i') if full else None
+        expanded = 0
+
+        while open_set:
+            current = open_set.pop()
+            if closed[current] == generation:
+                continue  # Stale entry superseded by a cheaper one
+            closed[current] = generation
+
+            if current == end_cell:
+                yield SearchEvent(DONE, self.trace_result(grid, graph, current, reached, visit_log, expanded, trace))
+                return
+
+            expanded += 1
+            if visit_log is not None:
+                visit_log.append(current)
+            if stream:
+                yield SearchEvent(EXPAND, node_of(current))
+
+            temp_g_score = g_score[current] + 1
+            for neighbor in neighbors_of(current):
+                if seen[neighbor] != generation:
+                    seen[neighbor] = generation
+                    if reached is not None:
+                        reached.append(neighbor)
+                elif temp_g_score >= g_score[neighbor]:
+                    continue
+                parent[neighbor] = current
+                g_score[neighbor] = temp_g_score
+                open_set.push(temp_g_score if h is None else temp_g_score + h(neighbor), neighbor)
+                if stream:
+                    yield SearchEvent(OPEN, node_of(neighbor))
+
+        yield SearchEvent(DONE, self.trace_result(grid, graph, None, reached, visit_log, expanded, trace))
+
+    def node_view(self, grid: Grid, graph: GridGraph) -> Callable[[int], Node]:
+        """Map cell ids to the caller's node type (Blocks for Block grids)."""
+        if isinstance(grid, GridGraph):
+            return lambda cell: cell
+        cols = graph.cols
+        return lambda cell: grid[cell // cols][cell % cols]
+
+    def as_graph(self, grid: Grid) -> GridGraph:
+        """Return the GridGraph behind a grid, taking a detached snapshot if blocks are not attached."""
+        if isinstance(grid, GridGraph):
+            return grid
+        graph = grid[0][0].graph if grid and grid[0] else None
+        if graph is not None and graph.blocks is grid:
+            return graph
+        return GridGraph.from_blocks(grid, attach=False)
+
+    def is_unreachable(self, grid: Grid, start: Node, end: Node) -> bool:
+        """
+        Check the grid's component index for start and end being disconnected.
+
+        Returns False when no GridGraph backs the grid, so callers fall back
+        to searching.
+        """
+        if isinstance(grid, GridGraph):
+            return not grid.components.connected(start, end)
+        if isinstance(start, Block) and start.graph is not None and start.graph is end.graph:
+            return not start.graph.components.connected(start.index, end.index)
+        return False
+
+    @staticmethod
+    def unreachable_result(trace: str) -> PathfindingResult:
+        """Result for a query the component index answered without searching: no path, nothing expanded."""
+        return PathfindingResult(None, {}, [], expanded=None if trace == TRACE_NONE else 0)
+
+    def node_index(self, graph: GridGraph, node: Node) -> int:
+        """Return the cell id of a Block or cell id."""
+        if isinstance(node, Block):
+            return graph.index(node.row, node.col)
+        return node
+
+    def to_grid_result(self, grid: Grid, result: PathfindingResult) -> PathfindingResult:
+        """Map a cell-id result back to Blocks when the caller searched a Block grid."""
+        if isinstance(grid, GridGraph):
+            return result
+
+        cols = len(grid[0])
+
+        def block(index: int) -> Block:
+            row, col = divmod(index, cols)
+            return grid[row][col]
+
+        path = [block(index) for index in result.path] if result.path is not None else None
+        came_from = {block(child): block(parent) for child, parent in result.came_from.items()}
+        visited = [block(index) for index in result.visited]
+        return PathfindingResult(path, came_from, visited, result.visited_sides, result.expanded)
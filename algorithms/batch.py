@@ -0,0 +1,84 @@
+"""
+Batch path queries on one map.
+
+find_paths_batch answers many (start, end) pairs on the same grid. With
+workers > 1 a compact copy of the grid is sent to each worker process once,
+through the pool initializer, and the pairs are shipped in chunks of cell
+ids so that per-query overhead is a few integers each way.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Optional, Tuple, Type
+from blocks.grid_graph import GridGraph
+from algorithms.a_star import AStarPathfinder
+from algorithms.base_pathfinder import BasePathfinder, PathfindingResult, Grid, Node, TRACE_NONE
+
+# (position in the input, start id, end id)
+Query = Tuple[int, int, int]
+
+# Per-process search state, set by _init_worker
+_worker_graph: Optional[GridGraph] = None
+_worker_pathfinder: Optional[BasePathfinder] = None
+_worker_trace = TRACE_NONE
+
+
+def _init_worker(graph: GridGraph, algorithm: Type[BasePathfinder], open_list: str, trace: str) -> None:
+    global _worker_graph, _worker_pathfinder, _worker_trace
+    _worker_graph = graph
+    _worker_pathfinder = algorithm(open_list=open_list)
+    _worker_trace = trace
+
+
+def _solve_chunk(chunk: List[Query]) -> List[Tuple[int, PathfindingResult]]:
+    return _solve(_worker_pathfinder, _worker_graph, chunk, _worker_trace)
+
+
+def _solve(pathfinder: BasePathfinder, graph: GridGraph, chunk: List[Query],
+           trace: str) -> List[Tuple[int, PathfindingResult]]:
+    return [(position, pathfinder.find_path(graph, start, end, trace)) for position, start, end in chunk]
+
+
+def find_paths_batch(grid: Grid, pairs: Iterable[Tuple[Node, Node]],
+                     algorithm: Type[BasePathfinder] = AStarPathfinder, workers: int = 1,
+                     chunk_size: int = 256, ordered: bool = True, open_list: str = 'heap',
+                     trace: str = TRACE_NONE) -> Iterator[Tuple[int, PathfindingResult]]:
+    """
+    Find paths for many (start, end) pairs on one grid.
+
+    Args:
+        grid: 2D list of blocks, or a GridGraph
+        pairs: (start, end) Blocks, or cell ids when grid is a GridGraph
+        algorithm: Pathfinder class, constructed once per worker
+        workers: Number of worker processes; 1 or less searches in this process
+        chunk_size: Queries sent to a worker per task
+        ordered: Yield results in input order, or as soon as their chunk completes
+        open_list: Open-list backend passed to the pathfinder
+        trace: Trace level of the results; anything above TRACE_NONE costs transfer time
+
+    Yields:
+        (position of the pair in the input, PathfindingResult) tuples. Results
+        use Blocks when grid is a Block grid, cell ids otherwise.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    BasePathfinder.check_trace(trace)
+
+    pathfinder = algorithm(open_list=open_list)
+    graph = pathfinder.as_graph(grid)
+    queries = [(position, pathfinder.node_index(graph, start), pathfinder.node_index(graph, end))
+               for position, (start, end) in enumerate(pairs)]
+    chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+
+    if workers <= 1:
+        for chunk in chunks:
+            for position, result in _solve(pathfinder, graph, chunk, trace):
+                yield position, pathfinder.to_grid_result(grid, result)
+        return
+
+    # GridGraph pickles as dimensions plus occupancy bytes
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(graph, algorithm, open_list, trace)) as executor:
+        futures = [executor.submit(_solve_chunk, chunk) for chunk in chunks]
+        for future in (futures if ordered else as_completed(futures)):
+            for position, result in future.result():
+                yield position, pathfinder.to_grid_result(grid, result)
@@ -0,0 +1,156 @@
+"""
+Bidirectional A* and bidirectional Dijkstra.
+
+Two frontiers are expanded, one from the start and one from the goal,
+always growing the one with the smaller open list. Whenever a node has
+been reached from both sides, the best meeting cost mu is updated; the
+search stops as soon as no unexpanded node can lead to a path shorter
+than mu.
+
+Bidirectional A* uses consistent average potentials: with h_s and h_e the
+heuristics towards start and end, p_f = (h_e - h_s) / 2 orders the forward
+frontier and p_b = -p_f the backward one. Both sides then see the same
+reduced edge costs, so the search stops once the lowest keys of the two
+open lists satisfy min_f + min_b >= mu + p_b(end), for forward keys
+measured from p_f(end) = 0. Stale entries are dropped from both heads
+first, so the comparison uses the true minima. Keys are kept doubled
+(2g +- (h_e - h_s)) so they stay integers for the bucket and radix open
+lists; they are non-negative and never decrease along a frontier.
+
+On open grids bidirectional Dijkstra expands about half as many nodes as
+Dijkstra. Perfect mazes are trees, where the two half-length frontiers
+cover most of the full one, so the saving there is closer to a quarter.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from blocks.grid_graph import GridGraph
+from algorithms.open_list import OpenList
+from algorithms.base_pathfinder import (
+    BasePathfinder, PathfindingResult, Grid, Node, FORWARD, BACKWARD, TRACE_FULL
+)
+
+
+class BidirectionalPathfinder(BasePathfinder):
+    """Shared bidirectional search loop. Subclasses supply the heuristic and stopping rule."""
+
+    def find_path(self, grid: Grid, start: Node, end: Node, trace: str = TRACE_FULL) -> PathfindingResult:
+        self.check_trace(trace)
+        if self.is_unreachable(grid, start, end):
+            return self.unreachable_result(trace)
+
+        graph = self.as_graph(grid)
+        start_index = self.node_index(graph, start)
+        end_index = self.node_index(graph, end)
+        return self.to_grid_result(grid, self.trim_result(self._search(graph, start_index, end_index), trace))
+
+    def potential(self, graph: GridGraph, node: int, start: int, end: int) -> int:
+        """Twice the forward potential p_f of node; the backward potential is its negation."""
+        return 0
+
+    def should_stop(self, min_keys: List[int], best: float) -> bool:
+        """
+        Can the search stop?
+
+        Args:
+            min_keys: Lowest (doubled) key on each open list
+            best: Cost of the best path found so far
+        """
+        # A path through v has doubled key sum 2 * length, since p_b(v) = -p_f(v)
+        return min_keys[FORWARD] + min_keys[BACKWARD] >= 2 * best
+
+    @staticmethod
+    def _min_key(open_set: OpenList, side_closed: Set[int]) -> Optional[int]:
+        """Lowest key on an open list once entries already closed on its side are dropped (None if empty)."""
+        while open_set:
+            key, node = open_set.peek()
+            if node not in side_closed:
+                return key
+            open_set.pop()
+        return None
+
+    def _search(self, graph: GridGraph, start: int, end: int) -> PathfindingResult:
+        if start == end:
+            return PathfindingResult([], {}, [], [])
+
+        signs = (1, -1)
+        open_sets = (self.create_open_list(), self.create_open_list())
+        g_scores: List[Dict[int, int]] = [{start: 0}, {end: 0}]
+        came_froms: List[Dict[int, int]] = [{}, {}]
+        closed: Tuple[Set[int], Set[int]] = (set(), set())
+        open_sets[FORWARD].push(self.potential(graph, start, start, end), start)
+        open_sets[BACKWARD].push(-self.potential(graph, end, start, end), end)
+
+        best = float("inf")
+        meet: Optional[int] = None
+        visited: List[int] = []
+        visited_sides: List[int] = []
+
+        while True:
+            min_keys = [self._min_key(open_sets[side], closed[side]) for side in (FORWARD, BACKWARD)]
+            if None in min_keys or self.should_stop(min_keys, best):
+                break
+
+            # Grow the smaller frontier
+            side = FORWARD if len(open_sets[FORWARD]) <= len(open_sets[BACKWARD]) else BACKWARD
+            open_set, g_score, other_g_score = open_sets[side], g_scores[side], g_scores[1 - side]
+            current = open_set.pop()
+            closed[side].add(current)
+            visited.append(current)
+            visited_sides.append(side)
+
+            if current in other_g_score and g_score[current] + other_g_score[current] < best:
+                best = g_score[current] + other_g_score[current]
+                meet = current
+
+            sign = signs[side]
+            came_from = came_froms[side]
+            temp_g_score = g_score[current] + 1
+            for neighbor in graph.neighbors(current):
+                if temp_g_score < g_score.get(neighbor, float("inf")):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = temp_g_score
+                    open_set.push(2 * temp_g_score + sign * self.potential(graph, neighbor, start, end), neighbor)
+
+                    if neighbor in other_g_score and temp_g_score + other_g_score[neighbor] < best:
+                        best = temp_g_score + other_g_score[neighbor]
+                        meet = neighbor
+
+        if meet is None:
+            return PathfindingResult(None, came_froms[FORWARD], visited, visited_sides)
+
+        path, came_from = self.reconstruct_bidirectional_path(came_froms[FORWARD], came_froms[BACKWARD], meet, end)
+        return PathfindingResult(path, came_from, visited, visited_sides)
+
+    def reconstruct_bidirectional_path(self, came_from_forward: Dict[Node, Node],
+                                       came_from_backward: Dict[Node, Node],
+                                       meet: Node, end: Node):
+        """
+        Splice the two search trees at the meeting node.
+
+        Returns the path (excluding start, including end) and a single
+        came_from map in which the backward half is re-pointed towards the start.
+        """
+        path = self.reconstruct_path(came_from_forward, meet)
+        came_from = dict(came_from_forward)
+
+        current = meet
+        while current != end:
+            successor = came_from_backward[current]
+            came_from[successor] = current
+            path.append(successor)
+            current = successor
+
+        return path, came_from
+
+
+class BidirectionalAStarPathfinder(BidirectionalPathfinder):
+    """Bidirectional A* with average Manhattan potentials, so both frontiers share reduced costs."""
+
+    def potential(self, graph: GridGraph, node: int, start: int, end: int) -> int:
+        position = graph.position(node)
+        return (self.manhattan_distance(position, graph.position(end))
+                - self.manhattan_distance(position, graph.position(start)))
+
+
+class BidirectionalDijkstraPathfinder(BidirectionalPathfinder):
+    """Bidirectional uniform cost search."""
@@ -0,0 +1,199 @@
+"""
+D* Lite incremental pathfinding.
+
+Searches backwards from the goal and keeps its g/rhs tables between calls.
+After cells change walkability (reported through notify_changed), only the
+vertices whose costs are affected are repaired, so replanning work scales
+with the size of the change rather than the size of the grid.
+
+Based on the optimized D* Lite of Koenig & Likhachev (2002).
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+from blocks.grid_graph import GridGraph
+from algorithms.base_pathfinder import BasePathfinder, PathfindingResult, Grid, Node, TRACE_FULL
+
+INF = float("inf")
+Key = Tuple[float, float]
+
+
+class DStarLitePathfinder(BasePathfinder):
+    """D* Lite - incremental replanning between searches on the same grid and goal."""
+
+    def __init__(self, open_list: str = 'heap'):
+        if open_list != 'heap':
+            raise ValueError("D* Lite needs lexicographic keys and only supports the 'heap' open list")
+        super().__init__(open_list)
+        self._graph: Optional[GridGraph] = None
+        self._goal = -1
+        self._last_start = -1
+        self._km = 0
+        self._g: Dict[int, float] = {}
+        self._rhs: Dict[int, float] = {}
+        self._queue: List[Tuple[Key, int]] = []
+        self._queue_keys: Dict[int, Key] = {}
+        self._changed: List[Node] = []
+        self._expanded: List[int] = []
+
+    def notify_changed(self, cells: Iterable[Node]) -> None:
+        self._changed.extend(cells)
+
+    def reset(self) -> None:
+        """Drop all search state; the next call plans from scratch."""
+        self._graph = None
+        self._changed.clear()
+
+    def find_path(self, grid: Grid, start: Node, end: Node, trace: str = TRACE_FULL) -> PathfindingResult:
+        self.check_trace(trace)
+
+        graph = self.as_graph(grid)
+        start_index = self.node_index(graph, start)
+        end_index = self.node_index(graph, end)
+
+        if graph is not self._graph or end_index != self._goal:
+            self._initialize(graph, start_index, end_index)
+        else:
+            self._km += self._heuristic(self._last_start, start_index)
+            self._last_start = start_index
+            for cell in self._changed:
+                self._update_cell(self.node_index(graph, cell))
+        self._changed.clear()
+
+        self._expanded = []
+        self._compute_shortest_path(start_index)
+        return self.to_grid_result(grid, self.trim_result(self._extract_result(start_index), trace))
+
+    def _initialize(self, graph: GridGraph, start: int, goal: int) -> None:
+        self._graph = graph
+        self._goal = goal
+        self._last_start = start
+        self._km = 0
+        self._g = {}
+        self._rhs = {goal: 0}
+        self._queue = []
+        self._queue_keys = {}
+        self._push(goal, (self._heuristic(start, goal), 0))
+
+    def _heuristic(self, a: int, b: int) -> int:
+        return self.manhattan_distance(self._graph.position(a), self._graph.position(b))
+
+    def _cells_around(self, index: int) -> List[int]:
+        """All in-bounds 4-neighbors, walkable or not."""
+        graph = self._graph
+        row, col = divmod(index, graph.cols)
+        cells = []
+        if row < graph.rows - 1:
+            cells.append(index + graph.cols)
+        if row > 0:
+            cells.append(index - graph.cols)
+        if col < graph.cols - 1:
+            cells.append(index + 1)
+        if col > 0:
+            cells.append(index - 1)
+        return cells
+
+    def _cost(self, a: int, b: int) -> float:
+        walkable = self._graph.walkable
+        return 1 if walkable[a] and walkable[b] else INF
+
+    def _calculate_key(self, index: int, start: int) -> Key:
+        best = min(self._g.get(index, INF), self._rhs.get(index, INF))
+        return best + self._heuristic(start, index) + self._km, best
+
+    def _push(self, index: int, key: Key) -> None:
+        self._queue_keys[index] = key
+        heapq.heappush(self._queue, (key, index))
+
+    def _top(self) -> Tuple[Key, int]:
+        """Return the lowest valid queue entry, dropping stale ones."""
+        queue = self._queue
+        while queue:
+            key, index = queue[0]
+            if self._queue_keys.get(index) == key:
+                return key, index
+            heapq.heappop(queue)
+        return (INF, INF), -1
+
+    def _update_vertex(self, index: int) -> None:
+        """Recompute rhs from the successors, then fix queue membership."""
+        if index != self._goal:
+            g = self._g
+            self._rhs[index] = min(
+                (self._cost(index, successor) + g.get(successor, INF) for successor in self._cells_around(index)),
+                default=INF
+            )
+        self._update_membership(index)
+
+    def _update_membership(self, index: int) -> None:
+        """Queue the vertex iff it is locally inconsistent (g != rhs)."""
+        if self._g.get(index, INF) != self._rhs.get(index, INF):
+            key = self._calculate_key(index, self._last_start)
+            if self._queue_keys.get(index) != key:
+                self._push(index, key)
+        else:
+            self._queue_keys.pop(index, None)
+
+    def _update_cell(self, index: int) -> None:
+        """A cell changed walkability, so every edge touching it changed cost."""
+        self._update_vertex(index)
+        for neighbor in self._cells_around(index):
+            self._update_vertex(neighbor)
+
+    def _compute_shortest_path(self, start: int) -> None:
+        g, rhs = self._g, self._rhs
+        while True:
+            top_key, index = self._top()
+            if index == -1:
+                return
+            if top_key >= self._calculate_key(start, start) and rhs.get(start, INF) == g.get(start, INF):
+                return
+
+            new_key = self._calculate_key(index, start)
+            if top_key < new_key:
+                self._push(index, new_key)
+                continue
+
+            heapq.heappop(self._queue)
+            del self._queue_keys[index]
+            self._expanded.append(index)
+
+            g_old = g.get(index, INF)
+            if g_old > rhs.get(index, INF):
+                # Overconsistent: lower g and relax predecessors through it
+                g[index] = rhs[index]
+                for predecessor in self._cells_around(index):
+                    if predecessor != self._goal:
+                        through = self._cost(predecessor, index) + g[index]
+                        if through < rhs.get(predecessor, INF):
+                            rhs[predecessor] = through
+                    self._update_membership(predecessor)
+            else:
+                # Underconsistent: raise g and recompute vertices that depended on it
+                g[index] = INF
+                for vertex in self._cells_around(index) + [index]:
+                    if vertex != self._goal and (vertex == index or
+                                                 rhs.get(vertex, INF) == self._cost(vertex, index) + g_old):
+                        self._update_vertex(vertex)
+                    else:
+                        self._update_membership(vertex)
+
+    def _extract_result(self, start: int) -> PathfindingResult:
+        """Follow the cheapest successors from start to goal."""
+        g = self._g
+        if g.get(start, INF) == INF:
+            return PathfindingResult(None, {}, self._expanded)
+
+        path = []
+        came_from: Dict[int, int] = {}
+        current = start
+        while current != self._goal:
+            successor = min(self._cells_around(current),
+                            key=lambda cell: self._cost(current, cell) + g.get(cell, INF))
+            if self._cost(current, successor) + g.get(successor, INF) == INF or len(path) > self._graph.size:
+                return PathfindingResult(None, came_from, self._expanded)
+            came_from[successor] = current
+            path.append(successor)
+            current = successor
+
+        return PathfindingResult(path, came_from, self._expanded)
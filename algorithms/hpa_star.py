@@ -0,0 +1,334 @@
+"""
+Hierarchical pathfinding (HPA*) with a cached cluster abstraction.
+
+The grid is split into square clusters. Each maximal run of open cells
+along a cluster border becomes an entrance (one transition in the middle,
+or one at each end for long runs), and distances between the entrances of
+a cluster are precomputed with a cluster-local BFS. Queries search this
+small abstract graph and then refine each abstract edge locally: the
+first and last edges reuse the BFS trees that connected start and end,
+and paths between entrances are cached per cluster once refined.
+
+The abstraction is kept between queries. Walkability changes mark only
+the affected cluster (and the borders it shares) dirty, and dirty parts
+and their cached paths are rebuilt on the next query. Paths are near-optimal, not guaranteed
+shortest.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+from blocks.grid_graph import GridGraph
+from algorithms.base_pathfinder import BasePathfinder, PathfindingResult, Grid, Node, TRACE_FULL
+
+# Entrance runs at least this long get a transition at each end instead of one in the middle
+_LONG_ENTRANCE = 6
+
+BorderKey = Tuple[int, int]
+
+
+class HPAStarPathfinder(BasePathfinder):
+    """
+    Hierarchical A* over a cluster abstraction of the grid.
+
+    Args:
+        cluster_size: Side length of the square clusters
+        open_list: Key of the open-list backend in OPEN_LISTS
+    """
+
+    def __init__(self, cluster_size: int = 10, open_list: str = 'heap'):
+        super().__init__(open_list)
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2")
+        self.cluster_size = cluster_size
+        self._graph: Optional[GridGraph] = None
+
+        self._cluster_rows = 0
+        self._cluster_cols = 0
+        # Transitions (cell in lower cluster id, cell in higher cluster id) per border
+        self._transitions: Dict[BorderKey, List[Tuple[int, int]]] = {}
+        # Abstract edges: unit-cost crossings between clusters, and entrance distances within one
+        self._inter: Dict[int, List[int]] = {}
+        self._intra: Dict[int, Dict[int, int]] = {}
+        self._cluster_nodes: Dict[int, Set[int]] = {}
+        # Refined paths (excluding the source) between entrances, per cluster, filled as queries use them
+        self._paths: Dict[int, Dict[Tuple[int, int], List[int]]] = {}
+        self._dirty_clusters: Set[int] = set()
+        self._dirty_borders: Set[BorderKey] = set()
+
+    def find_path(self, grid: Grid, start: Node, end: Node, trace: str = TRACE_FULL) -> PathfindingResult:
+        self.check_trace(trace)
+
+        graph = self.as_graph(grid)
+        if graph is not self._graph:
+            self._build(graph)
+        self._refresh()
+
+        start_index = self.node_index(graph, start)
+        end_index = self.node_index(graph, end)
+        return self.to_grid_result(grid, self.trim_result(self._search(start_index, end_index), trace))
+
+    # Abstraction maintenance
+
+    def _build(self, graph: GridGraph) -> None:
+        """Mark every cluster and border of a new graph dirty and move the change listener to it."""
+        if self._graph is not None:
+            self._graph.remove_listener(self._on_walkable_changed)
+        size = self.cluster_size
+        self._graph = graph
+        self._cluster_rows = -(-graph.rows // size)
+        self._cluster_cols = -(-graph.cols // size)
+        self._transitions = {}
+        self._inter = {}
+        self._intra = {}
+        self._cluster_nodes = {cluster: set() for cluster in range(self._cluster_rows * self._cluster_cols)}
+        self._paths = {}
+        self._dirty_clusters = set(self._cluster_nodes)
+        self._dirty_borders = set()
+
+        for cluster in self._cluster_nodes:
+            cluster_row, cluster_col = divmod(cluster, self._cluster_cols)
+            if cluster_row + 1 < self._cluster_rows:
+                self._dirty_borders.add((cluster, cluster + self._cluster_cols))
+            if cluster_col + 1 < self._cluster_cols:
+                self._dirty_borders.add((cluster, cluster + 1))
+
+        graph.add_listener(self._on_walkable_changed)
+
+    def _on_walkable_changed(self, index: int, walkable: bool) -> None:
+        self._invalidate(index)
+
+    def _cluster_of(self, index: int) -> int:
+        row, col = divmod(index, self._graph.cols)
+        return (row // self.cluster_size) * self._cluster_cols + col // self.cluster_size
+
+    def _invalidate(self, index: int) -> None:
+        """Mark the cell's cluster dirty, plus any border the cell lies on."""
+        size = self.cluster_size
+        row, col = divmod(index, self._graph.cols)
+        cluster = self._cluster_of(index)
+        cluster_row, cluster_col = divmod(cluster, self._cluster_cols)
+        self._dirty_clusters.add(cluster)
+
+        if row % size == 0 and cluster_row > 0:
+            self._dirty_borders.add((cluster - self._cluster_cols, cluster))
+        if row % size == size - 1 and cluster_row + 1 < self._cluster_rows:
+            self._dirty_borders.add((cluster, cluster + self._cluster_cols))
+        if col % size == 0 and cluster_col > 0:
+            self._dirty_borders.add((cluster - 1, cluster))
+        if col % size == size - 1 and cluster_col + 1 < self._cluster_cols:
+            self._dirty_borders.add((cluster, cluster + 1))
+
+    def _refresh(self) -> None:
+        """Rebuild dirty borders, then the intra-cluster edges of dirty clusters."""
+        for border in self._dirty_borders:
+            transitions = self._find_transitions(*border)
+            if transitions == self._transitions.get(border, []):
+                continue
+
+            for a, b in self._transitions.get(border, []):
+                self._inter[a].remove(b)
+                self._inter[b].remove(a)
+            for a, b in transitions:
+                self._inter.setdefault(a, []).append(b)
+                self._inter.setdefault(b, []).append(a)
+            self._transitions[border] = transitions
+            self._dirty_clusters.update(border)
+        self._dirty_borders = set()
+
+        for cluster in self._dirty_clusters:
+            self._rebuild_cluster(cluster)
+        self._dirty_clusters = set()
+
+    def _find_transitions(self, cluster_a: int, cluster_b: int) -> List[Tuple[int, int]]:
+        """Entrance transitions across the border between two adjacent clusters (a < b)."""
+        graph = self._graph
+        size = self.cluster_size
+        walkable = graph.walkable
+        cluster_row, cluster_col = divmod(cluster_a, self._cluster_cols)
+
+        if cluster_b == cluster_a + self._cluster_cols:
+            # Horizontal border line: a above, b below
+            row = (cluster_row + 1) * size - 1
+            pairs = [(graph.index(row, col), graph.index(row + 1, col))
+                     for col in range(cluster_col * size, min((cluster_col + 1) * size, graph.cols))]
+        else:
+            # Vertical border line: a on the left, b on the right
+            col = (cluster_col + 1) * size - 1
+            pairs = [(graph.index(row, col), graph.index(row, col + 1))
+                     for row in range(cluster_row * size, min((cluster_row + 1) * size, graph.rows))]
+
+        transitions = []
+        run: List[Tuple[int, int]] = []
+        for pair in pairs + [None]:
+            if pair is not None and walkable[pair[0]] and walkable[pair[1]]:
+                run.append(pair)
+                continue
+            if len(run) >= _LONG_ENTRANCE:
+                transitions.extend([run[0], run[-1]])
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        return transitions
+
+    def _rebuild_cluster(self, cluster: int) -> None:
+        """Recompute a cluster's entrance nodes and the distances between them."""
+        for node in self._cluster_nodes[cluster]:
+            self._intra.pop(node, None)
+        self._paths.pop(cluster, None)
+
+        nodes = set()
+        for neighbor in (cluster - self._cluster_cols, cluster + self._cluster_cols, cluster - 1, cluster + 1):
+            border = (min(cluster, neighbor), max(cluster, neighbor))
+            for pair in self._transitions.get(border, []):
+                nodes.add(pair[0] if self._cluster_of(pair[0]) == cluster else pair[1])
+        self._cluster_nodes[cluster] = nodes
+
+        for node in nodes:
+            distances = self._local_bfs(node, cluster)[0]
+            self._intra[node] = {other: distances[other] for other in nodes if other != node and other in distances}
+
+    def _cluster_bounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        size = self.cluster_size
+        cluster_row, cluster_col = divmod(cluster, self._cluster_cols)
+        return (cluster_row * size, min((cluster_row + 1) * size, self._graph.rows),
+                cluster_col * size, min((cluster_col + 1) * size, self._graph.cols))
+
+    def _local_bfs(self, source: int, cluster: int,
+                   target: Optional[int] = None) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """BFS restricted to one cluster. Returns (distances, came_from)."""
+        walkable = self._graph.walkable
+        cols = self._graph.cols
+        row_lo, row_hi, col_lo, col_hi = self._cluster_bounds(cluster)
+        distances = {source: 0}
+        came_from: Dict[int, int] = {}
+        queue = deque([source])
+
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                break
+            row, col = divmod(current, cols)
+            step = distances[current] + 1
+            for neighbor, inside in ((current - cols, row > row_lo), (current + cols, row < row_hi - 1),
+                                     (current - 1, col > col_lo), (current + 1, col < col_hi - 1)):
+                if inside and walkable[neighbor] and neighbor not in distances:
+                    distances[neighbor] = step
+                    came_from[neighbor] = current
+                    queue.append(neighbor)
+
+        return distances, came_from
+
+    # Queries
+
+    def _search(self, start: int, end: int) -> PathfindingResult:
+        if start == end:
+            return PathfindingResult([], {}, [])
+
+        start_cluster, end_cluster = self._cluster_of(start), self._cluster_of(end)
+        local_path = None
+        if start_cluster == end_cluster:
+            local_path = self._refine(start, end, start_cluster)
+
+        # Temporarily connect start and end to the entrances of their clusters
+        start_edges, start_tree = self._entry_edges(start, start_cluster)
+        end_edges, end_tree = self._entry_edges(end, end_cluster)
+        abstract_path, visited = self._abstract_search(start, end, start_edges, end_edges)
+
+        path = None
+        if abstract_path is not None:
+            path = self._refine_abstract_path(start, end, abstract_path, start_tree, end_tree)
+        if local_path is not None and (path is None or len(local_path) <= len(path)):
+            path = local_path
+        if path is None:
+            return PathfindingResult(None, {}, visited)
+
+        came_from = dict(zip(path, [start] + path[:-1]))
+        return PathfindingResult(path, came_from, visited)
+
+    def _entry_edges(self, cell: int, cluster: int) -> Tuple[Dict[int, int], Optional[Dict[int, int]]]:
+        """Distances from a cell to its cluster's entrances, and the BFS tree behind them (None for entrances)."""
+        if cell in self._intra:
+            return self._intra[cell], None
+        distances, came_from = self._local_bfs(cell, cluster)
+        return {node: distances[node] for node in self._cluster_nodes[cluster] if node in distances}, came_from
+
+    def _abstract_search(self, start: int, end: int, start_edges: Dict[int, int],
+                         end_edges: Dict[int, int]) -> Tuple[Optional[List[int]], List[int]]:
+        """A* over entrance nodes. Returns the abstract path (excluding start) and expanded nodes."""
+        cols = self._graph.cols
+        end_row, end_col = divmod(end, cols)
+        intra, inter = self._intra, self._inter
+
+        open_set = self.create_open_list()
+        open_set.push(0, start)
+        came_from: Dict[int, int] = {}
+        g_score = {start: 0}
+        closed = set()
+        visited = []
+
+        while open_set:
+            current = open_set.pop()
+            if current in closed:
+                continue
+            closed.add(current)
+
+            if current == end:
+                return self.reconstruct_path(came_from, end), visited
+            visited.append(current)
+
+            edges = list((start_edges if current == start else intra.get(current, {})).items())
+            edges.extend((partner, 1) for partner in inter.get(current, ()))
+            if current in end_edges:
+                edges.append((end, end_edges[current]))
+
+            current_g_score = g_score[current]
+            for neighbor, cost in edges:
+                temp_g_score = current_g_score + cost
+                if temp_g_score < g_score.get(neighbor, temp_g_score + 1):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = temp_g_score
+                    row, col = divmod(neighbor, cols)
+                    open_set.push(temp_g_score + abs(row - end_row) + abs(col - end_col), neighbor)
+
+        return None, visited
+
+    def _refine_abstract_path(self, start: int, end: int, abstract_path: List[int],
+                              start_tree: Optional[Dict[int, int]], end_tree: Optional[Dict[int, int]]) -> List[int]:
+        """Expand abstract edges into grid cells, reusing the entry BFS trees of start and end."""
+        path = []
+        previous = start
+        for node in abstract_path:
+            if node in self._inter.get(previous, ()):
+                path.append(node)
+            elif previous == start and start_tree is not None:
+                path.extend(self.reconstruct_path(start_tree, node))
+            elif node == end and end_tree is not None:
+                # The tree is rooted at end, so walk it from previous and reverse
+                path.extend(self.reconstruct_path(end_tree, previous)[-2::-1] + [end])
+            elif previous in self._intra and node in self._intra:
+                path.extend(self._entrance_path(previous, node))
+            else:
+                path.extend(self._refine(previous, node, self._cluster_of(previous)))
+            previous = node
+        return path
+
+    def _entrance_path(self, source: int, target: int) -> List[int]:
+        """Path between two entrances of one cluster (excluding source), cached until the cluster is rebuilt."""
+        cluster = self._cluster_of(source)
+        paths = self._paths.setdefault(cluster, {})
+        path = paths.get((source, target))
+        if path is None:
+            reverse = paths.get((target, source))
+            if reverse is not None:
+                path = reverse[-2::-1] + [target]
+            else:
+                path = self._refine(source, target, cluster)
+            paths[source, target] = path
+        return path
+
+    def _refine(self, source: int, target: int, cluster: int) -> Optional[List[int]]:
+        """Shortest path inside one cluster (excluding source), or None."""
+        distances, came_from = self._local_bfs(source, cluster, target)
+        if target not in distances:
+            return None
+        return self.reconstruct_path(came_from, target)
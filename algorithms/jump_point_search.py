@@ -0,0 +1,148 @@
+"""
+Jump Point Search for 4-connected uniform-cost grids.
+
+Runs A* over jump points only. Canonical paths move vertically and turn
+horizontally at any cell, and horizontal runs turn vertically only at
+forced neighbors: a vertical neighbor that is open while the cell behind
+it is blocked. Straight runs are scanned without touching the open list,
+so open grids need far fewer heap operations than plain A*.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from blocks.grid_graph import GridGraph
+from algorithms.base_pathfinder import BasePathfinder, PathfindingResult, Grid, Node, TRACE_FULL
+
+
+class JumpPointSearchPathfinder(BasePathfinder):
+    """A* over jump points, returning the same optimal path lengths as A*."""
+
+    def find_path(self, grid: Grid, start: Node, end: Node, trace: str = TRACE_FULL) -> PathfindingResult:
+        self.check_trace(trace)
+        if self.is_unreachable(grid, start, end):
+            return self.unreachable_result(trace)
+
+        graph = self.as_graph(grid)
+        start_index = self.node_index(graph, start)
+        end_index = self.node_index(graph, end)
+        return self.to_grid_result(grid, self.trim_result(self._search(graph, start_index, end_index), trace))
+
+    def _search(self, graph: GridGraph, start: int, end: int) -> PathfindingResult:
+        cols = graph.cols
+        end_row, end_col = divmod(end, cols)
+
+        open_set = self.create_open_list()
+        open_set.push(0, start)
+
+        came_from: Dict[int, int] = {}
+        g_score = {start: 0}
+        closed = set()
+        visited = []
+
+        while open_set:
+            current = open_set.pop()
+            if current in closed:
+                continue
+            closed.add(current)
+
+            if current == end:
+                path = self._expand_path(graph, self.reconstruct_path(came_from, end), start)
+                return PathfindingResult(path, came_from, visited)
+
+            visited.append(current)
+            row, col = divmod(current, cols)
+
+            for d_row, d_col in self._successor_directions(graph, current, came_from.get(current)):
+                jump_point = self._jump(graph, row, col, d_row, d_col, end)
+                if jump_point is None:
+                    continue
+
+                jump_row, jump_col = divmod(jump_point, cols)
+                temp_g_score = g_score[current] + abs(jump_row - row) + abs(jump_col - col)
+
+                if temp_g_score < g_score.get(jump_point, float("inf")):
+                    came_from[jump_point] = current
+                    g_score[jump_point] = temp_g_score
+                    f_score = temp_g_score + self.manhattan_distance((jump_row, jump_col), (end_row, end_col))
+                    open_set.push(f_score, jump_point)
+
+        return PathfindingResult(None, came_from, visited)
+
+    def _successor_directions(self, graph: GridGraph, current: int,
+                              parent: Optional[int]) -> List[Tuple[int, int]]:
+        """Return pruned search directions for a jump point given where it was reached from."""
+        if parent is None:
+            return [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+        row, col = divmod(current, graph.cols)
+        parent_row, parent_col = divmod(parent, graph.cols)
+
+        if col == parent_col:
+            # Vertical arrival: keep going, and branch both ways horizontally
+            d_row = 1 if row > parent_row else -1
+            return [(d_row, 0), (0, 1), (0, -1)]
+
+        # Horizontal arrival: keep going, and turn only towards forced neighbors
+        d_col = 1 if col > parent_col else -1
+        directions = [(0, d_col)]
+        for d_row in (1, -1):
+            if self._is_forced(graph, row + d_row, col, d_col):
+                directions.append((d_row, 0))
+        return directions
+
+    def _is_forced(self, graph: GridGraph, row: int, col: int, d_col: int) -> bool:
+        """Is (row, col) open while the cell behind it, against d_col, is blocked?"""
+        if not 0 <= row < graph.rows:
+            return False
+        walkable = graph.walkable
+        index = row * graph.cols + col
+        if not walkable[index]:
+            return False
+        behind = col - d_col
+        return not (0 <= behind < graph.cols and walkable[index - d_col])
+
+    def _jump(self, graph: GridGraph, row: int, col: int, d_row: int, d_col: int, end: int) -> Optional[int]:
+        """Scan from (row, col) in a straight line and return the next jump point, if any."""
+        if d_row == 0:
+            return self._jump_horizontal(graph, row, col, d_col, end)
+
+        rows, cols = graph.rows, graph.cols
+        walkable = graph.walkable
+        while True:
+            row += d_row
+            if not 0 <= row < rows:
+                return None
+            index = row * cols + col
+            if not walkable[index]:
+                return None
+            if index == end:
+                return index
+            if (self._jump_horizontal(graph, row, col, 1, end) is not None
+                    or self._jump_horizontal(graph, row, col, -1, end) is not None):
+                return index
+
+    def _jump_horizontal(self, graph: GridGraph, row: int, col: int, d_col: int, end: int) -> Optional[int]:
+        cols = graph.cols
+        walkable = graph.walkable
+        while True:
+            col += d_col
+            if not 0 <= col < cols:
+                return None
+            index = row * cols + col
+            if not walkable[index]:
+                return None
+            if index == end:
+                return index
+            if self._is_forced(graph, row + 1, col, d_col) or self._is_forced(graph, row - 1, col, d_col):
+                return index
+
+    def _expand_path(self, graph: GridGraph, jump_points: List[int], start: int) -> List[int]:
+        """Fill in the straight segments between consecutive jump points."""
+        path = []
+        previous = start
+        for jump_point in jump_points:
+            step = graph.cols if jump_point % graph.cols == previous % graph.cols else 1
+            if jump_point < previous:
+                step = -step
+            path.extend(range(previous + step, jump_point + step, step))
+            previous = jump_point
+        return path
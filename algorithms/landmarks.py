@@ -0,0 +1,159 @@
+"""
+Landmark (ALT) lower bounds for A*.
+
+A few landmark cells are chosen by farthest-point selection and the exact
+distance from each landmark to every cell is stored in an integer array.
+By the triangle inequality, d(n, t) >= |d(L, t) - d(L, n)| for every
+landmark L, which is far tighter than Manhattan distance in mazes.
+
+Moves cost 1, so each landmark's "Dijkstra" is a breadth-first search.
+Landmarks are placed in the largest connected region; queries elsewhere get
+a bound of 0 and A* falls back to Manhattan distance.
+
+Tables can be saved next to a map and loaded later; loading checks a
+fingerprint of the occupancy so a table is never used with the wrong map.
+"""
+
+import hashlib
+import struct
+from array import array
+from collections import Counter, deque
+from typing import List, Optional
+from blocks.grid_graph import GridGraph
+
+_MAGIC = b'ALT1'
+# magic, rows, cols, landmark count, occupancy fingerprint
+_HEADER = struct.Struct('<4sIII32s')
+_UNREACHABLE = -1
+
+
+def fingerprint(graph: GridGraph) -> bytes:
+    """SHA-256 of the grid dimensions and occupancy."""
+    digest = hashlib.sha256(struct.pack('<II', graph.rows, graph.cols))
+    digest.update(graph.walkable)
+    return digest.digest()
+
+
+class LandmarkTable:
+    """
+    Landmark distance tables for one grid.
+
+    ``distances[k][cell]`` is the number of steps from landmark k to cell,
+    or -1 when the cell is not reachable from it.
+    """
+
+    def __init__(self, graph: GridGraph, landmarks: List[int], distances: List[array]):
+        self.graph = graph
+        self.landmarks = landmarks
+        self.distances = distances
+        self.version = graph.version
+        self._walkable = bytes(graph.walkable)
+
+    @classmethod
+    def build(cls, graph: GridGraph, count: int = 8) -> 'LandmarkTable':
+        """Choose up to count landmarks by farthest-point selection and compute their tables."""
+        if count < 1:
+            raise ValueError("count must be at least 1")
+
+        walkable = graph.walkable
+        components = graph.components
+        sizes = Counter(components.find(cell) for cell in range(graph.size) if walkable[cell])
+        if not sizes:
+            return cls(graph, [], [])
+
+        # Farthest cell from an arbitrary one, then repeatedly the cell farthest from all chosen
+        seed_distances = _bfs(graph, max(sizes, key=sizes.__getitem__))
+        landmark = max(range(graph.size), key=seed_distances.__getitem__)
+        nearest = array('i', [_UNREACHABLE]) * graph.size
+        landmarks, distances = [], []
+
+        while len(landmarks) < count:
+            table = _bfs(graph, landmark)
+            landmarks.append(landmark)
+            distances.append(table)
+
+            for cell in range(graph.size):
+                distance = table[cell]
+                if distance != _UNREACHABLE and (nearest[cell] == _UNREACHABLE or distance < nearest[cell]):
+                    nearest[cell] = distance
+
+            landmark = _farthest(nearest)
+            if landmark is None:
+                break
+
+        return cls(graph, landmarks, distances)
+
+    def matches(self, graph: GridGraph) -> bool:
+        """Were these tables computed for graph's current occupancy?"""
+        if graph is self.graph and graph.version == self.version:
+            return True
+        return (graph.rows, graph.cols) == (self.graph.rows, self.graph.cols) and graph.walkable == self._walkable
+
+    def lower_bound(self, cell: int, target: int) -> int:
+        """Triangle-inequality lower bound on the distance from cell to target."""
+        best = 0
+        for table in self.distances:
+            to_target, to_cell = table[target], table[cell]
+            if to_target != _UNREACHABLE and to_cell != _UNREACHABLE:
+                best = max(best, abs(to_target - to_cell))
+        return best
+
+    def target_tables(self, target: int):
+        """(table, distance to target) pairs of the landmarks that reach target, for repeated lower bounds."""
+        return [(table, table[target]) for table in self.distances if table[target] != _UNREACHABLE]
+
+    def save(self, path: str) -> None:
+        """Write the tables to path, tagged with the grid's fingerprint."""
+        graph = self.graph
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, graph.rows, graph.cols, len(self.landmarks), fingerprint(graph)))
+            array('i', self.landmarks).tofile(file)
+            for table in self.distances:
+                table.tofile(file)
+
+    @classmethod
+    def load(cls, path: str, graph: GridGraph) -> 'LandmarkTable':
+        """Read tables saved for graph. Raises ValueError if they belong to a different map."""
+        with open(path, 'rb') as file:
+            magic, rows, cols, count, digest = _HEADER.unpack(file.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a landmark table")
+            if (rows, cols) != (graph.rows, graph.cols) or digest != fingerprint(graph):
+                raise ValueError(f"{path} was saved for a different map")
+
+            landmarks = array('i')
+            landmarks.fromfile(file, count)
+            distances = []
+            for _ in range(count):
+                table = array('i')
+                table.fromfile(file, graph.size)
+                distances.append(table)
+
+        return cls(graph, list(landmarks), distances)
+
+
+def _bfs(graph: GridGraph, source: int) -> array:
+    """Distances from source to every cell, -1 where unreachable."""
+    cols = graph.cols
+    walkable = graph.walkable
+    distances = array('i', [_UNREACHABLE]) * graph.size
+    distances[source] = 0
+    queue = deque([source])
+
+    while queue:
+        current = queue.popleft()
+        step = distances[current] + 1
+        col = current % cols
+        for neighbor, inside in ((current + cols, current + cols < graph.size), (current - cols, current >= cols),
+                                 (current + 1, col < cols - 1), (current - 1, col > 0)):
+            if inside and walkable[neighbor] and distances[neighbor] == _UNREACHABLE:
+                distances[neighbor] = step
+                queue.append(neighbor)
+
+    return distances
+
+
+def _farthest(nearest: array) -> Optional[int]:
+    """Cell farthest from its nearest chosen landmark, or None once every cell is a landmark."""
+    best_distance = max(nearest)
+    return nearest.index(best_distance) if best_distance > 0 else None
@@ -0,0 +1,178 @@
+"""
+Open-list (priority queue) implementations for pathfinding algorithms.
+
+None of these take locks, unlike queue.PriorityQueue. Pathfinders select a
+backend by key from OPEN_LISTS:
+- 'heap':   binary heap (heapq), works for any priorities
+- 'bucket': bucket queue (Dial's algorithm) for small non-negative integer costs
+- 'radix':  radix heap for monotone non-negative integer priorities
+
+Every backend pops items with the lowest priority first. Heap and bucket
+queues break ties in insertion order.
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple, Type
+
+
+class OpenList(ABC):
+    """Abstract priority queue used as a search frontier."""
+
+    @abstractmethod
+    def push(self, priority: int, item: Any) -> None:
+        """Insert item with the given priority."""
+        pass
+
+    @abstractmethod
+    def pop(self) -> Any:
+        """Remove and return an item with the lowest priority."""
+        pass
+
+    @abstractmethod
+    def peek(self) -> Tuple[int, Any]:
+        """Return the (priority, item) pair pop would remove next, without removing it."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+
+class HeapOpenList(OpenList):
+    """Binary heap backed by heapq."""
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, Any]] = []
+        self._count = 0
+
+    def push(self, priority: int, item: Any) -> None:
+        self._count += 1
+        heapq.heappush(self._heap, (priority, self._count, item))
+
+    def pop(self) -> Any:
+        return heapq.heappop(self._heap)[2]
+
+    def peek(self) -> Tuple[int, Any]:
+        priority, _, item = self._heap[0]
+        return priority, item
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketOpenList(OpenList):
+    """
+    Bucket queue (Dial's algorithm).
+
+    One FIFO bucket per integer priority and a cursor at the lowest
+    non-empty bucket. Push and pop are O(1) amortized when priorities are
+    bounded, as they are on unit-cost grids.
+    """
+
+    def __init__(self):
+        self._buckets: List[Deque[Any]] = []
+        self._cursor = 0
+        self._size = 0
+
+    def push(self, priority: int, item: Any) -> None:
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend(deque() for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(item)
+        if priority < self._cursor:
+            self._cursor = priority
+        self._size += 1
+
+    def pop(self) -> Any:
+        self._advance()
+        self._size -= 1
+        return self._buckets[self._cursor].popleft()
+
+    def peek(self) -> Tuple[int, Any]:
+        self._advance()
+        return self._cursor, self._buckets[self._cursor][0]
+
+    def _advance(self) -> None:
+        """Move the cursor to the lowest non-empty bucket."""
+        if not self._size:
+            raise IndexError("open list is empty")
+        buckets = self._buckets
+        cursor = self._cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self._cursor = cursor
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class RadixHeapOpenList(OpenList):
+    """
+    Radix heap for monotone integer priorities.
+
+    Pushed priorities must never be lower than the last popped priority,
+    which holds for Dijkstra and for A* with a consistent heuristic.
+    Bucket i holds items whose priority first differs from the last popped
+    priority at bit i - 1, so each item is redistributed O(log C) times.
+    """
+
+    def __init__(self):
+        self._buckets: List[List[Tuple[int, Any]]] = [[] for _ in range(65)]
+        self._last = 0
+        self._size = 0
+
+    def push(self, priority: int, item: Any) -> None:
+        if priority < self._last:
+            raise ValueError(f"Priority {priority} is below last popped priority {self._last}")
+        self._buckets[(priority ^ self._last).bit_length()].append((priority, item))
+        self._size += 1
+
+    def pop(self) -> Any:
+        self._settle()
+        self._size -= 1
+        return self._buckets[0].pop()[1]
+
+    def peek(self) -> Tuple[int, Any]:
+        self._settle()
+        return self._buckets[0][-1]
+
+    def _settle(self) -> None:
+        """Fill bucket 0 with the lowest-priority items, redistributing the first non-empty bucket."""
+        if not self._size:
+            raise IndexError("open list is empty")
+        buckets = self._buckets
+        if buckets[0]:
+            return
+
+        i = 1
+        while not buckets[i]:
+            i += 1
+        bucket = buckets[i]
+        buckets[i] = []
+        last = min(entry[0] for entry in bucket)
+        self._last = last
+        for entry in bucket:
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+    def __len__(self) -> int:
+        return self._size
+
+
+OPEN_LISTS: Dict[str, Type[OpenList]] = {
+    'heap': HeapOpenList,
+    'bucket': BucketOpenList,
+    'radix': RadixHeapOpenList,
+}
+
+
+def create_open_list(kind: str) -> OpenList:
+    """Instantiate an open list by key."""
+    try:
+        return OPEN_LISTS[kind]()
+    except KeyError:
+        raise ValueError(f"Unknown open list '{kind}', expected one of {sorted(OPEN_LISTS)}") from None
@@ -0,0 +1,48 @@
+"""
+Reusable per-cell search arrays.
+
+A SearchWorkspace holds g-score, parent and closed arrays sized to a grid
+and is reused across queries. Instead of clearing the arrays, each search
+takes a new generation number: an entry only counts if its stamp equals the
+current generation, so starting a query is O(1) and a short query touches
+only the cells it reaches.
+"""
+
+from array import array
+
+# Stamps are unsigned 32-bit; wrap around by clearing once in ~4 billion searches
+_MAX_GENERATION = 2 ** 32 - 1
+
+
+class SearchWorkspace:
+    """
+    Generation-stamped g/parent/closed arrays shared by successive searches.
+
+    ``seen[cell] == generation`` marks g_score and parent as valid for the
+    current search; ``closed[cell] == generation`` marks the cell expanded.
+    A workspace serves one search at a time.
+    """
+
+    def __init__(self, size: int = 0):
+        self.size = 0
+        self.generation = 0
+        self.g_score = array('i')
+        self.parent = array('i')
+        self.seen = array('I')
+        self.closed = array('I')
+        self._allocate(size)
+
+    def _allocate(self, size: int) -> None:
+        self.size = size
+        self.generation = 0
+        self.g_score = array('i', [0]) * size
+        self.parent = array('i', [-1]) * size
+        self.seen = array('I', [0]) * size
+        self.closed = array('I', [0]) * size
+
+    def begin(self, size: int) -> int:
+        """Start a search over size cells and return its generation."""
+        if size != self.size or self.generation == _MAX_GENERATION:
+            self._allocate(size)
+        self.generation += 1
+        return self.generation
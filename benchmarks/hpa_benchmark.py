@@ -0,0 +1,61 @@
+"""
+Benchmark HPA* build, query and replan latency on a large random grid.
+
+Usage:
+    python -m benchmarks.hpa_benchmark [--size N] [--walls P] [--queries Q] [--seed S]
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from algorithms import HPAStarPathfinder
+from blocks.grid_graph import GridGraph
+
+
+def random_grid(size: int, walls: float, rng: random.Random) -> GridGraph:
+    return GridGraph(size, size, bytes(rng.random() >= walls for _ in range(size * size)))
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--walls", type=float, default=0.2)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    graph = random_grid(args.size, args.walls, rng)
+    queries = []
+    for _ in range(args.queries):
+        start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+        graph.set_walkable(start, True)
+        graph.set_walkable(end, True)
+        queries.append((start, end))
+
+    pathfinder = HPAStarPathfinder()
+    t0 = time.perf_counter()
+    pathfinder.find_path(graph, *queries[0], trace='none')
+    print(f"{'build + first query':<22} {(time.perf_counter() - t0) * 1000:>10.2f} ms")
+
+    def timed(label: str, edit: bool) -> None:
+        times = []
+        for start, end in queries:
+            if edit:
+                cell = rng.randrange(graph.size)
+                if cell not in (start, end):
+                    graph.set_walkable(cell, not graph.walkable[cell])
+            t0 = time.perf_counter()
+            pathfinder.find_path(graph, start, end, trace='none')
+            times.append((time.perf_counter() - t0) * 1000)
+        print(f"{label:<22} {sum(times) / len(times):>10.2f} ms mean {max(times):>10.2f} ms max")
+
+    timed("query", edit=False)
+    timed("repeated query", edit=False)
+    timed("edit + query", edit=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark the landmark (ALT) heuristic against Manhattan A* and Dijkstra.
+
+Usage:
+    python -m benchmarks.landmark_benchmark [--queries N] [--landmarks K] [--seed S]
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from algorithms import AStarPathfinder, DijkstraPathfinder
+from algorithms.landmarks import LandmarkTable
+from benchmarks.open_list_benchmark import open_grid, wilson_maze
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        ("wilson 101x101", wilson_maze(101, args.seed)),
+        ("open 150x150", open_grid(150)),
+    ]
+
+    print(f"{'grid':<15} {'algorithm':<12} {'ms total':>10} {'expanded':>10}")
+    for name, graph in scenarios:
+        rng = random.Random(args.seed)
+        cells = [cell for cell in range(graph.size) if graph.walkable[cell]]
+        queries = [(rng.choice(cells), rng.choice(cells)) for _ in range(args.queries)]
+
+        t0 = time.perf_counter()
+        table = LandmarkTable.build(graph, args.landmarks)
+        print(f"{name:<15} {'(preprocess)':<12} {(time.perf_counter() - t0) * 1000:>10.2f} {'':>10}")
+
+        for label, pathfinder in (("A*", AStarPathfinder()), ("ALT", AStarPathfinder(landmarks=table)),
+                                  ("Dijkstra", DijkstraPathfinder())):
+            expanded = 0
+            t0 = time.perf_counter()
+            for start, end in queries:
+                expanded += len(pathfinder.find_path(graph, start, end).visited)
+            ms = (time.perf_counter() - t0) * 1000
+            print(f"{name:<15} {label:<12} {ms:>10.2f} {expanded:>10}")
+
+
+if __name__ == '__main__':
+    main()
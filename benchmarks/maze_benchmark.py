@@ -0,0 +1,34 @@
+"""
+Benchmark maze generators: maze cells carved per second across grid sizes.
+
+Usage:
+    python -m benchmarks.maze_benchmark [--sizes 101 501 1001] [--seed S]
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from maze import MAZE_GENERATORS
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs='+', default=[101, 501, 1001])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    print(f"{'grid':<12} {'generator':<12} {'ms':>10} {'cells/s':>12}")
+    for size in args.sizes:
+        cells = ((size + 1) // 2) ** 2
+        for name, generator_class in MAZE_GENERATORS.items():
+            generator = generator_class()
+            t0 = time.perf_counter()
+            generator.carve(size, size, random.Random(args.seed))
+            seconds = time.perf_counter() - t0
+            print(f"{f'{size}x{size}':<12} {name:<12} {seconds * 1000:>10.1f} {cells / seconds:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark open-list backends on Wilson mazes and open grids.
+
+Usage:
+    python -m benchmarks.open_list_benchmark [--repeat N] [--seed S]
+"""
+
+import argparse
+import time
+from collections import deque
+from typing import List, Tuple
+
+from algorithms import AStarPathfinder, DijkstraPathfinder, OPEN_LISTS
+from blocks.grid_graph import GridGraph
+from maze import WilsonMazeGenerator
+
+
+def open_grid(rows: int) -> GridGraph:
+    return GridGraph(rows)
+
+
+def wilson_maze(rows: int, seed: int) -> GridGraph:
+    graph = GridGraph(rows)
+    WilsonMazeGenerator().generate(graph, seed)
+    return graph
+
+
+def _bfs(graph: GridGraph, source: int) -> List[int]:
+    """Return cells reachable from source in BFS order."""
+    seen = {source}
+    order = []
+    queue = deque([source])
+    while queue:
+        cell = queue.popleft()
+        order.append(cell)
+        for neighbor in graph.neighbors(cell):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return order
+
+
+def long_query(graph: GridGraph) -> Tuple[int, int]:
+    """Return a far-apart pair in the largest component (double BFS sweep)."""
+    seen = set()
+    largest: List[int] = []
+    for cell in range(graph.size):
+        if graph.walkable[cell] and cell not in seen:
+            component = _bfs(graph, cell)
+            seen.update(component)
+            if len(component) > len(largest):
+                largest = component
+    start = _bfs(graph, largest[0])[-1]
+    return start, _bfs(graph, start)[-1]
+
+
+def time_search(pathfinder, graph: GridGraph, start: int, end: int, repeat: int) -> Tuple[float, int]:
+    """Return best wall-clock time in ms and the number of expansions."""
+    best = float("inf")
+    expanded = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = pathfinder.find_path(graph, start, end)
+        best = min(best, time.perf_counter() - t0)
+        expanded = len(result.visited)
+    return best * 1000, expanded
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        ("wilson 50x50", wilson_maze(50, args.seed)),
+        ("open 100x100", open_grid(100)),
+        ("open 300x300", open_grid(300)),
+    ]
+
+    print(f"{'grid':<14} {'algorithm':<10} {'open list':<10} {'ms':>10} {'expanded':>10}")
+    for name, graph in scenarios:
+        start, end = long_query(graph)
+        for pathfinder_class in (AStarPathfinder, DijkstraPathfinder):
+            for kind in OPEN_LISTS:
+                pathfinder = pathfinder_class(open_list=kind)
+                ms, expanded = time_search(pathfinder, graph, start, end, args.repeat)
+                label = pathfinder_class.__name__.replace("Pathfinder", "")
+                print(f"{name:<14} {label:<10} {kind:<10} {ms:>10.2f} {expanded:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,11 +5,14 @@ Uses State Pattern to delegate behavior to state objects.
 """
 
 import pygame
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 # from config import constants
 from blocks import block_state
 
+if TYPE_CHECKING:
+    from blocks.grid_graph import GridGraph
+
 
 class Block:
     """Single cell in the pathfinding grid with state-based behavior."""
@@ -23,110 +26,174 @@ class Block:
         self.total_rows = total_rows
 
         self._state = block_state.EMPTY
-        self.neighbors: List['Block'] = []
+        self._neighbors: List['Block'] = []
+
+        self._graph: Optional['GridGraph'] = None
+        self._index = -1
 
     @property
     def state(self) -> block_state.BlockState:
-        """Get current state."""
+        """Get current state (read from the graph's state codes when attached)."""
+        if self._graph is not None:
+            return block_state.STATES[self._graph.states[self._index]]
         return self._state
 
+    @property
+    def code(self) -> int:
+        """Integer code of the current state."""
+        if self._graph is not None:
+            return self._graph.states[self._index]
+        return self._state.code
+
     def set_state(self, new_state: block_state.BlockState) -> bool:
         """
         Change block state with validation.
         Returns True if transition succeeded, False if invalid.
         """
-        if self._state.can_transition_to(new_state):
+        if self.state.can_transition_to(new_state):
             self._state = new_state
+            self._sync()
             return True
         return False
 
     def reset(self) -> None:
         """Reset to empty state."""
         self._state = block_state.EMPTY
+        self._sync()
+
+    @property
+    def graph(self) -> Optional['GridGraph']:
+        """GridGraph this block is a view of, if attached."""
+        return self._graph
+
+    @property
+    def index(self) -> int:
+        """Cell id in the attached GridGraph (-1 if detached)."""
+        return self._index
+
+    def attach(self, graph: 'GridGraph', index: int) -> None:
+        """Make this block a view of cell ``index`` in ``graph``."""
+        self._graph = graph
+        self._index = index
+        self._sync()
+
+    def _sync(self) -> None:
+        """Push the state code into the attached graph."""
+        if self._graph is not None:
+            self._graph.set_state(self._index, self._state.code)
 
     def is_empty(self) -> bool:
-        return isinstance(self._state, block_state.EmptyState)
+        return self.code == block_state.EMPTY_CODE
 
     def is_barrier(self) -> bool:
-        return isinstance(self._state, block_state.BarrierState)
+        return self.code == block_state.BARRIER_CODE
 
     def set_barrier(self) -> None:
         self.set_state(block_state.BARRIER)
 
     def is_start(self) -> bool:
-        return isinstance(self._state, block_state.StartState)
+        return self.code == block_state.START_CODE
 
     def set_start(self) -> None:
         self.set_state(block_state.START)
 
     def is_end(self) -> bool:
-        return isinstance(self._state, block_state.EndState)
+        return self.code == block_state.END_CODE
 
     def set_end(self) -> None:
         self.set_state(block_state.END)
 
     def is_open(self) -> bool:
-        return isinstance(self._state, block_state.OpenState)
+        return self.code == block_state.OPEN_CODE
 
     def set_open(self) -> None:
         self.set_state(block_state.OPEN)
 
     def is_closed(self) -> bool:
-        return isinstance(self._state, block_state.ClosedState)
+        return self.code in (block_state.CLOSED_CODE, block_state.BACKWARD_CLOSED_CODE)
 
     def set_closed(self) -> None:
         self.set_state(block_state.CLOSED)
 
+    def set_backward_closed(self) -> None:
+        """Mark as explored by the backward side of a bidirectional search."""
+        self.set_state(block_state.BACKWARD_CLOSED)
+
     def set_path(self) -> None:
         self.set_state(block_state.PATH)
 
     def is_walkable(self) -> bool:
         """Can pathfinding traverse this block?"""
-        return self._state.is_walkable()
+        return self.state.is_walkable()
 
     def draw(self, window: pygame.Surface) -> None:
         """Render block to pygame surface."""
-        color = self._state.get_color()
+        color = self.state.get_color()
         pygame.draw.rect(window, color, (self.x, self.y, self.width, self.width))
 
     def get_position(self) -> Tuple[int, int]:
         """Return (row, col) position."""
         return self.row, self.col
 
+    @property
+    def neighbors(self) -> List['Block']:
+        """
+        Walkable neighbors (down, up, right, left).
+
+        Attached blocks read them from the graph's neighbor masks, which are
+        kept current on every state change; detached blocks return the list
+        built by the last update_neighbors call.
+        """
+        graph = self._graph
+        if graph is None or graph.blocks is None:
+            return self._neighbors
+        return [graph.block(index) for index in graph.neighbors(self._index)]
+
+    @neighbors.setter
+    def neighbors(self, neighbors: List['Block']) -> None:
+        self._neighbors = neighbors
+
     def update_neighbors(self, grid: List[List['Block']]) -> None:
-        """Update list of walkable neighbors (up, down, left, right)."""
-        self.neighbors = []
+        """
+        Update list of walkable neighbors (down, up, right, left).
+
+        Only needed for detached blocks; attached blocks are always current.
+        """
+        graph = self._graph
+        if graph is not None and graph.blocks is grid:
+            return
+        self._neighbors = []
 
         # Down
         if self.row < self.total_rows - 1:
             neighbor = grid[self.row + 1][self.col]
             if neighbor.is_walkable():
-                self.neighbors.append(neighbor)
+                self._neighbors.append(neighbor)
 
         # Up
         if self.row > 0:
             neighbor = grid[self.row - 1][self.col]
             if neighbor.is_walkable():
-                self.neighbors.append(neighbor)
+                self._neighbors.append(neighbor)
 
         # Right
         if self.col < self.total_rows - 1:
             neighbor = grid[self.row][self.col + 1]
             if neighbor.is_walkable():
-                self.neighbors.append(neighbor)
+                self._neighbors.append(neighbor)
 
         # Left
         if self.col > 0:
             neighbor = grid[self.row][self.col - 1]
             if neighbor.is_walkable():
-                self.neighbors.append(neighbor)
+                self._neighbors.append(neighbor)
 
     def is_neighbor(self, block: 'Block') -> bool:
         """Check if block is a neighbor."""
         return block in self.neighbors
 
     def __repr__(self) -> str:
-        return f"Block({self.row}, {self.col}, state={self._state})"
+        return f"Block({self.row}, {self.col}, state={self.state})"
 
     def __lt__(self, other: 'Block') -> bool:
         """For priority queue compatibility."""
@@ -3,6 +3,8 @@ State Pattern implementation for block behaviors.
 
 Each block state encapsulates its own rendering and pathfinding properties.
 States validate their own transitions to prevent invalid state changes.
+Every state also has a small integer ``code``; GridGraph stores one code
+per cell in a bytearray so whole-grid operations run over bytes.
 """
 
 from abc import ABC, abstractmethod
@@ -13,10 +15,22 @@ from config import constants
 if TYPE_CHECKING:
     from blocks.block import Block
 
+# Integer state codes, as stored in GridGraph.states
+EMPTY_CODE = 0
+BARRIER_CODE = 1
+START_CODE = 2
+END_CODE = 3
+OPEN_CODE = 4
+CLOSED_CODE = 5
+BACKWARD_CLOSED_CODE = 6
+PATH_CODE = 7
+
 
 class BlockState(ABC):
     """Abstract base class for all block states."""
 
+    code: int
+
     @abstractmethod
     def get_color(self) -> Tuple[int, int, int]:
         """Return the color to render this state."""
@@ -39,6 +53,8 @@ class BlockState(ABC):
 class EmptyState(BlockState):
     """Default state - unvisited, walkable block."""
 
+    code = EMPTY_CODE
+
     def get_color(self) -> Tuple[int, int, int]:
         return constants.WHITE
 
@@ -52,6 +68,8 @@ class EmptyState(BlockState):
 class BarrierState(BlockState):
     """Wall that blocks pathfinding."""
 
+    code = BARRIER_CODE
+
     def get_color(self) -> Tuple[int, int, int]:
         return constants.BLACK
 
@@ -59,12 +77,14 @@ class BarrierState(BlockState):
         return False
 
     def can_transition_to(self, new_state: BlockState) -> bool:
-        return isinstance(new_state, (EmptyState, BarrierState))
+        return new_state.code in (EMPTY_CODE, BARRIER_CODE)
 
 
 class StartState(BlockState):
     """Starting point for pathfinding."""
 
+    code = START_CODE
+
     def get_color(self) -> Tuple[int, int, int]:
         return constants.ORANGE
 
@@ -72,12 +92,14 @@ class StartState(BlockState):
         return True
 
     def can_transition_to(self, new_state: BlockState) -> bool:
-        return isinstance(new_state, (EmptyState, StartState))
+        return new_state.code in (EMPTY_CODE, START_CODE)
 
 
 class EndState(BlockState):
     """Goal point for pathfinding."""
 
+    code = END_CODE
+
     def get_color(self) -> Tuple[int, int, int]:
         return constants.PURPLE
 
@@ -85,12 +107,14 @@ class EndState(BlockState):
         return True
 
     def can_transition_to(self, new_state: BlockState) -> bool:
-        return isinstance(new_state, (EmptyState, EndState))
+        return new_state.code in (EMPTY_CODE, END_CODE)
 
 
 class OpenState(BlockState):
     """Blocks in the algorithms's open set (discovered but not fully explored)."""
 
+    code = OPEN_CODE
+
     def get_color(self) -> Tuple[int, int, int]:
         return constants.GREEN
 
@@ -98,12 +122,14 @@ class OpenState(BlockState):
         return True
 
     def can_transition_to(self, new_state: BlockState) -> bool:
-        return isinstance(new_state, (ClosedState, PathState, EmptyState, OpenState))
+        return new_state.code in (CLOSED_CODE, BACKWARD_CLOSED_CODE, PATH_CODE, EMPTY_CODE, OPEN_CODE)
 
 
 class ClosedState(BlockState):
     """Blocks in the algorithms's closed set (fully explored)."""
 
+    code = CLOSED_CODE
+
     def get_color(self) -> Tuple[int, int, int]:
         return constants.RED
 
@@ -111,12 +137,23 @@ class ClosedState(BlockState):
         return True
 
     def can_transition_to(self, new_state: BlockState) -> bool:
-        return isinstance(new_state, (PathState, EmptyState, ClosedState, BarrierState))
+        return new_state.code in (PATH_CODE, EMPTY_CODE, CLOSED_CODE, BACKWARD_CLOSED_CODE, BARRIER_CODE)
+
+
+class BackwardClosedState(ClosedState):
+    """Blocks fully explored by the backward frontier of a bidirectional search."""
+
+    code = BACKWARD_CLOSED_CODE
+
+    def get_color(self) -> Tuple[int, int, int]:
+        return constants.BLUE
 
 
 class PathState(BlockState):
     """Final path from start to end."""
 
+    code = PATH_CODE
+
     def get_color(self) -> Tuple[int, int, int]:
         return constants.TURQUOISE
 
@@ -124,7 +161,7 @@ class PathState(BlockState):
         return True
 
     def can_transition_to(self, new_state: BlockState) -> bool:
-        return isinstance(new_state, (EmptyState, PathState))
+        return new_state.code in (EMPTY_CODE, PATH_CODE)
 
 
 # Singleton instances
@@ -134,4 +171,15 @@ START = StartState()
 END = EndState()
 OPEN = OpenState()
 CLOSED = ClosedState()
-PATH = PathState()
\ No newline at end of file
+BACKWARD_CLOSED = BackwardClosedState()
+PATH = PathState()
+
+# States indexed by code
+STATES = (EMPTY, BARRIER, START, END, OPEN, CLOSED, BACKWARD_CLOSED, PATH)
+
+# Codes left behind by a search, cleared back to EMPTY between runs
+SEARCH_CODES = (OPEN_CODE, CLOSED_CODE, BACKWARD_CLOSED_CODE, PATH_CODE)
+
+# bytes.translate tables over a states array
+WALKABLE_TABLE = bytes(STATES[code].is_walkable() if code < len(STATES) else 0 for code in range(256))
+CLEAR_SEARCH_TABLE = bytes(EMPTY_CODE if code in SEARCH_CODES else code for code in range(256))
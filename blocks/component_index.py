@@ -0,0 +1,209 @@
+"""
+Connected-component index over a GridGraph.
+
+Every walkable cell carries a component label, and labels are merged with a
+small union-find, so opening a cell only unions the labels of its walkable
+neighbors. Closing a cell is handled locally as well:
+- with fewer than two walkable neighbors, or with all of them still joined
+  through the ring of eight cells around it, nothing can have split
+- otherwise a breadth-first search runs from each neighbor in turn; searches
+  that meet are merged, and a search that runs out of cells has found a piece
+  that split off, which alone is given a new label
+
+The work is bounded by the smaller pieces. Only when the searches exceed a
+budget (e.g. bulk edits such as loading a maze cell by cell) is the index
+marked dirty, and the next query rebuilds it from scratch.
+"""
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List
+
+if TYPE_CHECKING:
+    from blocks.grid_graph import GridGraph
+
+# The eight cells around a cell, in ring order; orthogonal neighbors sit at even positions
+_RING = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+# Cells a split search may visit before giving up, at least; larger grids allow size // 32
+_MIN_SPLIT_BUDGET = 4096
+
+
+class ComponentIndex:
+    """Answers "are these two cells connected?" in near O(1)."""
+
+    def __init__(self, graph: 'GridGraph'):
+        self.graph = graph
+        # Label of every cell (-1 for barriers), union-find parent of every label,
+        # and a representative cell of every root label
+        self._labels = array('i')
+        self._parent: List[int] = []
+        self._cells: List[int] = []
+        self._dirty = True
+        graph.add_listener(self.on_walkable_changed)
+
+    def on_walkable_changed(self, index: int, walkable: bool) -> None:
+        """Graph listener: keep the index in sync with a single cell change."""
+        if self._dirty:
+            return
+        if walkable:
+            self._open(index)
+        else:
+            self._close(index)
+
+    def rebuild(self) -> None:
+        """Recompute all components from the occupancy array."""
+        graph = self.graph
+        walkable = graph.walkable
+        labels = array('i', [-1]) * graph.size
+        self._labels = labels
+        self._parent = []
+        self._cells = []
+        self._dirty = False
+
+        for cell in range(graph.size):
+            if not walkable[cell] or labels[cell] != -1:
+                continue
+            label = self._new_label(cell)
+            labels[cell] = label
+            stack = [cell]
+            while stack:
+                for neighbor in graph.neighbors(stack.pop()):
+                    if labels[neighbor] == -1:
+                        labels[neighbor] = label
+                        stack.append(neighbor)
+
+    def find(self, index: int) -> int:
+        """Component representative of a cell (-1 for barriers)."""
+        if self._dirty:
+            self.rebuild()
+        label = self._labels[index]
+        if label == -1:
+            return -1
+        return self._cells[self._root(label)]
+
+    def connected(self, a: int, b: int) -> bool:
+        """Are both cells walkable and in the same component?"""
+        if a == b:
+            return self.graph.walkable[a] == 1
+        root_a = self.find(a)
+        return root_a != -1 and root_a == self.find(b)
+
+    def _new_label(self, cell: int) -> int:
+        label = len(self._parent)
+        self._parent.append(label)
+        self._cells.append(cell)
+        return label
+
+    def _root(self, label: int) -> int:
+        parent = self._parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]  # Path halving
+            label = parent[label]
+        return label
+
+    def _open(self, index: int) -> None:
+        """Give an opened cell its neighbors' label, merging their components."""
+        roots = {self._root(self._labels[neighbor]) for neighbor in self.graph.neighbors(index)}
+        if not roots:
+            self._labels[index] = self._new_label(index)
+            return
+        label = roots.pop()
+        for other in roots:
+            self._parent[other] = label
+        self._labels[index] = label
+
+    def _close(self, index: int) -> None:
+        """Drop a closed cell and relabel any piece its removal cut off."""
+        root = self._root(self._labels[index])
+        self._labels[index] = -1
+        neighbors = self.graph.neighbors(index)
+        if self._cells[root] == index and neighbors:
+            self._cells[root] = neighbors[0]
+        if len(neighbors) < 2 or self._ring_connected(index):
+            return
+        if not self._split(root, neighbors):
+            self._dirty = True
+
+    def _ring_connected(self, index: int) -> bool:
+        """Are the cell's walkable orthogonal neighbors joined through the eight cells around it?"""
+        graph = self.graph
+        row, col = divmod(index, graph.cols)
+        ring = [0 <= row + dr < graph.rows and 0 <= col + dc < graph.cols
+                and graph.walkable[index + dr * graph.cols + dc] == 1 for dr, dc in _RING]
+        if all(ring):
+            return True
+
+        # Walk the ring from a blocked cell, counting runs of open cells that hold a neighbor
+        first = ring.index(False)
+        runs_with_neighbor = 0
+        holds_neighbor = False
+        for step in range(1, 9):
+            position = (first + step) % 8
+            if ring[position]:
+                holds_neighbor = holds_neighbor or position % 2 == 0
+            else:
+                runs_with_neighbor += holds_neighbor
+                holds_neighbor = False
+        return runs_with_neighbor <= 1
+
+    def _split(self, root: int, starts: List[int]) -> bool:
+        """
+        Search from each start in turn until all but one search have met or run out.
+
+        Searches that run out of cells are pieces cut off from the rest and
+        get new labels. Returns False if the budget ran out first.
+        """
+        graph = self.graph
+        budget = max(_MIN_SPLIT_BUDGET, graph.size // 32)
+        owner: Dict[int, int] = {cell: search for search, cell in enumerate(starts)}
+        merged = list(range(len(starts)))
+        frontiers: List[Deque[int]] = [deque([cell]) for cell in starts]
+        members: List[List[int]] = [[cell] for cell in starts]
+        running = set(range(len(starts)))
+
+        def resolve(search: int) -> int:
+            while merged[search] != search:
+                search = merged[search]
+            return search
+
+        while len(running) > 1:
+            for search in list(running):
+                if search not in running:
+                    continue
+                frontier = frontiers[search]
+                if not frontier:
+                    # Ran out without meeting another search: a separate piece
+                    running.discard(search)
+                    label = self._new_label(members[search][0])
+                    for cell in members[search]:
+                        self._labels[cell] = label
+                    if len(running) == 1:
+                        break
+                    continue
+
+                for neighbor in graph.neighbors(frontier.popleft()):
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = search
+                        frontier.append(neighbor)
+                        members[search].append(neighbor)
+                        continue
+                    other = resolve(other)
+                    if other != search:
+                        # Met another search: both are the same piece
+                        merged[other] = search
+                        running.discard(other)
+                        frontier.extend(frontiers[other])
+                        members[search].extend(members[other])
+
+                budget -= 1
+                if budget < 0:
+                    return False
+
+        # The last running search keeps the old label; make sure its representative is inside it
+        remaining = running.pop()
+        label = self._labels[self._cells[root]]
+        if label == -1 or self._root(label) != root:
+            self._cells[root] = members[remaining][0]
+        return True
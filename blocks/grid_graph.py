@@ -0,0 +1,265 @@
+"""
+Compact array-backed grid graph.
+
+Stores walkability in a flat bytearray indexed by integer cell ids so that
+pathfinders can search large grids without allocating Block objects.
+A Block grid can be attached to a GridGraph, in which case every state
+change on a Block is synced into the graph.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
+
+from blocks import block_state
+from blocks.component_index import ComponentIndex
+
+if TYPE_CHECKING:
+    from blocks.block import Block
+
+# Called with (cell id, walkable) whenever a cell's walkability changes
+WalkableListener = Callable[[int, bool], None]
+
+# Initial state code of a cell from its walkability
+_STATE_OF_WALKABLE = bytes.maketrans(b'\x00\x01', bytes([block_state.BARRIER_CODE, block_state.EMPTY_CODE]))
+
+# Neighbor mask bits, in Block.update_neighbors order
+DOWN = 1
+UP = 2
+RIGHT = 4
+LEFT = 8
+
+
+class GridGraph:
+    """
+    4-connected grid of cells with integer ids.
+
+    Cell (row, col) has id ``row * cols + col``. ``walkable[id]`` is 1 for
+    traversable cells and 0 for barriers. Change cells through set_walkable
+    so that listeners such as the component index stay in sync; ``version``
+    counts those changes so caches can tell whether the map moved on.
+
+    ``masks[id]`` holds a 4-bit DOWN/UP/RIGHT/LEFT mask of the cell's
+    walkable in-bounds neighbors. set_walkable updates only the masks of the
+    changed cell's neighbors, so adjacency never needs a full rebuild.
+
+    ``states[id]`` is the block_state code of the cell. Attached Blocks read
+    their state from it, which lets whole-grid operations (clearing a search,
+    counting states) run as single bytes.translate/count calls.
+
+    Cells whose state changes are collected for renderers; take_changes()
+    hands them over, or reports that everything must be redrawn after a
+    bulk operation.
+    """
+
+    def __init__(self, rows: int, cols: Optional[int] = None, walkable: Optional[bytes] = None):
+        self.rows = rows
+        self.cols = rows if cols is None else cols
+        self.size = self.rows * self.cols
+
+        if walkable is None:
+            self.walkable = bytearray(b'\x01') * self.size
+        else:
+            if len(walkable) != self.size:
+                raise ValueError(f"Expected {self.size} cells, got {len(walkable)}")
+            self.walkable = bytearray(walkable)
+
+        self.states = self.walkable.translate(_STATE_OF_WALKABLE)
+        self.version = 0
+        self.blocks: Optional[List[List['Block']]] = None
+        self._listeners: List[WalkableListener] = []
+        self._components: Optional[ComponentIndex] = None
+        self._changed: Set[int] = set()
+        self._changed_all = True
+
+        # Neighbor offsets for each of the 16 masks, in DOWN, UP, RIGHT, LEFT order
+        directions = ((DOWN, self.cols), (UP, -self.cols), (RIGHT, 1), (LEFT, -1))
+        self._offsets = [tuple(offset for bit, offset in directions if mask & bit) for mask in range(16)]
+        self.masks = bytearray(self.size)
+        self._build_masks()
+
+    def _build_masks(self) -> None:
+        """
+        Compute every cell's neighbor mask from the occupancy array.
+
+        The occupancy is read as one little-endian integer with a 0/1 byte
+        per cell, so shifting it by whole bytes lines each cell up with a
+        neighbor; the four shifted copies are OR-ed into their mask bits.
+        """
+        cols, size = self.cols, self.size
+        if not size:
+            return
+        cells = (1 << (8 * size)) - 1
+        occupancy = int.from_bytes(self.walkable, 'little')
+        not_last_col = int.from_bytes((b'\xff' * (cols - 1) + b'\x00') * self.rows, 'little')
+        not_first_col = int.from_bytes((b'\x00' + b'\xff' * (cols - 1)) * self.rows, 'little')
+
+        down = occupancy >> (8 * cols)
+        up = (occupancy << (8 * cols)) & cells
+        right = (occupancy >> 8) & not_last_col
+        left = (occupancy << 8) & not_first_col
+        masks = down * DOWN | up * UP | right * RIGHT | left * LEFT
+        self.masks[:] = masks.to_bytes(size, 'little')
+
+    @classmethod
+    def from_blocks(cls, grid: List[List['Block']], attach: bool = True) -> 'GridGraph':
+        """
+        Build a graph from a Block grid.
+
+        With attach=True the blocks become a view of the graph and sync every
+        state change into it; otherwise the graph is a detached snapshot.
+        """
+        rows = len(grid)
+        cols = len(grid[0]) if grid else 0
+        graph = cls(rows, cols)
+
+        if not attach:
+            graph.states = bytearray(block.state.code for row in grid for block in row)
+            graph.walkable = bytearray(graph.walkable_mask())
+            graph._build_masks()
+            return graph
+
+        graph.blocks = grid
+        for row in grid:
+            for block in row:
+                block.attach(graph, graph.index(block.row, block.col))
+
+        return graph
+
+    def index(self, row: int, col: int) -> int:
+        """Return cell id of (row, col)."""
+        return row * self.cols + col
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Return (row, col) of a cell id."""
+        return divmod(index, self.cols)
+
+    def is_walkable(self, index: int) -> bool:
+        return self.walkable[index] == 1
+
+    def set_walkable(self, index: int, walkable: bool) -> None:
+        value = 1 if walkable else 0
+        if self.walkable[index] == value:
+            return
+        self.walkable[index] = value
+        self.states[index] = block_state.EMPTY_CODE if value else block_state.BARRIER_CODE
+        self._mark_changed(index)
+        self.version += 1
+
+        # The cell is the UP neighbor of the cell below it, and so on
+        cols, masks = self.cols, self.masks
+        col = index % cols
+        for neighbor, bit, inside in ((index + cols, UP, index + cols < self.size), (index - cols, DOWN, index >= cols),
+                                      (index + 1, LEFT, col < cols - 1), (index - 1, RIGHT, col > 0)):
+            if inside:
+                masks[neighbor] = masks[neighbor] | bit if value else masks[neighbor] & ~bit
+
+        for listener in self._listeners:
+            listener(index, walkable)
+
+    def load_walkable(self, walkable: bytes) -> None:
+        """
+        Replace the whole occupancy array, e.g. with a generated maze.
+
+        Every cell's state is reset to EMPTY or BARRIER. Without listeners the
+        masks are rebuilt in bulk; otherwise changed cells go through
+        set_walkable so listeners see each change.
+        """
+        if len(walkable) != self.size:
+            raise ValueError(f"Expected {self.size} cells, got {len(walkable)}")
+
+        if self._listeners:
+            current = self.walkable
+            for index in range(self.size):
+                if current[index] != walkable[index]:
+                    self.set_walkable(index, walkable[index])
+        else:
+            self.walkable[:] = walkable
+            self._build_masks()
+            self.version += 1
+        self.states[:] = self.walkable.translate(_STATE_OF_WALKABLE)
+        self._changed_all = True
+
+    def set_state(self, index: int, code: int) -> None:
+        """Set a cell's state code, updating walkability (and listeners) if it changes."""
+        self.set_walkable(index, block_state.WALKABLE_TABLE[code])
+        if self.states[index] != code:
+            self.states[index] = code
+            self._mark_changed(index)
+
+    def clear_search_states(self) -> int:
+        """Reset every OPEN, CLOSED and PATH cell to EMPTY in one pass; return how many were cleared."""
+        states = self.states
+        cleared = sum(states.count(code) for code in block_state.SEARCH_CODES)
+        if cleared:
+            states[:] = states.translate(block_state.CLEAR_SEARCH_TABLE)
+            self._changed_all = True
+        return cleared
+
+    def _mark_changed(self, index: int) -> None:
+        if self._changed_all:
+            return
+        self._changed.add(index)
+        if len(self._changed) > self.size // 4:
+            # Cheaper to redraw everything than to track this many cells
+            self._changed_all = True
+            self._changed.clear()
+
+    def take_changes(self) -> Optional[Set[int]]:
+        """
+        Cells whose state changed since the previous call, for incremental redraws.
+
+        Returns None when everything should be redrawn: on the first call,
+        after bulk operations, or when most of the grid changed.
+        """
+        if self._changed_all:
+            self._changed_all = False
+            return None
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def count_states(self) -> Dict[block_state.BlockState, int]:
+        """Number of cells in each state."""
+        return {state: self.states.count(state.code) for state in block_state.STATES}
+
+    def walkable_mask(self) -> bytes:
+        """Walkability of every cell (1 or 0) computed from the state codes."""
+        return self.states.translate(block_state.WALKABLE_TABLE)
+
+    def add_listener(self, listener: WalkableListener) -> None:
+        """Register a callback for walkability changes made through set_walkable."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: WalkableListener) -> None:
+        """Unregister a callback added with add_listener."""
+        self._listeners.remove(listener)
+
+    @property
+    def components(self) -> ComponentIndex:
+        """Connected-component index, created on first use and kept in sync afterwards."""
+        if self._components is None:
+            self._components = ComponentIndex(self)
+        return self._components
+
+    def neighbors(self, index: int) -> List[int]:
+        """Return walkable neighbors (down, up, right, left), same order as Block.update_neighbors."""
+        return [index + offset for offset in self._offsets[self.masks[index]]]
+
+    def block(self, index: int) -> 'Block':
+        """Return the Block viewing a cell id. Requires an attached Block grid."""
+        if self.blocks is None:
+            raise ValueError("GridGraph has no attached Block grid")
+        row, col = divmod(index, self.cols)
+        return self.blocks[row][col]
+
+    def __getstate__(self) -> dict:
+        """Pickle only the dimensions and occupancy; blocks, listeners and indexes stay behind."""
+        return {'rows': self.rows, 'cols': self.cols, 'walkable': bytes(self.walkable)}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['rows'], state['cols'], state['walkable'])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"GridGraph({self.rows}x{self.cols}, walkable={self.walkable.count(1)})"
@@ -7,6 +7,13 @@ WIDTH: int = 800
 ROWS: int = 50
 GAP: int = WIDTH // ROWS
 
+# Animation: frames per second, and how long a search of any size plays back at 1x speed
+FPS: int = 60
+PLAYBACK_SECONDS: float = 3.0
+
+# Grid renderer: 'blocks' draws changed cells one by one, 'array' blits the whole grid at once
+RENDERER: str = 'blocks'
+
 # Colors (RGB)
 RED: Tuple[int, int, int] = (255, 0, 0)
 GREEN: Tuple[int, int, int] = (0, 255, 0)
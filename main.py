@@ -5,9 +5,19 @@ Handles event loop and coordinates between UI, algorithms, and maze generation.
 """
 
 import pygame
+from typing import List
+from blocks import block_state
+from blocks.block import Block
 from visualizer import PathfindingVisualizer, create_grid
-from algorithms import AStarPathfinder, DijkstraPathfinder
-from maze import WilsonMazeGenerator
+from algorithms import (
+    AStarPathfinder, DijkstraPathfinder, JumpPointSearchPathfinder,
+    BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder, DStarLitePathfinder,
+    HPAStarPathfinder
+)
+from config import constants
+from maze import MAZE_GENERATORS, MazePool, create_maze_generator
+from playback import Playback
+from search_worker import SEARCH_DONE, SearchWorker
 
 
 class PathfindingApp:
@@ -23,22 +33,48 @@ class PathfindingApp:
 
         self.algorithms = {
             'astar': ('A*', AStarPathfinder()),
-            'dijkstra': ('Dijkstra', DijkstraPathfinder())
+            'dijkstra': ('Dijkstra', DijkstraPathfinder()),
+            'jps': ('JPS', JumpPointSearchPathfinder()),
+            'bi_astar': ('Bidirectional A*', BidirectionalAStarPathfinder()),
+            'bi_dijkstra': ('Bidirectional Dijkstra', BidirectionalDijkstraPathfinder()),
+            'dstar': ('D* Lite', DStarLitePathfinder()),
+            'hpa': ('HPA*', HPAStarPathfinder())
         }
         self.current_algorithm = 'astar'
 
-        self.maze_generator = WilsonMazeGenerator()
+        self.maze_kind = 'wilson'
+        self.maze_generator = create_maze_generator(self.maze_kind)
+        self.maze_pool = MazePool(constants.ROWS, kind=self.maze_kind)
+        self.visualizer.maze_name = self.maze_kind.title()
         self.running = True
 
         self.is_dragging = False
         self.drag_mode = None
 
+        # Blocks edited since the last run, for incremental pathfinders
+        self.changed_blocks: List[Block] = []
+
+        # Searches run in the background; their cell updates are played back a frame at a time
+        self.search_worker = SearchWorker()
+        self.search_job = None
+        self.playback = Playback()
+
+        # Set whenever something on screen may have changed; frames are only drawn while it is
+        self.dirty = True
+
     def get_algorithm_name(self) -> str:
         """Get display name of current algorithm."""
         return self.algorithms[self.current_algorithm][0]
 
     def get_next_action(self) -> str:
-        """Get description of what next click will do."""
+        """Get description of what next click will do, or of the search or playback while one runs."""
+        if self.playback.active and self.playback.paused:
+            return f"Paused ({self.playback.remaining} left)"
+        if self.search_job is not None:
+            return f"Searching... {self.search_job.expanded} cells {self.playback.speed:g}x"
+        if self.playback.active:
+            phase = "Path Found!" if self.playback.last_code == block_state.PATH_CODE else "Searching..."
+            return f"{phase} {self.playback.speed:g}x"
         if not self.start_block:
             return "Place Start"
         elif not self.end_block:
@@ -46,38 +82,94 @@ class PathfindingApp:
         else:
             return "Place Barriers"
 
+    def is_animating(self) -> bool:
+        """True while a search runs or its playback is playing (not paused)."""
+        return self.search_job is not None or (self.playback.active and not self.playback.paused)
+
     def run(self) -> None:
-        """Main event loop."""
+        """
+        Main event loop.
+
+        While a search runs or plays back, frames are drawn at up to FPS and
+        events are polled between them. Each frame plays back the cell
+        updates the running search has sent so far. Otherwise the loop sleeps in
+        pygame.event.wait until an event arrives, and only draws again once
+        an event has marked the screen dirty.
+        """
         while self.running:
-            self.visualizer.draw_grid(self.grid, self.get_algorithm_name(), self.get_next_action())
-            self._handle_events()
-
+            animating = self.is_animating()
+            if animating:
+                self._advance_playback()
+                self.dirty = True
+
+            if self.dirty:
+                self.dirty = False
+                self.visualizer.draw_grid(self.grid, self.get_algorithm_name(), self.get_next_action())
+                self.visualizer.clock.tick(constants.FPS)
+
+            if animating:
+                self._handle_events(pygame.event.get())
+            else:
+                self._handle_events([pygame.event.wait()] + pygame.event.get())
+
+        self.search_worker.close()
+        self.maze_pool.close()
         pygame.quit()
 
-    def _handle_events(self) -> None:
-        """Process pygame events."""
-        for event in pygame.event.get():
+    def _advance_playback(self) -> None:
+        """Take the updates the running search has sent so far, then apply one frame of playback."""
+        if self.search_job is not None:
+            self.playback.extend(self.search_job.take_updates())
+        self.playback.advance()
+
+    def _handle_events(self, events: List[pygame.event.Event]) -> None:
+        """
+        Process a batch of pygame events.
+
+        Consecutive MOUSEMOTION events are merged: the drag is applied once
+        at the end of the run of motions (drags read the current mouse
+        position, so nothing is lost), before any other event is handled.
+        """
+        moved = False
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                moved = True
+                continue
+            if moved:
+                self._handle_mouse_drag()
+                moved = False
+            if event.type != pygame.NOEVENT:
+                self.dirty = True
+
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.visualizer.invalidate()
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self._handle_mouse_down(event.button)
 
             elif event.type == pygame.MOUSEBUTTONUP:
                 self._handle_mouse_up(event.button)
 
-            elif event.type == pygame.MOUSEMOTION:
-                self._handle_mouse_drag()
-
             elif event.type == pygame.KEYDOWN:
                 self._handle_keypress(event.key)
 
+            elif event.type == SEARCH_DONE:
+                self._handle_search_done(event)
+
+        if moved:
+            self._handle_mouse_drag()
+
     def _handle_mouse_down(self, button: int) -> None:
         """Handle mouse button press."""
         block = self.visualizer.get_clicked_block(self.grid)
         if not block:
             return
 
+        self.changed_blocks.append(block)
+
         if button == 1:  # Left click
             if not self.start_block and block != self.end_block:
                 block.set_start()
@@ -114,10 +206,12 @@ class PathfindingApp:
         block = self.visualizer.get_clicked_block(self.grid)
         if not block:
             return
+        self.dirty = True
 
         if self.drag_mode == 'barrier':
             if block != self.start_block and block != self.end_block:
                 block.set_barrier()
+                self.changed_blocks.append(block)
 
         elif self.drag_mode == 'erase':
             if block == self.start_block:
@@ -125,6 +219,7 @@ class PathfindingApp:
             if block == self.end_block:
                 self.end_block = None
             block.reset()
+            self.changed_blocks.append(block)
 
     def _handle_keypress(self, key: int) -> None:
         """Handle keyboard inputs."""
@@ -137,47 +232,117 @@ class PathfindingApp:
         elif key == pygame.K_m:
             self._generate_maze()
 
+        elif key == pygame.K_g:
+            self._next_maze_generator()
+
+        elif key == pygame.K_x:
+            self._cancel_search()
+
+        elif key == pygame.K_p:
+            self.playback.toggle_pause()
+
+        elif key == pygame.K_RIGHT:
+            self.playback.paused = True
+            self.playback.step()
+
+        elif key == pygame.K_UP:
+            self.playback.faster()
+
+        elif key == pygame.K_DOWN:
+            self.playback.slower()
+
+        elif key == pygame.K_RETURN:
+            self.playback.skip()
+
         elif key == pygame.K_1:
             self.current_algorithm = 'astar'
 
         elif key == pygame.K_2:
             self.current_algorithm = 'dijkstra'
 
+        elif key == pygame.K_3:
+            self.current_algorithm = 'jps'
+
+        elif key == pygame.K_4:
+            self.current_algorithm = 'bi_astar'
+
+        elif key == pygame.K_5:
+            self.current_algorithm = 'bi_dijkstra'
+
+        elif key == pygame.K_6:
+            self.current_algorithm = 'dstar'
+
+        elif key == pygame.K_7:
+            self.current_algorithm = 'hpa'
+
         elif key == pygame.K_ESCAPE:
             self.running = False
 
     def _run_algorithm(self) -> None:
-        """Execute selected pathfinding algorithm."""
+        """Start the selected pathfinding algorithm in the background; its search plays back as it runs."""
         if not self.start_block or not self.end_block:
             return
 
-        for row in self.grid:
-            for block in row:
-                block.update_neighbors(self.grid)
+        # A new run replaces the one still searching or playing
+        self._cancel_search()
+        self.grid[0][0].graph.clear_search_states()
 
         _, algorithm = self.algorithms[self.current_algorithm]
-        result = algorithm.find_path(self.grid, self.start_block, self.end_block)
-
-        self.visualizer.animate_search(self.grid, result.visited, self.start_block,
-                                       self.end_block, self.get_algorithm_name())
-
-        if result.found:
-            self.visualizer.animate_path(self.grid, result.path, self.start_block,
-                                         self.end_block, self.get_algorithm_name())
+        pathfinders = [pathfinder for _, pathfinder in self.algorithms.values()]
+        self.search_job = self.search_worker.submit(algorithm, self.grid, self.start_block, self.end_block,
+                                                    self.changed_blocks, pathfinders)
+        self.changed_blocks = []
+        self.playback.begin()
+
+    def _handle_search_done(self, event: pygame.event.Event) -> None:
+        """End the playback stream of a finished search, unless it was cancelled or replaced in the meantime."""
+        if event.job is not self.search_job or event.job.cancelled:
+            return
+        self.search_job = None
+        if event.error is not None:
+            self.playback.clear()
+            raise event.error
+        self.playback.extend(event.job.take_updates())
+        self.playback.finish()
+
+    def _cancel_search(self) -> None:
+        """Stop the running search and any playback."""
+        self.search_worker.cancel()
+        self.search_job = None
+        self.playback.clear()
 
     def _clear_grid(self) -> None:
         """Reset grid to empty state."""
         self.start_block = None
         self.end_block = None
+        self.changed_blocks = []
+        self._cancel_search()
         self.grid = create_grid()
 
+    def _next_maze_generator(self) -> None:
+        """Switch to the next generator in MAZE_GENERATORS."""
+        kinds = list(MAZE_GENERATORS)
+        self.maze_kind = kinds[(kinds.index(self.maze_kind) + 1) % len(kinds)]
+        self.maze_generator = create_maze_generator(self.maze_kind)
+        self.maze_pool.close()
+        self.maze_pool = MazePool(constants.ROWS, kind=self.maze_kind)
+        self.visualizer.maze_name = self.maze_kind.title()
+
     def _generate_maze(self) -> None:
-        """Generate maze using Wilson's algorithm."""
+        """Swap in a pre-generated maze, generating one here only while the pool is still warming up."""
         self.start_block = None
         self.end_block = None
+        self.changed_blocks = []
+        self._cancel_search()
         self.grid = create_grid()
-        self.maze_generator.clear()
-        self.maze_generator.generate(self.grid)
+
+        maze = self.maze_pool.take()
+        if maze is None:
+            self.maze_generator.clear()
+            self.maze_generator.generate(self.grid)
+        else:
+            _, walkable = maze
+            self.grid[0][0].graph.load_walkable(walkable)
 
 
 def main():
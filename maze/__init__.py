@@ -1,5 +1,15 @@
 """Maze generation algorithms package."""
 
+from maze.base_generator import MazeGenerator
 from maze.wilson_maze import WilsonMazeGenerator
+from maze.eller_maze import EllerMazeGenerator
+from maze.backtracker_maze import RecursiveBacktrackerMazeGenerator
+from maze.kruskal_maze import KruskalMazeGenerator
+from maze.prim_maze import PrimMazeGenerator
+from maze.registry import MAZE_GENERATORS, create_maze_generator
+from maze.pool import MazePool
+from maze.tree_index import MazeTreeIndex
 
-__all__ = ['WilsonMazeGenerator']
\ No newline at end of file
+__all__ = ['MazeGenerator', 'WilsonMazeGenerator', 'EllerMazeGenerator', 'RecursiveBacktrackerMazeGenerator',
+           'KruskalMazeGenerator', 'PrimMazeGenerator', 'MAZE_GENERATORS', 'create_maze_generator', 'MazePool',
+           'MazeTreeIndex']
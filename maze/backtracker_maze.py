@@ -0,0 +1,61 @@
+"""
+Recursive-backtracker (randomized depth-first search) maze generation.
+
+Walks from a random cell into random unvisited neighbours, carving as it
+goes, and backtracks when stuck. The recursion is replaced by an explicit
+stack of grid ids, and each cell keeps a mask of its still-unvisited
+neighbours, so choosing the next step is one table lookup. Produces long,
+winding corridors with few dead ends.
+"""
+
+import random
+from array import array
+from typing import Optional
+from maze.base_generator import MazeGenerator, DIRECTION_CHOICES, REJECT, cell_directions, random_bytes
+
+
+class RecursiveBacktrackerMazeGenerator(MazeGenerator):
+    """Generates perfect mazes by iterative randomized depth-first search."""
+
+    def carve(self, rows: int, cols: int, rng: Optional[random.Random] = None) -> bytearray:
+        if rng is None:
+            rng = random
+        walkable = bytearray(rows * cols)
+        if not rows or not cols:
+            return walkable
+
+        steps = (2 * cols, -2 * cols, 2, -2)
+        wall_steps = (cols, -cols, 1, -1)
+        valid = cell_directions(rows, cols)
+        # Directions from each cell to neighbours not yet in the maze
+        unvisited = bytearray(valid)
+        next_byte = random_bytes(rng)
+
+        def visit(cell: int) -> None:
+            walkable[cell] = 1
+            directions = valid[cell]
+            for direction in range(4):
+                if directions >> direction & 1:
+                    # Opposite directions differ in the lowest bit (down/up, right/left)
+                    unvisited[cell + steps[direction]] &= ~(1 << (direction ^ 1))
+
+        start = 2 * rng.randrange((rows + 1) // 2) * cols + 2 * rng.randrange((cols + 1) // 2)
+        visit(start)
+        stack = array('i', [start])
+
+        while stack:
+            cell = stack[-1]
+            mask = unvisited[cell]
+            if not mask:
+                stack.pop()
+                continue
+
+            direction = DIRECTION_CHOICES[next_byte() << 4 | mask]
+            while direction == REJECT:
+                direction = DIRECTION_CHOICES[next_byte() << 4 | mask]
+            walkable[cell + wall_steps[direction]] = 1
+            neighbor = cell + steps[direction]
+            visit(neighbor)
+            stack.append(neighbor)
+
+        return walkable
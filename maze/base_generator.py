@@ -0,0 +1,102 @@
+"""
+Base class and shared helpers for perfect-maze generators.
+
+Every generator carves the same layout: maze cells on even (row, col)
+positions and walls in between, returned as a flat occupancy bytearray
+(1 walkable, 0 barrier) in GridGraph.walkable order. generate() applies
+that occupancy to a Block grid or a GridGraph.
+"""
+
+import itertools
+import random
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Union
+from blocks.block import Block
+from blocks.grid_graph import GridGraph
+
+# Random bytes drawn per refill by random_bytes
+_RANDOM_CHUNK = 1 << 16
+
+# Direction codes: down, up, right, left (GridGraph mask bit = 1 << direction)
+REJECT = 4
+
+
+def _build_choices() -> bytes:
+    """
+    Direction table indexed by (random byte << 4 | direction mask).
+
+    Each byte maps uniformly onto the directions set in the mask; the few
+    bytes left over when 256 is not a multiple of their count map to REJECT
+    and are redrawn, so no direction is favoured.
+    """
+    table = bytearray([REJECT]) * (256 * 16)
+    for mask in range(16):
+        directions = [direction for direction in range(4) if mask >> direction & 1]
+        if not directions:
+            continue
+        usable = 256 - 256 % len(directions)
+        for byte in range(usable):
+            table[byte << 4 | mask] = directions[byte % len(directions)]
+    return bytes(table)
+
+
+DIRECTION_CHOICES = _build_choices()
+
+
+def random_bytes(rng: random.Random) -> Callable[[], int]:
+    """Return a function giving an endless stream of random bytes from rng."""
+    chunks = iter(lambda: rng.randbytes(_RANDOM_CHUNK), None)
+    return itertools.chain.from_iterable(chunks).__next__
+
+
+def cell_directions(rows: int, cols: int) -> bytearray:
+    """
+    Per-block masks of the directions a maze cell can move in.
+
+    Bit d of ``valid[id]`` is set when the maze cell at grid id has another
+    maze cell two blocks away in direction d; non-cell blocks are 0.
+    """
+    row_valid = bytearray(cols)
+    for col in range(0, cols, 2):
+        row_valid[col] = 15 & ~(4 if col + 2 >= cols else 0) & ~(8 if col == 0 else 0)
+    valid = bytearray(rows * cols)
+    for row in range(0, rows, 2):
+        cleared = (1 if row + 2 >= rows else 0) | (2 if row == 0 else 0)
+        table = bytes(bits & ~cleared for bits in range(256))
+        valid[row * cols:(row + 1) * cols] = row_valid.translate(table)
+    return valid
+
+
+class MazeGenerator(ABC):
+    """Abstract base class for perfect-maze generators."""
+
+    @abstractmethod
+    def carve(self, rows: int, cols: int, rng: Optional[random.Random] = None) -> bytearray:
+        """Return the occupancy of a rows x cols maze, drawing from rng (the random module if None)."""
+        pass
+
+    def generate(self, grid: Union[List[List[Block]], GridGraph], seed: Optional[int] = None) -> None:
+        """
+        Fill a Block grid or GridGraph with a maze.
+
+        Args:
+            grid: 2D list of blocks, or a GridGraph whose occupancy is replaced
+            seed: Seed for a private random generator; None uses the random module
+        """
+        rng = random if seed is None else random.Random(seed)
+        if isinstance(grid, GridGraph):
+            grid.load_walkable(self.carve(grid.rows, grid.cols, rng))
+            return
+
+        rows = len(grid)
+        cols = len(grid[0]) if grid else 0
+        walkable = self.carve(rows, cols, rng)
+        for row in grid:
+            for block in row:
+                block.reset()
+                if not walkable[block.row * cols + block.col]:
+                    block.set_barrier()
+
+    def clear(self) -> None:
+        """Reset generator state."""
+        pass
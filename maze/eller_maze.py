@@ -0,0 +1,124 @@
+"""
+Eller's Algorithm for streaming maze generation.
+
+Builds a perfect maze one row at a time, keeping only the set labels of
+the current row, so memory is O(width) however tall the maze gets. Each
+row randomly joins neighbouring cells of different sets, then every set
+extends at least one passage downwards; the final row joins all sets left.
+
+Uses the same layout as WilsonMazeGenerator: maze cells on even
+(row, col) positions, walls in between. Rows are produced as bytearrays
+of walkability (1 walkable, 0 barrier), the GridGraph.walkable format.
+Output is fully determined by the seed, so any row range can be
+regenerated by replaying from the top.
+"""
+
+import random
+from itertools import islice
+from typing import BinaryIO, Dict, Iterator, List, Optional
+from maze.base_generator import MazeGenerator
+
+
+class EllerMazeGenerator(MazeGenerator):
+    """Generates perfect mazes row by row using Eller's algorithm."""
+
+    def iter_rows(self, cols: int, seed: Optional[int] = None, *, rows: Optional[int] = None,
+                  start: int = 0) -> Iterator[bytearray]:
+        """
+        Yield the grid rows of a maze cols blocks wide.
+
+        The height is keyword-only, so a (rows, cols) call cannot silently
+        transpose the maze.
+
+        Args:
+            cols: Width in blocks
+            seed: Seed of the maze; None picks a random one
+            rows: Height in blocks; None streams an endless maze
+            start: First row to yield. There are no checkpoints: rows 0..start
+                are always regenerated and discarded, so this costs as much as
+                streaming from the top
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        rows_out = self._rows(cols, random.Random(seed), rows)
+        return islice(rows_out, start, None)
+
+    def _rows(self, cols: int, rng: random.Random, rows: Optional[int]) -> Iterator[bytearray]:
+        cell_cols = (cols + 1) // 2
+        cell_rows = None if rows is None else (rows + 1) // 2
+        if not cell_cols or cell_rows == 0:
+            return
+
+        labels = list(range(cell_cols))
+        members: Dict[int, List[int]] = {label: [label] for label in labels}
+        next_label = cell_cols
+        cell_row = 0
+
+        while True:
+            last = cell_rows is not None and cell_row == cell_rows - 1
+
+            # Join neighbouring cells of different sets; the last row joins all of them
+            row = bytearray(cols)
+            row[::2] = b'\x01' * cell_cols
+            joins = rng.getrandbits(cell_cols)
+            for col in range(cell_cols - 1):
+                keep, merge = labels[col], labels[col + 1]
+                if keep == merge or not (last or joins >> col & 1):
+                    continue
+                if len(members[keep]) < len(members[merge]):
+                    keep, merge = merge, keep
+                for member in members[merge]:
+                    labels[member] = keep
+                members[keep].extend(members.pop(merge))
+                row[2 * col + 1] = 1
+            yield row
+
+            if last:
+                if 2 * cell_row + 1 < rows:
+                    yield bytearray(cols)
+                return
+
+            # Every set carries on downwards through at least one of its cells
+            down = bytearray(cell_cols)
+            drops = rng.getrandbits(cell_cols)
+            for cells in members.values():
+                chosen = [col for col in cells if drops >> col & 1]
+                if not chosen:
+                    chosen = [cells[rng.randrange(len(cells))]]
+                for col in chosen:
+                    down[col] = 1
+
+            wall_row = bytearray(cols)
+            wall_row[::2] = down
+            yield wall_row
+
+            # Cells below a passage keep their set; the rest start new ones
+            members = {}
+            for col in range(cell_cols):
+                if not down[col]:
+                    labels[col] = next_label
+                    next_label += 1
+                members.setdefault(labels[col], []).append(col)
+            cell_row += 1
+
+    def carve(self, rows: int, cols: int, rng: Optional[random.Random] = None) -> bytearray:
+        """Collect a whole rows x cols maze into one occupancy array."""
+        walkable = bytearray()
+        for row in self._rows(cols, random if rng is None else rng, rows):
+            walkable += row
+        return walkable
+
+    def write(self, file: BinaryIO, rows: int, cols: int, seed: Optional[int] = None, start: int = 0) -> int:
+        """
+        Stream rows start..rows of a rows x cols maze to a binary file, one byte per block.
+
+        Returns the number of rows written. The bytes are GridGraph.walkable
+        rows, so ``GridGraph(rows - start, cols, walkable=data)`` loads them.
+        As with iter_rows, rows before start are regenerated from row 0 and
+        discarded.
+        """
+        written = 0
+        for row in self.iter_rows(cols, seed, rows=rows, start=start):
+            file.write(row)
+            written += 1
+        return written
@@ -0,0 +1,66 @@
+"""
+Randomized Kruskal maze generation.
+
+Shuffles every wall between two maze cells and removes a wall whenever
+the cells on either side are not yet connected. Connectivity is tracked
+by an array-backed union-find with union by size and path halving, so
+the whole maze costs one shuffle plus near O(1) work per wall. Produces
+many short dead ends.
+"""
+
+import random
+from array import array
+from typing import Optional
+from maze.base_generator import MazeGenerator
+
+
+class KruskalMazeGenerator(MazeGenerator):
+    """Generates perfect mazes with randomized Kruskal's algorithm."""
+
+    def carve(self, rows: int, cols: int, rng: Optional[random.Random] = None) -> bytearray:
+        if rng is None:
+            rng = random
+        walkable = bytearray(rows * cols)
+        cell_rows, cell_cols = (rows + 1) // 2, (cols + 1) // 2
+        count = cell_rows * cell_cols
+        if not count:
+            return walkable
+
+        # Every maze cell ends up walkable; only walls need choosing
+        for row in range(0, rows, 2):
+            walkable[row * cols:(row + 1) * cols:2] = b'\x01' * cell_cols
+
+        # Edge 2k joins cell k to its right neighbour, edge 2k + 1 to the one below
+        edges = [2 * cell for cell in range(count) if cell % cell_cols < cell_cols - 1]
+        edges += [2 * cell + 1 for cell in range(count - cell_cols)]
+        rng.shuffle(edges)
+
+        parent = array('i', range(count))
+        size = array('i', [1]) * count
+        unions = 0
+
+        for edge in edges:
+            cell = edge >> 1
+            a, b = cell, cell + (cell_cols if edge & 1 else 1)
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+
+            row, col = divmod(cell, cell_cols)
+            block = 2 * row * cols + 2 * col
+            walkable[block + (cols if edge & 1 else 1)] = 1
+            unions += 1
+            if unions == count - 1:
+                break
+
+        return walkable
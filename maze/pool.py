@@ -0,0 +1,91 @@
+"""
+Pool of pre-generated mazes.
+
+MazePool keeps a fixed number of mazes in flight in a background worker
+process, so a new maze can be swapped in without generating it on the
+spot. Mazes travel as occupancy bytes (GridGraph.walkable format) and each
+one has its own seed, so any maze handed out can be regenerated exactly.
+"""
+
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Optional, Tuple
+from maze.registry import create_maze_generator
+
+# (seed, occupancy) of a generated maze
+Maze = Tuple[int, bytes]
+
+
+def _carve(kind: str, rows: int, cols: int, seed: int) -> Maze:
+    return seed, bytes(create_maze_generator(kind).carve(rows, cols, random.Random(seed)))
+
+
+class MazePool:
+    """
+    Keeps ``size`` rows x cols mazes ready, refilled in the background.
+
+    Args:
+        rows: Maze height in blocks
+        cols: Maze width in blocks (defaults to rows)
+        kind: Generator key in MAZE_GENERATORS
+        size: Number of mazes kept ready or being generated
+        seed: Seed of the first maze; later mazes use the following seeds.
+            None starts from a random seed.
+        workers: Number of background processes
+    """
+
+    def __init__(self, rows: int, cols: Optional[int] = None, kind: str = 'wilson', size: int = 4,
+                 seed: Optional[int] = None, workers: int = 1):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        create_maze_generator(kind)  # Reject unknown kinds here rather than in the worker
+
+        self.rows = rows
+        self.cols = rows if cols is None else cols
+        self.kind = kind
+        self.size = size
+        self._next_seed = random.getrandbits(32) if seed is None else seed
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._pending: Deque[Future] = deque()
+        self._fill()
+
+    def _fill(self) -> None:
+        """Queue generation jobs until size mazes are ready or in flight."""
+        while len(self._pending) < self.size:
+            self._pending.append(self._executor.submit(_carve, self.kind, self.rows, self.cols, self._next_seed))
+            self._next_seed += 1
+
+    def ready(self) -> int:
+        """Number of mazes that can be taken without waiting."""
+        return sum(1 for future in self._pending if future.done())
+
+    def take(self, wait: bool = False) -> Optional[Maze]:
+        """
+        Hand out the oldest ready maze as (seed, occupancy) and queue a replacement.
+
+        Returns None when no maze is ready yet, unless wait is set, in which
+        case it blocks until the oldest one is done.
+        """
+        for future in self._pending:
+            if future.done():
+                break
+        else:
+            if not wait or not self._pending:
+                return None
+            future = self._pending[0]
+
+        self._pending.remove(future)
+        self._fill()
+        return future.result()
+
+    def close(self) -> None:
+        """Stop the background worker, dropping mazes not yet handed out; a maze mid-generation is finished first."""
+        self._pending.clear()
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> 'MazePool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
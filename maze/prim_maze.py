@@ -0,0 +1,67 @@
+"""
+Randomized Prim maze generation.
+
+Grows the maze from a random cell: a random frontier cell (one next to
+the maze) is joined to a random maze neighbour, and its own unvisited
+neighbours join the frontier. The frontier is an array with O(1) random
+pick and swap-pop removal. Produces short, branching corridors that
+radiate from the start.
+"""
+
+import random
+from array import array
+from typing import Optional
+from maze.base_generator import MazeGenerator, DIRECTION_CHOICES, REJECT, cell_directions, random_bytes
+
+
+class PrimMazeGenerator(MazeGenerator):
+    """Generates perfect mazes with randomized Prim's algorithm."""
+
+    def carve(self, rows: int, cols: int, rng: Optional[random.Random] = None) -> bytearray:
+        if rng is None:
+            rng = random
+        walkable = bytearray(rows * cols)
+        if not rows or not cols:
+            return walkable
+
+        steps = (2 * cols, -2 * cols, 2, -2)
+        wall_steps = (cols, -cols, 1, -1)
+        valid = cell_directions(rows, cols)
+        # Directions from each cell to neighbours already in the maze
+        in_maze = bytearray(rows * cols)
+        queued = bytearray(rows * cols)
+        frontier = array('i')
+        next_byte = random_bytes(rng)
+        randrange = rng.randrange
+
+        def add(cell: int) -> None:
+            walkable[cell] = 1
+            directions = valid[cell]
+            for direction in range(4):
+                if directions >> direction & 1:
+                    neighbor = cell + steps[direction]
+                    # Opposite directions differ in the lowest bit (down/up, right/left)
+                    in_maze[neighbor] |= 1 << (direction ^ 1)
+                    if not queued[neighbor]:
+                        queued[neighbor] = 1
+                        frontier.append(neighbor)
+
+        start = 2 * rng.randrange((rows + 1) // 2) * cols + 2 * rng.randrange((cols + 1) // 2)
+        queued[start] = 1
+        add(start)
+
+        while frontier:
+            slot = randrange(len(frontier))
+            cell = frontier[slot]
+            last = frontier.pop()
+            if slot < len(frontier):
+                frontier[slot] = last
+
+            mask = in_maze[cell]
+            direction = DIRECTION_CHOICES[next_byte() << 4 | mask]
+            while direction == REJECT:
+                direction = DIRECTION_CHOICES[next_byte() << 4 | mask]
+            walkable[cell + wall_steps[direction]] = 1
+            add(cell)
+
+        return walkable
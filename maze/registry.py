@@ -0,0 +1,35 @@
+"""
+Registry of maze generators.
+
+Every generator shares the MazeGenerator interface, generate(grid, seed),
+and can be picked by key from MAZE_GENERATORS:
+- 'wilson':      Wilson's algorithm, uniform over all perfect mazes
+- 'eller':       Eller's algorithm, streamed row by row
+- 'backtracker': iterative recursive backtracker, long winding corridors
+- 'kruskal':     randomized Kruskal with union-find, many short dead ends
+- 'prim':        randomized Prim, branches radiating from the start
+"""
+
+from typing import Dict, Type
+from maze.base_generator import MazeGenerator
+from maze.wilson_maze import WilsonMazeGenerator
+from maze.eller_maze import EllerMazeGenerator
+from maze.backtracker_maze import RecursiveBacktrackerMazeGenerator
+from maze.kruskal_maze import KruskalMazeGenerator
+from maze.prim_maze import PrimMazeGenerator
+
+MAZE_GENERATORS: Dict[str, Type[MazeGenerator]] = {
+    'wilson': WilsonMazeGenerator,
+    'eller': EllerMazeGenerator,
+    'backtracker': RecursiveBacktrackerMazeGenerator,
+    'kruskal': KruskalMazeGenerator,
+    'prim': PrimMazeGenerator,
+}
+
+
+def create_maze_generator(kind: str) -> MazeGenerator:
+    """Instantiate a maze generator by key."""
+    try:
+        return MAZE_GENERATORS[kind]()
+    except KeyError:
+        raise ValueError(f"Unknown maze generator '{kind}', expected one of {sorted(MAZE_GENERATORS)}") from None
@@ -0,0 +1,167 @@
+"""
+Tree index for answering path queries on perfect mazes without searching.
+
+A perfect maze is a spanning tree of its walkable cells, so every pair of
+cells is joined by exactly one path. MazeTreeIndex roots the tree once,
+records depths and an Euler tour, and answers lowest-common-ancestor
+queries with a sparse table over fixed-size blocks of the tour:
+- distance(a, b): O(1)
+- path(a, b):     O(path length)
+"""
+
+from array import array
+from typing import List, Optional, Union
+from blocks.block import Block
+from blocks.grid_graph import GridGraph
+
+# Euler tour positions per block of the range-minimum structure
+_BLOCK_SIZE = 16
+
+
+class MazeTreeIndex:
+    """
+    LCA index over the walkable cells of a perfect maze.
+
+    Disconnected mazes (forests) are supported; each component gets its own
+    root and queries across components return None. Mazes with cycles are
+    rejected because paths would no longer be unique.
+    """
+
+    def __init__(self, grid: Union[List[List[Block]], GridGraph], root: Optional[int] = None):
+        graph = grid if isinstance(grid, GridGraph) else GridGraph.from_blocks(grid, attach=False)
+        self.graph = graph
+
+        size = graph.size
+        self.parent = array('i', [-1]) * size
+        self.depth = array('i', [0]) * size
+        self.component = array('i', [-1]) * size
+        self.first = array('i', [-1]) * size
+        self.euler = array('i')
+
+        roots = range(size) if root is None else [root] + list(range(size))
+        components = 0
+        for cell in roots:
+            if graph.walkable[cell] and self.component[cell] == -1:
+                self._build_tree(cell, components)
+                components += 1
+        self.components = components
+
+        self._build_sparse_table()
+
+    def _build_tree(self, root: int, component: int) -> None:
+        """Iterative DFS recording parents, depths and the Euler tour."""
+        graph = self.graph
+        parent, depth, first, euler = self.parent, self.depth, self.first, self.euler
+
+        self.component[root] = component
+        first[root] = len(euler)
+        euler.append(root)
+        stack = [(root, iter(graph.neighbors(root)))]
+
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor == parent[node]:
+                    continue
+                if self.component[neighbor] != -1:
+                    raise ValueError(f"Grid is not a perfect maze: cycle through cell {neighbor}")
+                self.component[neighbor] = component
+                parent[neighbor] = node
+                depth[neighbor] = depth[node] + 1
+                first[neighbor] = len(euler)
+                euler.append(neighbor)
+                stack.append((neighbor, iter(graph.neighbors(neighbor))))
+                break
+            else:
+                stack.pop()
+                if stack:
+                    euler.append(stack[-1][0])
+
+    def _shallower(self, a: int, b: int) -> int:
+        return a if self.depth[a] <= self.depth[b] else b
+
+    def _build_sparse_table(self) -> None:
+        """Sparse table of the shallowest node in each run of 2^k tour blocks."""
+        euler = self.euler
+        block_min = array('i')
+        for start in range(0, len(euler), _BLOCK_SIZE):
+            best = euler[start]
+            for node in euler[start + 1:start + _BLOCK_SIZE]:
+                best = self._shallower(best, node)
+            block_min.append(best)
+
+        self._table: List[array] = [block_min]
+        span = 1
+        while span * 2 <= len(block_min):
+            previous = self._table[-1]
+            level = array('i', (self._shallower(previous[i], previous[i + span])
+                                for i in range(len(block_min) - span * 2 + 1)))
+            self._table.append(level)
+            span *= 2
+
+    def _scan(self, lo: int, hi: int) -> int:
+        """Shallowest node in euler[lo:hi + 1] by linear scan (at most one block)."""
+        euler = self.euler
+        best = euler[lo]
+        for position in range(lo + 1, hi + 1):
+            best = self._shallower(best, euler[position])
+        return best
+
+    def _range_min(self, lo: int, hi: int) -> int:
+        lo_block, hi_block = lo // _BLOCK_SIZE, hi // _BLOCK_SIZE
+        if lo_block == hi_block:
+            return self._scan(lo, hi)
+
+        best = self._shallower(self._scan(lo, (lo_block + 1) * _BLOCK_SIZE - 1),
+                               self._scan(hi_block * _BLOCK_SIZE, hi))
+        if hi_block - lo_block > 1:
+            first_block, last_block = lo_block + 1, hi_block - 1
+            level = (last_block - first_block + 1).bit_length() - 1
+            table = self._table[level]
+            best = self._shallower(best, self._shallower(table[first_block],
+                                                         table[last_block - (1 << level) + 1]))
+        return best
+
+    def connected(self, a: int, b: int) -> bool:
+        """Are both cells walkable and in the same component?"""
+        return self.component[a] != -1 and self.component[a] == self.component[b]
+
+    def lca(self, a: int, b: int) -> Optional[int]:
+        """Lowest common ancestor of two cells, or None if they are not connected."""
+        if not self.connected(a, b):
+            return None
+        lo, hi = sorted((self.first[a], self.first[b]))
+        return self._range_min(lo, hi)
+
+    def distance(self, a: int, b: int) -> Optional[int]:
+        """Number of steps between two cells, or None if they are not connected."""
+        ancestor = self.lca(a, b)
+        if ancestor is None:
+            return None
+        return self.depth[a] + self.depth[b] - 2 * self.depth[ancestor]
+
+    def path(self, a: int, b: int) -> Optional[List[int]]:
+        """
+        The unique path from a to b, or None if they are not connected.
+
+        Like pathfinder results, the path excludes a and includes b.
+        """
+        ancestor = self.lca(a, b)
+        if ancestor is None:
+            return None
+
+        parent = self.parent
+        up = []
+        node = a
+        while node != ancestor:
+            node = parent[node]
+            up.append(node)
+
+        down = []
+        node = b
+        while node != ancestor:
+            down.append(node)
+            node = parent[node]
+
+        down.reverse()
+        return up + down
@@ -3,182 +3,96 @@ Wilson's Algorithm for unbiased maze generation.
 
 Generates mazes by performing loop-erased random walks.
 Every possible maze has equal probability of being generated.
+
+Maze cells sit on even (row, col) positions; the blocks between two
+cells are walls that get carved open when the cells are joined. The
+result is a perfect maze: walkable blocks form a spanning tree.
+
+Generation runs on a flat occupancy array, so it scales to grids with
+millions of blocks:
+- unvisited cells live in an array with O(1) random pick and swap-pop
+  removal; cells carved by another walk are dropped when picked
+- a walk records only the direction it last left each cell by; following
+  those directions from the start gives the walk with every loop erased
 """
 
 import random
-from typing import List
-from blocks.block import Block
+from array import array
+from typing import List, Optional
+from maze.base_generator import MazeGenerator, DIRECTION_CHOICES, REJECT, cell_directions, random_bytes
 
 
-class WilsonMazeGenerator:
+class WilsonMazeGenerator(MazeGenerator):
     """Generates perfect mazes using Wilson's algorithm."""
 
     def __init__(self):
-        self.path: List[Block] = []
+        # Grid cell ids of the most recently carved walk
+        self.path: List[int] = []
 
-    def generate(self, grid: List[List[Block]]) -> None:
+    def carve(self, rows: int, cols: int, rng: Optional[random.Random] = None) -> bytearray:
         """
-        Generate maze by carving paths and adding barriers.
+        Carve a rows x cols maze from loop-erased random walks.
 
         Process:
-        1. Mark all blocks as closed (unvisited)
-        2. Pick random target, set to empty
-        3. Start from random closed block, walk until hitting empty
-        4. Add barriers around path
-        5. Repeat until no closed blocks remain
+        1. Add a random maze cell to the maze
+        2. Walk randomly from a random unvisited cell until the maze is hit,
+           remembering the last exit direction of every cell on the way
+        3. Carve the loop-erased walk (cells and the walls between them)
+        4. Repeat until no unvisited cells remain
         """
-        # Initialize all blocks as closed (unvisited)
-        for row in grid:
-            for block in row:
-                block.set_closed()
-
-        unvisited = self._get_unvisited_blocks(grid)
-
+        if rng is None:
+            rng = random
+        walkable = bytearray(rows * cols)
+        self.path = []
+        if not rows or not cols:
+            return walkable
+
+        # Steps to the next maze cell and to the wall in between: down, up, right, left.
+        # The walk runs on grid ids directly, and a cell is in the maze once it is walkable.
+        steps = (2 * cols, -2 * cols, 2, -2)
+        wall_steps = (cols, -cols, 1, -1)
+
+        valid = cell_directions(rows, cols)
+        exit_direction = bytearray(rows * cols)
+        unvisited = array('i', (row * cols + col for row in range(0, rows, 2) for col in range(0, cols, 2)))
+
+        root = unvisited[rng.randrange(len(unvisited))]
+        walkable[root] = 1
+
+        next_byte = random_bytes(rng)
+        randrange = rng.randrange
         while unvisited:
-            # Pick random target from closed blocks and set to empty
-            target = random.choice(unvisited)
-            target.reset()
-
-            # Update unvisited after setting target
-            unvisited = self._get_unvisited_blocks(grid)
-            if not unvisited:
-                break
-
-            # Start walk from random unvisited block
-            current = random.choice(unvisited)
-            path, reached = self._random_walk(grid, current, target)
-
-            # If target was not reached, convert it back to closed
-            if not reached and target.is_empty():
-                target.set_closed()
-
-            # Add barriers around path (only on closed neighbors)
-            self._add_barriers_around_path(grid, path)
-
-            unvisited = self._get_unvisited_blocks(grid)
-
-        # Convert any remaining closed blocks to barriers
-        for row in grid:
-            for block in row:
-                if block.is_closed():
-                    block.set_barrier()
-
-    def _random_walk(self, grid: List[List[Block]], start: Block, target: Block) -> tuple:
-        """
-        Perform loop-erased random walk and return the path and whether target was reached.
-
-        Returns:
-            (path, reached): path is list of blocks, reached is True if we hit an empty block
-        """
-        self.path = [start]
-        current = start
-        reached = False
-
-        steps = 0
-        max_steps = len(grid) * 3  # Safety limit
-
-        # Walk until we hit an empty block
-        while True:
-            steps += 1
-            if steps > max_steps:
-                break
-
-            neighbors = self._get_closed_neighbors(grid, current)
-            if not neighbors:
-                # No more closed blocks to walk through
-                # Check if we're adjacent to an empty block (reached target)
-                empty_neighbors = self._get_empty_neighbors(grid, current)
-                if empty_neighbors:
-                    reached = True
-                break
-
-            next_block = random.choice(neighbors)
-
-            if next_block in self.path:
-                # Loop detected - erase it by resetting back to closed
-                loop_index = self.path.index(next_block)
-                for block in self.path[loop_index + 1:]:
-                    # Only set back to closed if it's currently empty
-                    if block.is_empty():
-                        block.set_closed()
-                self.path = self.path[:loop_index + 1]
-                current = next_block
-            else:
-                # Add to path and mark as empty
-                next_block.reset()
-                self.path.append(next_block)
-                current = next_block
-
-        return self.path.copy(), reached
-
-    def _add_barriers_around_path(self, grid: List[List[Block]], path: List[Block]) -> None:
-        """Add barriers around the path by converting closed neighbors to barriers."""
-        for block in path:
-            neighbors = self._get_closed_neighbors(grid, block)
-            for neighbor in neighbors:
-                neighbor.set_barrier()
-
-    def _get_closed_neighbors(self, grid: List[List[Block]], block: Block) -> List[Block]:
-        """Get neighbors that are closed (unvisited only)."""
-        neighbors = []
-        row, col = block.get_position()
-        total_rows = len(grid)
-        total_cols = len(grid[0]) if grid else 0
-
-        if row > 0:
-            neighbor = grid[row - 1][col]
-            if neighbor.is_closed():
-                neighbors.append(neighbor)
-        if row < total_rows - 1:
-            neighbor = grid[row + 1][col]
-            if neighbor.is_closed():
-                neighbors.append(neighbor)
-        if col > 0:
-            neighbor = grid[row][col - 1]
-            if neighbor.is_closed():
-                neighbors.append(neighbor)
-        if col < total_cols - 1:
-            neighbor = grid[row][col + 1]
-            if neighbor.is_closed():
-                neighbors.append(neighbor)
-
-        return neighbors
-
-    def _get_empty_neighbors(self, grid: List[List[Block]], block: Block) -> List[Block]:
-        """Get neighbors that are empty."""
-        neighbors = []
-        row, col = block.get_position()
-        total_rows = len(grid)
-        total_cols = len(grid[0]) if grid else 0
-
-        if row > 0:
-            neighbor = grid[row - 1][col]
-            if neighbor.is_empty():
-                neighbors.append(neighbor)
-        if row < total_rows - 1:
-            neighbor = grid[row + 1][col]
-            if neighbor.is_empty():
-                neighbors.append(neighbor)
-        if col > 0:
-            neighbor = grid[row][col - 1]
-            if neighbor.is_empty():
-                neighbors.append(neighbor)
-        if col < total_cols - 1:
-            neighbor = grid[row][col + 1]
-            if neighbor.is_empty():
-                neighbors.append(neighbor)
-
-        return neighbors
-
-    def _get_unvisited_blocks(self, grid: List[List[Block]]) -> List[Block]:
-        """Get blocks that are still closed (unvisited). Only closed blocks count."""
-        unvisited = []
-        for row in grid:
-            for block in row:
-                if block.is_closed():
-                    unvisited.append(block)
-        return unvisited
+            # Swap-pop a random unvisited cell; cells carved since they were added are skipped here
+            slot = randrange(len(unvisited))
+            start = unvisited[slot]
+            last = unvisited.pop()
+            if slot < len(unvisited):
+                unvisited[slot] = last
+            if walkable[start]:
+                continue
+
+            # Random walk; revisiting a cell overwrites its exit, erasing the loop
+            cell = start
+            while not walkable[cell]:
+                direction = DIRECTION_CHOICES[next_byte() << 4 | valid[cell]]
+                if direction != REJECT:
+                    exit_direction[cell] = direction
+                    cell += steps[direction]
+
+            # Follow the exits from start to carve the loop-erased walk
+            path = []
+            cell = start
+            while not walkable[cell]:
+                walkable[cell] = 1
+                direction = exit_direction[cell]
+                walkable[cell + wall_steps[direction]] = 1
+                path.append(cell)
+                cell += steps[direction]
+            path.append(cell)
+            self.path = path
+
+        return walkable
 
     def clear(self) -> None:
         """Reset generator state."""
-        self.path.clear()
\ No newline at end of file
+        self.path.clear()
@@ -0,0 +1,170 @@
+"""
+Frame-budgeted playback of search animations.
+
+A search becomes a queue of cell updates (the open, closed and path
+cells it produced, in order). Playback applies as many of them per frame
+as the speed allows, so at 1x any search plays back in about
+PLAYBACK_SECONDS, however many cells it touched. Playback can be paused,
+stepped one update at a time, sped up or slowed down, and skipped to the
+end.
+
+Updates can arrive while the search is still running: begin() opens a
+stream, extend() appends whatever has arrived, and finish() marks the
+end. The per-frame budget is based on the updates received so far, so
+playback starts on the first batch and keeps pace as more arrive.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Tuple
+from blocks import block_state
+from blocks.block import Block
+from config import constants
+from algorithms.base_pathfinder import Node, PathfindingResult, SearchEvent, BACKWARD, OPEN, EXPAND, DONE
+
+# (block, state code) applied with Block.set_state, so invalid transitions are skipped
+Update = Tuple[Block, int]
+
+SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+
+
+def event_updates(event: SearchEvent, start: Node, end: Node) -> List[Tuple[Node, int]]:
+    """
+    Cell updates for one search event: the opened or expanded cell, or the
+    path once the search is DONE. Start and end are never updated.
+    """
+    if event.kind == DONE:
+        result = event.payload
+        if not result.found:
+            return []
+        return [(node, block_state.PATH_CODE) for node in result.path if node != start and node != end]
+
+    node = event.payload
+    if node == start or node == end:
+        return []
+    if event.kind == OPEN:
+        return [(node, block_state.OPEN_CODE)]
+    if event.kind == EXPAND:
+        return [(node, block_state.BACKWARD_CLOSED_CODE if event.side == BACKWARD else block_state.CLOSED_CODE)]
+    return []
+
+
+def record_search(events: Iterable[SearchEvent], start: Node,
+                  end: Node) -> Tuple[List[Tuple[Node, int]], Optional[PathfindingResult]]:
+    """
+    Run a search event stream to completion, recording its cell updates.
+
+    For tests and headless callers; the application streams updates into
+    Playback as they arrive instead. Returns the updates (opened and
+    expanded cells, then the path) and the search result, or None if the
+    stream ended without a DONE event. Nodes are whatever the search
+    yields: Blocks, or cell ids for a GridGraph.
+    """
+    updates: List[Tuple[Node, int]] = []
+    for event in events:
+        updates.extend(event_updates(event, start, end))
+        if event.kind == DONE:
+            return updates, event.payload
+    return updates, None
+
+
+class Playback:
+    """
+    Applies queued cell updates a frame's worth at a time.
+
+    Args:
+        fps: Frames per second the caller advances at
+        seconds: Playback duration at 1x speed
+    """
+
+    def __init__(self, fps: int = constants.FPS, seconds: float = constants.PLAYBACK_SECONDS):
+        self.fps = fps
+        self.seconds = seconds
+        self.speed_index = SPEEDS.index(1.0)
+        self.paused = False
+        # Updates received for the current run, and whether more may still arrive
+        self.total = 0
+        self.streaming = False
+        self.last_code: Optional[int] = None
+        self._pending: Deque[Update] = deque()
+
+    @property
+    def speed(self) -> float:
+        return SPEEDS[self.speed_index]
+
+    @property
+    def active(self) -> bool:
+        """True while updates are waiting to be applied or more are still expected."""
+        return bool(self._pending) or self.streaming
+
+    @property
+    def remaining(self) -> int:
+        """Updates received but not applied yet."""
+        return len(self._pending)
+
+    def begin(self) -> None:
+        """Drop any pending updates and start a new stream; extend() feeds it and finish() ends it."""
+        self._pending = deque()
+        self.total = 0
+        self.streaming = True
+        self.last_code = None
+        self.paused = False
+
+    def extend(self, updates: Iterable[Update]) -> None:
+        """Queue updates that arrived for the current stream."""
+        pending = self._pending
+        before = len(pending)
+        pending.extend(updates)
+        self.total += len(pending) - before
+
+    def finish(self) -> None:
+        """Mark the current stream complete; playback ends once its pending updates are applied."""
+        self.streaming = False
+
+    def load(self, updates: Iterable[Update]) -> None:
+        """Replace any pending updates with a complete recording and start playing it."""
+        self.begin()
+        self.extend(updates)
+        self.finish()
+
+    def clear(self) -> None:
+        """Drop pending updates without applying them and end the stream."""
+        self._pending.clear()
+        self.streaming = False
+
+    def per_frame(self) -> int:
+        """Updates applied per frame at the current speed, scaled to the updates received so far; at least one."""
+        return max(1, math.ceil(self.total * self.speed / (self.seconds * self.fps)))
+
+    def advance(self) -> int:
+        """Apply one frame's worth of updates unless paused; returns how many were applied."""
+        if self.paused:
+            return 0
+        return self._apply(self.per_frame())
+
+    def step(self) -> int:
+        """Apply a single update, paused or not."""
+        return self._apply(1)
+
+    def skip(self) -> int:
+        """Apply every pending update at once."""
+        return self._apply(len(self._pending))
+
+    def toggle_pause(self) -> None:
+        self.paused = not self.paused
+
+    def faster(self) -> None:
+        self.speed_index = min(self.speed_index + 1, len(SPEEDS) - 1)
+
+    def slower(self) -> None:
+        self.speed_index = max(self.speed_index - 1, 0)
+
+    def _apply(self, count: int) -> int:
+        pending = self._pending
+        count = min(count, len(pending))
+        states = block_state.STATES
+        for _ in range(count):
+            block, code = pending.popleft()
+            block.set_state(states[code])
+            self.last_code = code
+        return count
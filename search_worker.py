@@ -0,0 +1,174 @@
+"""
+Background searches for the application.
+
+SearchWorker runs pathfinders on a single worker thread, so the event
+loop keeps drawing and handling input while a search runs. Each search
+works on a snapshot of the grid: the live occupancy is copied when the
+search is submitted and loaded into a detached GridGraph owned by the
+worker. The snapshot graph is kept for as long as the live grid is, so
+incremental pathfinders (D* Lite, HPA*) still reuse their state between
+runs. Pathfinders are only ever touched from the worker thread.
+
+Cell updates stream back while the search runs: the worker batches the
+events of find_path_iter and hands a batch to the job's thread-safe
+queue about once a frame, where the event loop picks them up with
+SearchJob.take_updates(). When the search ends, the last batch is queued
+and a SEARCH_DONE event carrying the job and result is posted; it only
+marks the end of the stream. A newer submission or cancel() marks the
+running job cancelled; streaming pathfinders stop at their next event,
+the others finish and their result is dropped.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pygame
+from blocks.block import Block
+from blocks.grid_graph import GridGraph
+from algorithms.base_pathfinder import BasePathfinder, PathfindingResult, SearchEvent, EXPAND, DONE
+from config import constants
+from playback import Update, event_updates
+
+# Posted when a search finishes; attributes job, result and error
+SEARCH_DONE = pygame.event.custom_type()
+
+
+class SearchJob:
+    """A submitted search: its progress, cancel flag and future."""
+
+    def __init__(self, run_id: int):
+        self.run_id = run_id
+        # Cells expanded so far, written by the worker and read by the UI
+        self.expanded = 0
+        self.future: Optional[Future] = None
+        self._cancelled = threading.Event()
+        # Batches of cell updates sent by the worker and not taken yet
+        self._updates: 'queue.SimpleQueue[List[Update]]' = queue.SimpleQueue()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def send(self, updates: List[Update]) -> None:
+        """Queue a batch of cell updates; called from the worker thread."""
+        self._updates.put(updates)
+
+    def take_updates(self) -> List[Update]:
+        """Every update sent so far and not taken yet, in order."""
+        updates: List[Update] = []
+        try:
+            while True:
+                updates.extend(self._updates.get_nowait())
+        except queue.Empty:
+            return updates
+
+    def __repr__(self) -> str:
+        return f"SearchJob({self.run_id}, expanded={self.expanded}, cancelled={self.cancelled})"
+
+
+class SearchWorker:
+    """Runs one search at a time on a background thread; a new submission cancels the previous one."""
+
+    def __init__(self, flush_seconds: float = 1 / constants.FPS):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # How long the worker collects updates before sending a batch
+        self.flush_seconds = flush_seconds
+        self._job: Optional[SearchJob] = None
+        self._next_id = 0
+        # Snapshot graph and the live Block grid it mirrors; only used on the worker thread
+        self._graph: Optional[GridGraph] = None
+        self._source: Optional[List[List[Block]]] = None
+
+    def submit(self, pathfinder: BasePathfinder, grid: List[List[Block]], start: Block, end: Block,
+               changed: Iterable[Block] = (), notify: Sequence[BasePathfinder] = ()) -> SearchJob:
+        """
+        Start searching grid from start to end in the background.
+
+        Args:
+            pathfinder: Pathfinder to run
+            grid: Live Block grid attached to a GridGraph; its occupancy is copied now
+            start: Start block
+            end: Goal block
+            changed: Blocks edited since the last run, passed to notify_changed
+            notify: Pathfinders told about the changed cells before searching
+        """
+        self.cancel()
+        graph = grid[0][0].graph
+        job = SearchJob(self._next_id)
+        self._next_id += 1
+        job.future = self._executor.submit(
+            self._search, job, pathfinder, grid, bytes(graph.walkable),
+            start.index, end.index, [block.index for block in changed], list(notify)
+        )
+        self._job = job
+        return job
+
+    def cancel(self) -> None:
+        """Cancel the running search, if any; its result will not be posted."""
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+
+    def close(self) -> None:
+        """Cancel the running search and stop the worker thread."""
+        self.cancel()
+        self._executor.shutdown(cancel_futures=True)
+
+    def _search(self, job: SearchJob, pathfinder: BasePathfinder, grid: List[List[Block]], walkable: bytes,
+                start: int, end: int, changed: List[int], notify: List[BasePathfinder]) -> None:
+        try:
+            # Edits reach incremental pathfinders even if this job never searches
+            for other in notify:
+                other.notify_changed(changed)
+            if job.cancelled:
+                return
+            graph = self._snapshot(grid, walkable)
+            result = self._stream(job, grid, pathfinder.find_path_iter(graph, start, end), start, end)
+            if job.cancelled:
+                return
+            error = None
+        except Exception as exc:
+            result, error = None, exc
+        pygame.event.post(pygame.event.Event(SEARCH_DONE, job=job, result=result, error=error))
+
+    def _stream(self, job: SearchJob, grid: List[List[Block]], events: Iterator[SearchEvent],
+                start: int, end: int) -> Optional[PathfindingResult]:
+        """Send the search's cell updates to the job in timed batches and return its result."""
+        cols = len(grid[0])
+        result = None
+        batch: List[Tuple[int, int]] = []
+        flush_at = time.perf_counter() + self.flush_seconds
+        for event in self._track(job, events):
+            if event.kind == DONE:
+                result = event.payload
+            batch.extend(event_updates(event, start, end))
+            if batch and (event.kind == DONE or time.perf_counter() >= flush_at):
+                job.send([(grid[cell // cols][cell % cols], code) for cell, code in batch])
+                batch = []
+                flush_at = time.perf_counter() + self.flush_seconds
+        return result
+
+    def _snapshot(self, grid: List[List[Block]], walkable: bytes) -> GridGraph:
+        """Load the submitted occupancy into the snapshot graph, starting a new one for a new grid."""
+        if grid is not self._source:
+            self._source = grid
+            self._graph = GridGraph(len(grid), len(grid[0]), walkable)
+        else:
+            self._graph.load_walkable(walkable)
+        return self._graph
+
+    @staticmethod
+    def _track(job: SearchJob, events: Iterator[SearchEvent]) -> Iterator[SearchEvent]:
+        """Count expansions into job.expanded and stop the stream once the job is cancelled."""
+        for event in events:
+            if job.cancelled:
+                return
+            if event.kind == EXPAND:
+                job.expanded += 1
+            yield event
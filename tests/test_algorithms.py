@@ -1,9 +1,19 @@
 """Tests for pathfinding algorithms."""
 
+import random
+from array import array
+
 import pytest
 from blocks.block import Block
-from algorithms import AStarPathfinder, DijkstraPathfinder, BasePathfinder
-from algorithms.base_pathfinder import PathfindingResult
+from blocks.grid_graph import GridGraph
+from algorithms import AStarPathfinder, DijkstraPathfinder, BasePathfinder, JumpPointSearchPathfinder
+from algorithms import BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder, DStarLitePathfinder
+from algorithms import HPAStarPathfinder, find_paths_batch
+from algorithms.base_pathfinder import PathfindingResult, SearchEvent, SearchTrace, FORWARD, BACKWARD, OPEN, EXPAND, DONE
+from algorithms.landmarks import LandmarkTable
+from algorithms.workspace import SearchWorkspace
+from algorithms.open_list import OPEN_LISTS, create_open_list, RadixHeapOpenList
+from maze import WilsonMazeGenerator
 
 
 class TestPathfindingResult:
@@ -20,6 +30,17 @@ class TestPathfindingResult:
         assert not result.found
         assert result.get_path_length() == 0
 
+    def test_trace_backed_result_is_lazy(self):
+        trace = SearchTrace(3, array('i', [1, 2]), array('i', [1, 2]), array('i', [0, 1]), array('i', [0, 1]))
+        result = PathfindingResult.from_trace(trace, expanded=2)
+
+        assert result.found
+        assert result.get_path_length() == 2
+        assert result._path is None  # Nothing materialized yet
+        assert result.path == [1, 2]
+        assert result.came_from == {1: 0, 2: 1}
+        assert result.visited == [0, 1]
+
 
 class TestBasePathfinder:
     """Test base pathfinder utilities."""
@@ -329,6 +350,905 @@ class TestComplexScenarios:
 
         assert result1.get_path_length() == result2.get_path_length()
 
+
+class TestGridGraphSearch:
+    """Test pathfinders searching a GridGraph directly."""
+
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    def test_path_as_cell_indices(self, pathfinder_class):
+        graph = GridGraph(5)
+        start = graph.index(0, 0)
+        end = graph.index(0, 4)
+
+        result = pathfinder_class().find_path(graph, start, end)
+
+        assert result.found
+        assert result.path == [1, 2, 3, 4]
+
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    def test_path_around_barrier(self, pathfinder_class):
+        graph = GridGraph(5)
+        for i in range(4):
+            graph.set_walkable(graph.index(i, 2), False)
+
+        result = pathfinder_class().find_path(graph, graph.index(0, 0), graph.index(0, 4))
+
+        assert result.found
+        assert result.get_path_length() == 12
+        assert all(graph.is_walkable(cell) for cell in result.path)
+
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    def test_no_path_available(self, pathfinder_class):
+        graph = GridGraph(5)
+        for i in range(5):
+            graph.set_walkable(graph.index(i, 2), False)
+
+        result = pathfinder_class().find_path(graph, graph.index(0, 0), graph.index(0, 4))
+
+        assert not result.found
+
+    def test_matches_block_grid_search(self):
+        grid = TestAStarPathfinder().create_grid(8)
+        for i in range(6):
+            grid[i][3].set_barrier()
+        graph = GridGraph.from_blocks(grid)
+        for row in grid:
+            for block in row:
+                block.update_neighbors(grid)
+
+        block_result = AStarPathfinder().find_path(grid, grid[0][0], grid[7][7])
+        graph_result = AStarPathfinder().find_path(graph, graph.index(0, 0), graph.index(7, 7))
+
+        assert [block.index for block in block_result.path] == graph_result.path
+        assert [block.index for block in block_result.visited] == graph_result.visited
+
+
+class TestOpenLists:
+    """Test open-list backends."""
+
+    @pytest.mark.parametrize("kind", sorted(OPEN_LISTS))
+    def test_pops_in_priority_order(self, kind):
+        open_list = create_open_list(kind)
+        for priority in [5, 3, 9, 3, 0, 7]:
+            open_list.push(priority, f"item{priority}")
+
+        priorities = []
+        while open_list:
+            priorities.append(int(open_list.pop()[4:]))
+
+        assert priorities == [0, 3, 3, 5, 7, 9]
+        assert len(open_list) == 0
+
+    @pytest.mark.parametrize("kind", ['heap', 'bucket'])
+    def test_ties_pop_in_insertion_order(self, kind):
+        open_list = create_open_list(kind)
+        for item in "abc":
+            open_list.push(2, item)
+        assert [open_list.pop() for _ in range(3)] == ['a', 'b', 'c']
+
+    @pytest.mark.parametrize("kind", sorted(OPEN_LISTS))
+    def test_interleaved_monotone_operations(self, kind):
+        open_list = create_open_list(kind)
+        open_list.push(4, 'a')
+        open_list.push(6, 'b')
+        assert open_list.pop() == 'a'
+        open_list.push(5, 'c')
+        open_list.push(4, 'd')
+        assert [open_list.pop() for _ in range(3)] == ['d', 'c', 'b']
+
+    @pytest.mark.parametrize("kind", sorted(OPEN_LISTS))
+    def test_peek_matches_next_pop(self, kind):
+        open_list = create_open_list(kind)
+        for priority in [5, 3, 9, 4]:
+            open_list.push(priority, f"item{priority}")
+
+        assert open_list.peek() == (3, 'item3')
+        assert len(open_list) == 4
+        assert open_list.pop() == 'item3'
+        assert open_list.peek() == (4, 'item4')
+
+    @pytest.mark.parametrize("kind", sorted(OPEN_LISTS))
+    def test_peek_empty_raises(self, kind):
+        with pytest.raises(IndexError):
+            create_open_list(kind).peek()
+
+    def test_radix_rejects_non_monotone_push(self):
+        open_list = RadixHeapOpenList()
+        open_list.push(10, 'a')
+        open_list.pop()
+        with pytest.raises(ValueError):
+            open_list.push(3, 'b')
+
+    def test_unknown_open_list_rejected(self):
+        with pytest.raises(ValueError):
+            AStarPathfinder(open_list='fibonacci')
+
+    @pytest.mark.parametrize("kind", sorted(OPEN_LISTS))
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    def test_backends_find_same_path_length(self, kind, pathfinder_class):
+        graph = GridGraph(12)
+        for i in range(10):
+            graph.set_walkable(graph.index(i, 4), False)
+            graph.set_walkable(graph.index(11 - i, 8), False)
+
+        reference = DijkstraPathfinder().find_path(graph, 0, graph.size - 1)
+        result = pathfinder_class(open_list=kind).find_path(graph, 0, graph.size - 1)
+
+        assert result.found
+        assert result.get_path_length() == reference.get_path_length()
+
+
+class TestJumpPointSearch:
+    """Test Jump Point Search on 4-connected grids."""
+
+    def create_grid(self, rows=5):
+        grid = []
+        for row in range(rows):
+            grid_row = []
+            for col in range(rows):
+                block = Block(row, col, width=16, total_rows=rows)
+                grid_row.append(block)
+            grid.append(grid_row)
+        return grid
+
+    def test_block_grid_path(self):
+        grid = self.create_grid(5)
+        for i in range(4):
+            grid[i][2].set_barrier()
+
+        result = JumpPointSearchPathfinder().find_path(grid, grid[0][0], grid[0][4])
+
+        assert result.found
+        assert result.get_path_length() == 12
+        assert result.path[-1] is grid[0][4]
+        for block in result.path:
+            assert not block.is_barrier()
+
+    def test_no_path_available(self):
+        graph = GridGraph(5)
+        for i in range(5):
+            graph.set_walkable(graph.index(i, 2), False)
+
+        result = JumpPointSearchPathfinder().find_path(graph, 0, 4)
+
+        assert not result.found
+
+    def test_start_equals_end(self):
+        graph = GridGraph(5)
+        result = JumpPointSearchPathfinder().find_path(graph, 12, 12)
+        assert result.found
+        assert result.get_path_length() == 0
+
+    def test_matches_astar_on_random_grids(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            rows, cols = rng.randint(1, 10), rng.randint(1, 10)
+            graph = GridGraph(rows, cols, bytes(rng.random() > 0.3 for _ in range(rows * cols)))
+            start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+            graph.set_walkable(start, True)
+            graph.set_walkable(end, True)
+
+            expected = AStarPathfinder().find_path(graph, start, end)
+            result = JumpPointSearchPathfinder().find_path(graph, start, end)
+
+            assert result.found == expected.found
+            assert result.get_path_length() == expected.get_path_length()
+            if result.found:
+                previous = start
+                for cell in result.path:
+                    assert graph.is_walkable(cell)
+                    assert cell in graph.neighbors(previous)
+                    previous = cell
+
+    def test_visits_only_jump_points_on_open_grid(self):
+        graph = GridGraph(40)
+        astar_result = AStarPathfinder().find_path(graph, 0, graph.size - 1)
+        jps_result = JumpPointSearchPathfinder().find_path(graph, 0, graph.size - 1)
+
+        assert jps_result.get_path_length() == astar_result.get_path_length()
+        assert len(jps_result.visited) * 10 < len(astar_result.visited)
+
+
+class TestBidirectionalPathfinders:
+    """Test bidirectional A* and Dijkstra."""
+
+    BIDIRECTIONAL = [BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder]
+
+    def create_grid(self, rows=5):
+        grid = []
+        for row in range(rows):
+            grid_row = []
+            for col in range(rows):
+                block = Block(row, col, width=16, total_rows=rows)
+                grid_row.append(block)
+            grid.append(grid_row)
+        return grid
+
+    @pytest.mark.parametrize("pathfinder_class", BIDIRECTIONAL)
+    def test_block_grid_path(self, pathfinder_class):
+        grid = self.create_grid(5)
+        for i in range(4):
+            grid[i][2].set_barrier()
+
+        result = pathfinder_class().find_path(grid, grid[0][0], grid[0][4])
+
+        assert result.found
+        assert result.get_path_length() == 12
+        assert result.path[-1] is grid[0][4]
+        assert pathfinder_class().reconstruct_path(result.came_from, grid[0][4]) == result.path
+
+    @pytest.mark.parametrize("pathfinder_class", BIDIRECTIONAL)
+    def test_no_path_available(self, pathfinder_class):
+        graph = GridGraph(5)
+        for i in range(5):
+            graph.set_walkable(graph.index(i, 2), False)
+
+        result = pathfinder_class().find_path(graph, 0, 4)
+
+        assert not result.found
+
+    @pytest.mark.parametrize("pathfinder_class", BIDIRECTIONAL)
+    def test_start_equals_end(self, pathfinder_class):
+        result = pathfinder_class().find_path(GridGraph(5), 7, 7)
+        assert result.found
+        assert result.get_path_length() == 0
+
+    @pytest.mark.parametrize("pathfinder_class", BIDIRECTIONAL)
+    def test_visited_tagged_by_side(self, pathfinder_class):
+        graph = GridGraph(10)
+        result = pathfinder_class().find_path(graph, 0, graph.size - 1)
+
+        assert len(result.visited_sides) == len(result.visited)
+        assert FORWARD in result.visited_sides
+        assert BACKWARD in result.visited_sides
+        assert result.visited[result.visited_sides.index(BACKWARD)] == graph.size - 1
+
+    @pytest.mark.parametrize("pathfinder_class", BIDIRECTIONAL)
+    def test_matches_dijkstra_on_random_grids(self, pathfinder_class):
+        rng = random.Random(5)
+        for _ in range(200):
+            rows, cols = rng.randint(1, 10), rng.randint(1, 10)
+            graph = GridGraph(rows, cols, bytes(rng.random() > 0.3 for _ in range(rows * cols)))
+            start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+            graph.set_walkable(start, True)
+            graph.set_walkable(end, True)
+
+            expected = DijkstraPathfinder().find_path(graph, start, end)
+            result = pathfinder_class().find_path(graph, start, end)
+
+            assert result.found == expected.found
+            assert result.get_path_length() == expected.get_path_length()
+
+    def test_bidirectional_dijkstra_expands_fewer_nodes(self):
+        graph = GridGraph(40)
+        start, end = graph.index(20, 2), graph.index(20, 37)
+
+        dijkstra_result = DijkstraPathfinder().find_path(graph, start, end)
+        bidirectional_result = BidirectionalDijkstraPathfinder().find_path(graph, start, end)
+
+        assert bidirectional_result.get_path_length() == dijkstra_result.get_path_length()
+        assert len(bidirectional_result.visited) < len(dijkstra_result.visited)
+
+    @pytest.mark.parametrize("open_list", ['bucket', 'radix'])
+    def test_integer_open_lists_match_heap(self, open_list):
+        rng = random.Random(11)
+        for _ in range(50):
+            graph = GridGraph(12, 12, bytes(rng.random() > 0.3 for _ in range(144)))
+            start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+            graph.set_walkable(start, True)
+            graph.set_walkable(end, True)
+
+            expected = BidirectionalAStarPathfinder().find_path(graph, start, end)
+            result = BidirectionalAStarPathfinder(open_list=open_list).find_path(graph, start, end)
+
+            assert result.get_path_length() == expected.get_path_length()
+
+    @pytest.mark.parametrize("one_sided_class, bidirectional_class, bound", [
+        (AStarPathfinder, BidirectionalAStarPathfinder, 0.85),
+        (DijkstraPathfinder, BidirectionalDijkstraPathfinder, 0.8),
+    ])
+    def test_bidirectional_expansions_bounded_on_mazes(self, one_sided_class, bidirectional_class, bound):
+        # Perfect mazes are trees, so the two half-length balls cover well over half the full ball
+        rng = random.Random(3)
+        one_sided_expanded = bidirectional_expanded = 0
+        for seed in range(10):
+            graph = GridGraph(101)
+            WilsonMazeGenerator().generate(graph, seed=seed)
+            cells = [cell for cell in range(graph.size) if graph.is_walkable(cell)]
+            start, end = rng.choice(cells), rng.choice(cells)
+
+            one_sided_result = one_sided_class().find_path(graph, start, end)
+            bidirectional_result = bidirectional_class().find_path(graph, start, end)
+
+            assert bidirectional_result.get_path_length() == one_sided_result.get_path_length()
+            one_sided_expanded += len(one_sided_result.visited)
+            bidirectional_expanded += len(bidirectional_result.visited)
+
+        assert bidirectional_expanded <= bound * one_sided_expanded
+
+    def test_bidirectional_dijkstra_halves_expansions_on_open_grid(self):
+        graph = GridGraph(101)
+        start, end = graph.index(50, 25), graph.index(50, 75)
+
+        dijkstra_result = DijkstraPathfinder().find_path(graph, start, end)
+        bidirectional_result = BidirectionalDijkstraPathfinder().find_path(graph, start, end)
+
+        assert bidirectional_result.get_path_length() == dijkstra_result.get_path_length()
+        assert len(bidirectional_result.visited) <= 0.6 * len(dijkstra_result.visited)
+
+
+class TestDStarLitePathfinder:
+    """Test D* Lite incremental replanning."""
+
+    def test_initial_plan_is_optimal(self):
+        graph = GridGraph(8)
+        for i in range(6):
+            graph.set_walkable(graph.index(i, 3), False)
+
+        result = DStarLitePathfinder().find_path(graph, graph.index(0, 0), graph.index(0, 7))
+        expected = DijkstraPathfinder().find_path(graph, graph.index(0, 0), graph.index(0, 7))
+
+        assert result.found
+        assert result.get_path_length() == expected.get_path_length()
+
+    def test_replan_after_blocking_path(self):
+        graph = GridGraph(30)
+        pathfinder = DStarLitePathfinder()
+        first = pathfinder.find_path(graph, 0, graph.size - 1)
+
+        blocked = first.path[len(first.path) // 2]
+        graph.set_walkable(blocked, False)
+        pathfinder.notify_changed([blocked])
+        second = pathfinder.find_path(graph, 0, graph.size - 1)
+
+        assert second.found
+        assert blocked not in second.path
+        assert second.get_path_length() == DijkstraPathfinder().find_path(graph, 0, graph.size - 1).get_path_length()
+        # Only the neighbourhood of the edit is repaired
+        assert len(second.visited) < len(first.visited) // 10
+
+    def test_replan_with_moved_start(self):
+        graph = GridGraph(10)
+        pathfinder = DStarLitePathfinder()
+        first = pathfinder.find_path(graph, 0, graph.size - 1)
+
+        new_start = first.path[2]
+        result = pathfinder.find_path(graph, new_start, graph.size - 1)
+
+        assert result.get_path_length() == first.get_path_length() - 3
+
+    def test_replan_detects_disconnection(self):
+        graph = GridGraph(5)
+        pathfinder = DStarLitePathfinder()
+        assert pathfinder.find_path(graph, 0, 4).found
+
+        wall = [graph.index(i, 2) for i in range(5)]
+        for cell in wall:
+            graph.set_walkable(cell, False)
+        pathfinder.notify_changed(wall)
+
+        assert not pathfinder.find_path(graph, 0, 4).found
+
+        graph.set_walkable(wall[3], True)
+        pathfinder.notify_changed([wall[3]])
+        assert pathfinder.find_path(graph, 0, 4).get_path_length() == 10
+
+    def test_random_edits_match_dijkstra(self):
+        rng = random.Random(11)
+        graph = GridGraph(9, 7, bytes(rng.random() > 0.25 for _ in range(63)))
+        start, end = 0, graph.size - 1
+        graph.set_walkable(start, True)
+        graph.set_walkable(end, True)
+        pathfinder = DStarLitePathfinder()
+
+        for _ in range(30):
+            result = pathfinder.find_path(graph, start, end)
+            expected = DijkstraPathfinder().find_path(graph, start, end)
+            assert result.get_path_length() == expected.get_path_length()
+
+            cell = rng.randrange(1, graph.size - 1)
+            graph.set_walkable(cell, not graph.is_walkable(cell))
+            pathfinder.notify_changed([cell])
+
+    def test_block_grid_with_attached_graph(self):
+        grid = TestAStarPathfinder().create_grid(6)
+        GridGraph.from_blocks(grid)
+        pathfinder = DStarLitePathfinder()
+        assert pathfinder.find_path(grid, grid[0][0], grid[0][5]).get_path_length() == 5
+
+        grid[0][3].set_barrier()
+        pathfinder.notify_changed([grid[0][3]])
+        result = pathfinder.find_path(grid, grid[0][0], grid[0][5])
+
+        assert result.get_path_length() == 7
+        assert grid[0][3] not in result.path
+
+    def test_stateless_pathfinders_ignore_changes(self):
+        pathfinder = AStarPathfinder()
+        pathfinder.notify_changed([1, 2, 3])
+        assert pathfinder.find_path(GridGraph(3), 0, 8).get_path_length() == 4
+
+
+class TestHPAStarPathfinder:
+    """Test hierarchical pathfinding over cached clusters."""
+
+    @staticmethod
+    def assert_valid_path(graph, start, end, path):
+        previous = start
+        for cell in path:
+            assert graph.is_walkable(cell)
+            assert cell in graph.neighbors(previous)
+            previous = cell
+        assert previous == end
+
+    def test_open_grid_path_is_optimal(self):
+        graph = GridGraph(20)
+        result = HPAStarPathfinder(cluster_size=5).find_path(graph, 0, graph.size - 1)
+
+        assert result.get_path_length() == 38
+        self.assert_valid_path(graph, 0, graph.size - 1, result.path)
+
+    def test_same_cluster_uses_local_path(self):
+        graph = GridGraph(20)
+        result = HPAStarPathfinder(cluster_size=10).find_path(graph, 0, graph.index(3, 3))
+
+        assert result.get_path_length() == 6
+
+    def test_block_grid(self):
+        grid = TestAStarPathfinder().create_grid(10)
+        for row in range(8):
+            grid[row][5].set_barrier()
+        for row in grid:
+            for block in row:
+                block.update_neighbors(grid)
+
+        result = HPAStarPathfinder(cluster_size=3).find_path(grid, grid[0][0], grid[0][9])
+
+        assert result.found
+        assert result.path[-1] == grid[0][9]
+        assert all(not block.is_barrier() for block in result.path)
+
+    def test_edits_invalidate_clusters(self):
+        graph = GridGraph(12)
+        pathfinder = HPAStarPathfinder(cluster_size=4)
+        first = pathfinder.find_path(graph, 0, graph.index(0, 11))
+        self.assert_valid_path(graph, 0, graph.index(0, 11), first.path)
+
+        wall = [graph.index(row, 5) for row in range(11)]
+        for cell in wall:
+            graph.set_walkable(cell, False)
+        result = pathfinder.find_path(graph, 0, graph.index(0, 11))
+
+        # The only gap is in the bottom row
+        self.assert_valid_path(graph, 0, graph.index(0, 11), result.path)
+        assert graph.index(11, 5) in result.path
+        assert result.get_path_length() >= 33
+
+    def test_repeated_query_reuses_refined_paths(self, monkeypatch):
+        rng = random.Random(9)
+        graph = GridGraph(300, 300, bytes(rng.random() > 0.2 for _ in range(300 * 300)))
+        start, end = graph.index(5, 5), graph.index(295, 295)
+        graph.set_walkable(start, True)
+        graph.set_walkable(end, True)
+        pathfinder = HPAStarPathfinder(cluster_size=10)
+        first = pathfinder.find_path(graph, start, end)
+
+        searches = []
+        local_bfs = pathfinder._local_bfs
+        monkeypatch.setattr(pathfinder, '_local_bfs', lambda *args: searches.append(args) or local_bfs(*args))
+        second = pathfinder.find_path(graph, start, end)
+
+        # Only start and end are connected to their clusters again; every entrance path comes from the cache
+        assert len(searches) == 2
+        assert second.path == first.path
+        self.assert_valid_path(graph, start, end, second.path)
+
+    def test_edit_rebuilds_only_nearby_clusters(self, monkeypatch):
+        rng = random.Random(9)
+        graph = GridGraph(300, 300, bytes(rng.random() > 0.2 for _ in range(300 * 300)))
+        start, end = graph.index(5, 5), graph.index(295, 295)
+        graph.set_walkable(start, True)
+        graph.set_walkable(end, True)
+        pathfinder = HPAStarPathfinder(cluster_size=10)
+        pathfinder.find_path(graph, start, end)
+
+        rebuilt = []
+        rebuild_cluster = pathfinder._rebuild_cluster
+        monkeypatch.setattr(pathfinder, '_rebuild_cluster',
+                            lambda cluster: rebuilt.append(cluster) or rebuild_cluster(cluster))
+        cell = graph.index(150, 150)
+        graph.set_walkable(cell, not graph.is_walkable(cell))
+        result = pathfinder.find_path(graph, start, end)
+
+        assert 1 <= len(rebuilt) <= 3
+        self.assert_valid_path(graph, start, end, result.path)
+
+    def test_switching_graphs_moves_listener(self):
+        first, second = GridGraph(8), GridGraph(8)
+        pathfinder = HPAStarPathfinder(cluster_size=4)
+        pathfinder.find_path(first, 0, first.size - 1)
+        pathfinder.find_path(second, 0, second.size - 1)
+        pathfinder.find_path(first, 0, first.size - 1)
+
+        assert first._listeners.count(pathfinder._on_walkable_changed) == 1
+        assert pathfinder._on_walkable_changed not in second._listeners
+
+    def test_random_grids_match_reachability(self):
+        rng = random.Random(5)
+        for _ in range(40):
+            rows, cols = rng.randint(2, 16), rng.randint(2, 16)
+            graph = GridGraph(rows, cols, bytes(rng.random() > 0.3 for _ in range(rows * cols)))
+            pathfinder = HPAStarPathfinder(cluster_size=rng.randint(2, 5))
+
+            for _ in range(5):
+                start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+                graph.set_walkable(start, True)
+                graph.set_walkable(end, True)
+                result = pathfinder.find_path(graph, start, end)
+                expected = DijkstraPathfinder().find_path(graph, start, end)
+
+                assert result.found == expected.found
+                if result.found:
+                    self.assert_valid_path(graph, start, end, result.path)
+                    assert result.get_path_length() >= expected.get_path_length()
+
+                cell = rng.randrange(graph.size)
+                graph.set_walkable(cell, not graph.is_walkable(cell))
+
+    def test_invalid_cluster_size(self):
+        with pytest.raises(ValueError):
+            HPAStarPathfinder(cluster_size=1)
+
+
+class TestLandmarks:
+    """Test ALT landmark tables and the landmark A* heuristic."""
+
+    def create_maze_graph(self):
+        # Serpentine corridor: Manhattan distance badly underestimates
+        graph = GridGraph(9)
+        for row in range(1, 9, 2):
+            for col in range(9):
+                graph.set_walkable(graph.index(row, col), False)
+            gap = 8 if row % 4 == 1 else 0
+            graph.set_walkable(graph.index(row, gap), True)
+        return graph
+
+    def test_lower_bound_is_admissible(self):
+        rng = random.Random(4)
+        graph = GridGraph(12, 12, bytes(rng.random() > 0.3 for _ in range(144)))
+        table = LandmarkTable.build(graph, 4)
+        dijkstra = DijkstraPathfinder()
+
+        for _ in range(50):
+            start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+            result = dijkstra.find_path(graph, start, end)
+            if result.found:
+                assert table.lower_bound(start, end) <= result.get_path_length()
+
+    def test_landmarks_are_spread_out(self):
+        table = LandmarkTable.build(GridGraph(10), 2)
+        assert sorted(table.landmarks) == [0, 99]
+
+    def test_paths_stay_optimal_and_expand_less(self):
+        rng = random.Random(8)
+        graph = GridGraph(30, 30, bytes(rng.random() > 0.35 for _ in range(900)))
+        plain, alt = AStarPathfinder(), AStarPathfinder(landmarks=8)
+        plain_expanded = alt_expanded = 0
+
+        for _ in range(20):
+            start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+            plain_result, alt_result = plain.find_path(graph, start, end), alt.find_path(graph, start, end)
+            assert alt_result.get_path_length() == plain_result.get_path_length()
+            plain_expanded += len(plain_result.visited)
+            alt_expanded += len(alt_result.visited)
+
+        assert alt_expanded < plain_expanded
+
+    def test_table_cached_until_map_changes(self):
+        graph = self.create_maze_graph()
+        pathfinder = AStarPathfinder(landmarks=2)
+        pathfinder.find_path(graph, 0, 8)
+        table = pathfinder.landmarks
+
+        pathfinder.find_path(graph, 0, graph.index(8, 8))
+        assert pathfinder.landmarks is table
+
+        graph.set_walkable(graph.index(1, 8), False)
+        graph.set_walkable(graph.index(1, 0), True)
+        result = pathfinder.find_path(graph, 0, graph.index(8, 0))
+
+        assert pathfinder.landmarks is not table
+        assert result.get_path_length() == DijkstraPathfinder().find_path(graph, 0, graph.index(8, 0)).get_path_length()
+
+    def test_block_grid(self):
+        grid = TestAStarPathfinder().create_grid(6)
+        grid[2][2].set_barrier()
+        for row in grid:
+            for block in row:
+                block.update_neighbors(grid)
+
+        result = AStarPathfinder(landmarks=3).find_path(grid, grid[0][0], grid[5][5])
+
+        assert result.get_path_length() == 10
+        assert result.path[-1] == grid[5][5]
+
+    def test_save_and_load(self, tmp_path):
+        graph = self.create_maze_graph()
+        table = LandmarkTable.build(graph, 3)
+        path = str(tmp_path / "maze.alt")
+        table.save(path)
+
+        loaded = LandmarkTable.load(path, graph)
+
+        assert loaded.landmarks == table.landmarks
+        assert loaded.distances == table.distances
+        assert AStarPathfinder(landmarks=loaded).find_path(graph, 0, graph.index(8, 0)).found
+
+    def test_load_rejects_other_map(self, tmp_path):
+        graph = self.create_maze_graph()
+        path = str(tmp_path / "maze.alt")
+        LandmarkTable.build(graph, 2).save(path)
+
+        graph.set_walkable(graph.index(0, 4), False)
+        with pytest.raises(ValueError):
+            LandmarkTable.load(path, graph)
+
+    def test_invalid_landmark_count(self):
+        with pytest.raises(ValueError):
+            AStarPathfinder(landmarks=0)
+
+
+class TestStreamingSearch:
+    """Test find_path_iter event streams."""
+
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    def test_events_match_find_path(self, pathfinder_class):
+        graph = GridGraph(6)
+        graph.set_walkable(graph.index(2, 2), False)
+        expected = pathfinder_class().find_path(graph, 0, graph.size - 1)
+
+        events = list(pathfinder_class().find_path_iter(graph, 0, graph.size - 1))
+
+        assert events[-1].kind == DONE
+        assert events[-1].payload.path == expected.path
+        assert [event.payload for event in events if event.kind == EXPAND] == expected.visited
+        assert any(event.kind == OPEN for event in events)
+
+    def test_visited_not_stored_unless_requested(self):
+        graph = GridGraph(6)
+        pathfinder = AStarPathfinder()
+
+        assert BasePathfinder.drain(pathfinder.find_path_iter(graph, 0, 35)).visited == []
+        assert BasePathfinder.drain(pathfinder.find_path_iter(graph, 0, 35, trace='full')).visited
+
+    def test_stop_early(self):
+        graph = GridGraph(50)
+        events = DijkstraPathfinder().find_path_iter(graph, 0, graph.size - 1)
+
+        first = [next(events) for _ in range(5)]
+        events.close()
+
+        assert all(event.kind != DONE for event in first)
+        assert list(events) == []
+
+    def test_first_event_arrives_before_search_finishes(self):
+        events = DijkstraPathfinder().find_path_iter(GridGraph(50), 0, 2499)
+        assert next(events) == SearchEvent(EXPAND, 0)
+
+    def test_unreachable_yields_only_result(self):
+        graph = GridGraph(3)
+        for row in range(3):
+            graph.set_walkable(graph.index(row, 1), False)
+
+        events = list(AStarPathfinder().find_path_iter(graph, 0, 2))
+
+        assert len(events) == 1
+        assert events[0].kind == DONE and not events[0].payload.found
+
+    def test_non_streaming_pathfinders_replay_with_sides(self):
+        graph = GridGraph(5)
+        expected = BidirectionalAStarPathfinder().find_path(graph, 0, 24)
+
+        events = list(BidirectionalAStarPathfinder().find_path_iter(graph, 0, 24))
+        expansions = [event for event in events if event.kind == EXPAND]
+
+        assert [event.payload for event in expansions] == expected.visited
+        assert [event.side for event in expansions] == expected.visited_sides
+        assert events[-1].payload.path == expected.path
+
+
+class TestTraceLevels:
+    """Test the none / summary / full trace levels of find_path."""
+
+    # D* Lite and HPA* keep incremental state and search for themselves
+    ALL_PATHFINDERS = [AStarPathfinder, DijkstraPathfinder, JumpPointSearchPathfinder,
+                       BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder]
+
+    @pytest.mark.parametrize("pathfinder_class", ALL_PATHFINDERS)
+    def test_levels_keep_same_path(self, pathfinder_class):
+        graph = GridGraph(8)
+        graph.set_walkable(graph.index(3, 3), False)
+        full = pathfinder_class().find_path(graph, 0, graph.size - 1, trace='full')
+        summary = pathfinder_class().find_path(graph, 0, graph.size - 1, trace='summary')
+        none = pathfinder_class().find_path(graph, 0, graph.size - 1, trace='none')
+
+        assert full.path == summary.path == none.path
+        assert summary.expanded == full.expanded == len(full.visited)
+        assert summary.came_from == {} and summary.visited == []
+        assert none.expanded is None and none.came_from == {} and none.visited == []
+
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    def test_array_backed_search_keeps_no_maps(self, pathfinder_class):
+        graph = GridGraph(10)
+        result = pathfinder_class().find_path(graph, 0, 99, trace='none')
+
+        assert result._trace.reached is None and result._trace.visit_log is None
+        assert len(result._trace.path_cells) == 18
+
+    def test_full_trace_views_blocks(self):
+        grid = TestAStarPathfinder().create_grid(4)
+        result = AStarPathfinder().find_path(grid, grid[0][0], grid[3][3], trace='full')
+
+        assert result.path[-1] is grid[3][3]
+        assert result.came_from[grid[3][3]] is result.path[-2]
+        assert all(isinstance(block, Block) for block in result.visited)
+
+    def test_unknown_trace_level(self):
+        with pytest.raises(ValueError):
+            AStarPathfinder().find_path(GridGraph(3), 0, 8, trace='verbose')
+
+
+class TestSearchWorkspace:
+    """Test generation-stamped workspace reuse across queries."""
+
+    def test_begin_reuses_arrays(self):
+        workspace = SearchWorkspace(10)
+        g_score = workspace.g_score
+
+        assert workspace.begin(10) == 1
+        assert workspace.begin(10) == 2
+        assert workspace.g_score is g_score
+
+    def test_begin_reallocates_on_resize_and_wraparound(self):
+        workspace = SearchWorkspace(10)
+        workspace.begin(10)
+
+        workspace.begin(20)
+        assert len(workspace.seen) == 20
+
+        workspace.generation = 2 ** 32 - 1
+        assert workspace.begin(20) == 1
+        assert max(workspace.seen) == 0
+
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    def test_repeated_queries_match_fresh_pathfinders(self, pathfinder_class):
+        rng = random.Random(9)
+        graph = GridGraph(12, 12, bytes(rng.random() > 0.3 for _ in range(144)))
+        pathfinder = pathfinder_class()
+
+        for _ in range(40):
+            start, end = rng.randrange(graph.size), rng.randrange(graph.size)
+            result = pathfinder.find_path(graph, start, end)
+            expected = pathfinder_class().find_path(graph, start, end)
+            assert result.path == expected.path
+            assert result.came_from == expected.came_from
+
+    def test_full_trace_survives_next_query(self):
+        graph = GridGraph(6)
+        pathfinder = AStarPathfinder()
+        first = pathfinder.find_path(graph, 0, 35)
+        expected_came_from = AStarPathfinder().find_path(graph, 0, 35).came_from
+
+        pathfinder.find_path(graph, 35, 0)
+
+        assert first.came_from == expected_came_from
+        assert first.path[-1] == 35
+
+    def test_short_query_touches_few_cells(self):
+        graph = GridGraph(300)
+        pathfinder = DijkstraPathfinder()
+        pathfinder.find_path(graph, 0, 1)
+
+        result = pathfinder.find_path(graph, graph.index(150, 150), graph.index(150, 152), trace='full')
+
+        generation = pathfinder.workspace.generation
+        assert sum(1 for stamp in pathfinder.workspace.seen if stamp == generation) == len(result.came_from) + 1
+        assert len(result.came_from) < 30
+
+
+class TestBatchQueries:
+    """Test batch queries, inline and over a process pool."""
+
+    def create_graph(self):
+        rng = random.Random(2)
+        graph = GridGraph(15, 15, bytes(rng.random() > 0.25 for _ in range(225)))
+        pairs = [(rng.randrange(graph.size), rng.randrange(graph.size)) for _ in range(30)]
+        for start, end in pairs:
+            graph.set_walkable(start, True)
+            graph.set_walkable(end, True)
+        return graph, pairs
+
+    @pytest.mark.parametrize("pathfinder_class", [AStarPathfinder, DijkstraPathfinder])
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_single_queries(self, pathfinder_class, workers):
+        graph, pairs = self.create_graph()
+
+        results = list(find_paths_batch(graph, pairs, algorithm=pathfinder_class, workers=workers, chunk_size=4))
+
+        assert [position for position, _ in results] == list(range(len(pairs)))
+        for (start, end), (_, result) in zip(pairs, results):
+            expected = pathfinder_class().find_path(graph, start, end)
+            assert result.path == expected.path
+            assert result.came_from == {} and result.visited == [] and result.expanded is None
+
+    def test_unordered_results_cover_all_pairs(self):
+        graph, pairs = self.create_graph()
+
+        results = dict(find_paths_batch(graph, pairs, workers=2, chunk_size=7, ordered=False))
+
+        assert sorted(results) == list(range(len(pairs)))
+
+    def test_block_grid_full_trace(self):
+        grid = TestAStarPathfinder().create_grid(5)
+        pairs = [(grid[0][0], grid[4][4]), (grid[2][2], grid[2][3])]
+
+        results = [result for _, result in find_paths_batch(grid, pairs, trace='full')]
+
+        assert results[0].get_path_length() == 8
+        assert results[0].path[-1] is grid[4][4]
+        assert results[1].path == [grid[2][3]]
+        assert results[1].visited
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            list(find_paths_batch(GridGraph(3), [(0, 8)], chunk_size=0))
+
+
+class TestUnreachableShortcut:
+    """Test that disconnected queries are answered from the component index."""
+
+    # D* Lite and HPA* keep incremental state and search for themselves
+    ALL_PATHFINDERS = [AStarPathfinder, DijkstraPathfinder, JumpPointSearchPathfinder,
+                       BidirectionalAStarPathfinder, BidirectionalDijkstraPathfinder]
+
+    @pytest.mark.parametrize("pathfinder_class", ALL_PATHFINDERS)
+    def test_disconnected_graph_returns_without_search(self, pathfinder_class):
+        graph = GridGraph(20)
+        for row in range(20):
+            graph.set_walkable(graph.index(row, 10), False)
+
+        result = pathfinder_class().find_path(graph, 0, graph.size - 1)
+
+        assert not result.found
+        assert result.visited == []
+
+    @pytest.mark.parametrize("pathfinder_class", ALL_PATHFINDERS)
+    @pytest.mark.parametrize("trace, expanded", [('none', None), ('summary', 0), ('full', 0)])
+    def test_shortcut_respects_trace_level(self, pathfinder_class, trace, expanded):
+        graph = GridGraph(20)
+        for row in range(20):
+            graph.set_walkable(graph.index(row, 10), False)
+
+        result = pathfinder_class().find_path(graph, 0, graph.size - 1, trace=trace)
+
+        assert not result.found
+        assert result.expanded == expanded
+
+    @pytest.mark.parametrize("pathfinder_class", ALL_PATHFINDERS)
+    def test_attached_block_grid_returns_without_search(self, pathfinder_class):
+        grid = TestAStarPathfinder().create_grid(6)
+        GridGraph.from_blocks(grid)
+        for row in range(6):
+            grid[row][3].set_barrier()
+        for row in grid:
+            for block in row:
+                block.update_neighbors(grid)
+
+        result = pathfinder_class().find_path(grid, grid[0][0], grid[5][5])
+
+        assert not result.found
+        assert result.visited == []
+
 # # All algorithm tests
 # pytest tests/test_algorithms.py -v
 #
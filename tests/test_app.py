@@ -0,0 +1,172 @@
+"""Tests for the application's event loop, run on SDL's dummy video driver."""
+
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+from blocks import block_state
+from algorithms import AStarPathfinder
+from main import PathfindingApp
+from search_worker import SEARCH_DONE
+
+
+@pytest.fixture
+def app():
+    app = PathfindingApp()
+    yield app
+    app.search_worker.close()
+    app.maze_pool.close()
+    pygame.quit()
+
+
+def motion():
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0), rel=(0, 0), buttons=(0, 0, 0))
+
+
+def button(kind, number=1):
+    return pygame.event.Event(kind, pos=(0, 0), button=number)
+
+
+class TestEventHandling:
+    """Mouse-motion bursts are merged and events mark the screen dirty."""
+
+    def count_drags(self, app, monkeypatch):
+        drags = []
+        monkeypatch.setattr(app, '_handle_mouse_drag', lambda: drags.append(app.is_dragging))
+        return drags
+
+    def test_motion_burst_is_one_drag(self, app, monkeypatch):
+        drags = self.count_drags(app, monkeypatch)
+        app._handle_events([motion() for _ in range(20)])
+        assert len(drags) == 1
+
+    def test_motion_flushed_before_other_events(self, app, monkeypatch):
+        drags = self.count_drags(app, monkeypatch)
+        app.is_dragging = True
+        app._handle_events([motion(), motion(), button(pygame.MOUSEBUTTONUP), motion()])
+        assert drags == [True, False]
+
+    def test_idle_motion_does_not_dirty(self, app):
+        app.dirty = False
+        app._handle_events([motion() for _ in range(5)])
+        assert not app.dirty
+
+    def test_keypress_dirties(self, app):
+        app.dirty = False
+        app._handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_2)])
+        assert app.dirty
+        assert app.current_algorithm == 'dijkstra'
+
+
+class TestIncrementalEdits:
+    """Edits made with the mouse reach incremental pathfinders on the next run."""
+
+    def click(self, app, monkeypatch, block, number=1):
+        monkeypatch.setattr(app.visualizer, 'get_clicked_block', lambda grid: block)
+        app._handle_mouse_down(number)
+        app._handle_mouse_up(number)
+
+    def test_edits_reach_notify_changed(self, app, monkeypatch):
+        notified = []
+        for _, pathfinder in app.algorithms.values():
+            monkeypatch.setattr(pathfinder, 'notify_changed', lambda cells: notified.append(list(cells)))
+
+        self.click(app, monkeypatch, app.grid[0][0])
+        self.click(app, monkeypatch, app.grid[9][9])
+        wall = app.grid[5][5]
+        self.click(app, monkeypatch, wall)
+        monkeypatch.setattr(app.visualizer, 'get_clicked_block', lambda grid: app.grid[5][6])
+        app._handle_mouse_down(1)
+        monkeypatch.setattr(app.visualizer, 'get_clicked_block', lambda grid: app.grid[5][7])
+        app._handle_mouse_drag()
+        app._handle_mouse_up(1)
+
+        app.current_algorithm = 'dstar'
+        app._run_algorithm()
+        app.search_job.future.result(timeout=30)
+
+        expected = [block.index for block in (app.grid[0][0], app.grid[9][9], wall, app.grid[5][6], app.grid[5][7])]
+        assert notified == [expected] * len(app.algorithms)
+        assert app.changed_blocks == []
+
+    def test_dstar_replans_around_new_wall(self, app, monkeypatch):
+        start, end = app.grid[0][0], app.grid[0][9]
+        self.click(app, monkeypatch, start)
+        self.click(app, monkeypatch, end)
+        app.current_algorithm = 'dstar'
+        app._run_algorithm()
+        app.search_job.future.result(timeout=30)
+        first_length = len(pygame.event.get(SEARCH_DONE)[0].result.path)
+
+        for row in range(9):
+            self.click(app, monkeypatch, app.grid[row][5])
+        app._run_algorithm()
+        app.search_job.future.result(timeout=30)
+        replanned = pygame.event.get(SEARCH_DONE)[0].result
+
+        fresh = AStarPathfinder().find_path(app.grid, start, end)
+        assert len(replanned.path) == fresh.get_path_length() > first_length
+
+
+class TestStreamingSearch:
+    """A running search is drawn as its updates arrive; SEARCH_DONE only ends the stream."""
+
+    def test_playback_starts_before_search_finishes(self, app, monkeypatch):
+        gate = threading.Event()
+
+        class GatedAStar(AStarPathfinder):
+            def find_path_iter(self, grid, start, end, trace='summary'):
+                for count, event in enumerate(super().find_path_iter(grid, start, end, trace)):
+                    if count == 20:
+                        gate.wait(30)
+                    yield event
+
+        app.algorithms['astar'] = ('A*', GatedAStar())
+        app.search_worker.flush_seconds = 0
+        app.start_block, app.end_block = app.grid[0][0], app.grid[0][-1]
+        app.start_block.set_start()
+        app.end_block.set_end()
+        app._run_algorithm()
+        job = app.search_job
+
+        try:
+            deadline = time.monotonic() + 30
+            while not app.playback.total and time.monotonic() < deadline:
+                app._advance_playback()
+            assert app.playback.total > 0
+            assert app.search_job is job and not job.future.done()
+            assert any(block.is_open() or block.is_closed() for row in app.grid for block in row)
+        finally:
+            gate.set()
+
+        job.future.result(timeout=30)
+        app._handle_events(pygame.event.get(SEARCH_DONE))
+        assert app.search_job is None and not app.playback.streaming
+        app.playback.skip()
+        assert not app.playback.active
+        assert any(block.code == block_state.PATH_CODE for row in app.grid for block in row)
+
+
+class TestIdleLoop:
+    """The loop only draws when something changed."""
+
+    def test_idle_loop_draws_once(self, app, monkeypatch):
+        draws = []
+        monkeypatch.setattr(app.visualizer, 'draw_grid', lambda *args: draws.append(args))
+        pygame.event.clear()
+        for _ in range(10):
+            pygame.event.post(motion())
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        app.run()
+        assert len(draws) == 1
+
+    def test_not_animating_while_paused(self, app):
+        app.playback.load([(app.grid[1][1], block_state.OPEN_CODE)])
+        assert app.is_animating()
+        app.playback.toggle_pause()
+        assert not app.is_animating()
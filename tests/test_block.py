@@ -1,8 +1,11 @@
 """Tests for Block and BlockState classes."""
 
+import pickle
+import random
 import pytest
 from blocks.block import Block
 from blocks import block_state
+from blocks.grid_graph import GridGraph, DOWN, UP, RIGHT, LEFT
 
 
 class TestBlockStates:
@@ -38,6 +41,13 @@ class TestBlockStates:
         assert state.is_walkable()
         assert state.get_color() == (255, 0, 0)
 
+    def test_backward_closed_state_properties(self):
+        state = block_state.BACKWARD_CLOSED
+        assert state.is_walkable()
+        assert state.get_color() == (0, 0, 255)
+        assert state.can_transition_to(block_state.PATH)
+        assert block_state.OPEN.can_transition_to(state)
+
     def test_path_state_properties(self):
         state = block_state.PATH
         assert state.is_walkable()
@@ -136,6 +146,11 @@ class TestBlockStateChanges:
         block.set_path()
         assert not block.is_closed()
 
+    def test_backward_closed_counts_as_closed(self, block):
+        block.set_backward_closed()
+        assert block.is_closed()
+        assert block.state is block_state.BACKWARD_CLOSED
+
 
 class TestInvalidTransitions:
     """Test that invalid transitions are rejected."""
@@ -246,6 +261,362 @@ class TestEdgeCases:
         assert "Block(5, 10" in repr_str
         assert "BarrierState" in repr_str
 
+
+class TestGridGraph:
+    """Test compact grid graph and Block view syncing."""
+
+    def create_grid(self, rows=3):
+        grid = []
+        for row in range(rows):
+            grid_row = []
+            for col in range(rows):
+                block = Block(row, col, width=16, total_rows=rows)
+                grid_row.append(block)
+            grid.append(grid_row)
+        return grid
+
+    def test_index_and_position_round_trip(self):
+        graph = GridGraph(4, 6)
+        assert graph.size == 24
+        assert graph.index(2, 3) == 15
+        assert graph.position(15) == (2, 3)
+
+    def test_center_has_four_neighbors(self):
+        graph = GridGraph(3)
+        assert sorted(graph.neighbors(4)) == [1, 3, 5, 7]
+
+    def test_corner_has_two_neighbors(self):
+        graph = GridGraph(3)
+        assert sorted(graph.neighbors(0)) == [1, 3]
+
+    def test_barrier_excluded_from_neighbors(self):
+        graph = GridGraph(3)
+        graph.set_walkable(3, False)
+        assert 3 not in graph.neighbors(4)
+        assert not graph.is_walkable(3)
+
+    def test_neighbor_order_matches_blocks(self):
+        grid = self.create_grid(3)
+        graph = GridGraph.from_blocks(grid)
+        center = grid[1][1]
+        center.update_neighbors(grid)
+        expected = [graph.index(*block.get_position()) for block in center.neighbors]
+        assert graph.neighbors(center.index) == expected
+
+    def test_block_changes_sync_into_graph(self):
+        grid = self.create_grid(3)
+        graph = GridGraph.from_blocks(grid)
+        block = grid[0][2]
+
+        block.set_barrier()
+        assert not graph.is_walkable(block.index)
+
+        block.reset()
+        assert graph.is_walkable(block.index)
+
+    def test_attach_syncs_existing_state(self):
+        grid = self.create_grid(3)
+        grid[1][0].set_barrier()
+        graph = GridGraph.from_blocks(grid)
+        assert not graph.is_walkable(graph.index(1, 0))
+        assert graph.block(graph.index(1, 0)) is grid[1][0]
+
+    def test_rejects_wrong_occupancy_length(self):
+        with pytest.raises(ValueError):
+            GridGraph(3, 3, walkable=bytes(5))
+
+    def test_version_counts_changes(self):
+        graph = GridGraph(3)
+        graph.set_walkable(4, False)
+        graph.set_walkable(4, False)
+        graph.set_walkable(4, True)
+        assert graph.version == 2
+
+    def test_masks_track_neighbor_walkability(self):
+        graph = GridGraph(3)
+        assert graph.masks[4] == DOWN | UP | RIGHT | LEFT
+        assert graph.masks[0] == DOWN | RIGHT
+
+        graph.set_walkable(5, False)
+        assert graph.masks[4] == DOWN | UP | LEFT
+        assert graph.masks[2] == LEFT
+        assert graph.masks[8] == LEFT
+
+        graph.set_walkable(5, True)
+        assert graph.masks[4] == DOWN | UP | RIGHT | LEFT
+
+    def test_incremental_masks_match_rebuild(self):
+        rng = random.Random(3)
+        graph = GridGraph(7, 9)
+        for _ in range(200):
+            graph.set_walkable(rng.randrange(graph.size), rng.random() < 0.6)
+
+        rebuilt = GridGraph(7, 9, walkable=graph.walkable)
+        assert graph.masks == rebuilt.masks
+
+    def test_attached_neighbors_need_no_update(self):
+        grid = self.create_grid(3)
+        GridGraph.from_blocks(grid)
+        center = grid[1][1]
+        assert center.neighbors == [grid[2][1], grid[0][1], grid[1][2], grid[1][0]]
+
+        grid[0][1].set_barrier()
+        assert center.neighbors == [grid[2][1], grid[1][2], grid[1][0]]
+        assert not center.is_neighbor(grid[0][1])
+
+    def test_load_walkable_replaces_occupancy(self):
+        graph = GridGraph(3)
+        graph.set_state(4, block_state.START_CODE)
+        maze = bytes([1, 1, 1, 0, 0, 1, 1, 1, 1])
+
+        graph.load_walkable(maze)
+
+        assert graph.walkable == maze
+        assert graph.masks == GridGraph(3, walkable=maze).masks
+        assert graph.states[4] == block_state.BARRIER_CODE
+        assert graph.states[0] == block_state.EMPTY_CODE
+
+    def test_load_walkable_notifies_listeners(self):
+        graph = GridGraph(1, 3)
+        changes = []
+        graph.add_listener(lambda index, walkable: changes.append((index, walkable)))
+
+        graph.load_walkable(bytes([1, 0, 1]))
+
+        assert changes == [(1, False)]
+        with pytest.raises(ValueError):
+            graph.load_walkable(bytes(2))
+
+    def test_pickle_keeps_only_occupancy(self):
+        grid = self.create_grid()
+        grid[1][1].set_barrier()
+        graph = GridGraph.from_blocks(grid)
+        graph.components.connected(0, 8)
+
+        copy = pickle.loads(pickle.dumps(graph))
+
+        assert (copy.rows, copy.cols, copy.walkable) == (graph.rows, graph.cols, graph.walkable)
+        assert copy.blocks is None
+        assert copy.components.connected(0, 8)
+
+
+class TestComponentIndex:
+    """Test connected-component reachability index."""
+
+    def test_open_grid_is_connected(self):
+        graph = GridGraph(4)
+        assert graph.components.connected(0, 15)
+
+    def test_wall_splits_components(self):
+        graph = GridGraph(4)
+        graph.components.rebuild()
+        for row in range(4):
+            graph.set_walkable(graph.index(row, 1), False)
+
+        assert not graph.components.connected(0, 3)
+        assert graph.components.connected(0, 12)
+        assert graph.components.find(graph.index(0, 1)) == -1
+
+    def test_opening_cell_merges_incrementally(self):
+        graph = GridGraph(1, 5)
+        graph.set_walkable(2, False)
+        components = graph.components
+        assert not components.connected(0, 4)
+
+        graph.set_walkable(2, True)
+
+        assert not components._dirty
+        assert components.connected(0, 4)
+
+    def test_closing_cell_splits_locally(self):
+        graph = GridGraph(1, 5)
+        components = graph.components
+        assert components.connected(0, 4)
+
+        graph.set_walkable(2, False)
+
+        assert not components._dirty
+        assert not components.connected(0, 4)
+        assert components.connected(3, 4)
+
+    def test_closing_cell_around_ring_keeps_component(self):
+        graph = GridGraph(3)
+        components = graph.components
+        components.rebuild()
+
+        graph.set_walkable(4, False)
+
+        assert not components._dirty
+        assert components.connected(1, 7)
+        assert components.connected(3, 5)
+
+    def test_single_edits_do_not_rebuild(self, monkeypatch):
+        rng = random.Random(7)
+        graph = GridGraph(300, 300, bytes(rng.random() > 0.2 for _ in range(300 * 300)))
+        components = graph.components
+        components.rebuild()
+        rebuilds = []
+        monkeypatch.setattr(components, 'rebuild', lambda: rebuilds.append(1))
+
+        for _ in range(200):
+            cell = rng.randrange(graph.size)
+            graph.set_walkable(cell, not graph.walkable[cell])
+            components.connected(0, graph.size - 1)
+
+        assert rebuilds == []
+
+    def test_incremental_edits_match_rebuild(self):
+        rng = random.Random(3)
+        for _ in range(30):
+            graph = GridGraph(8, 8, bytes(rng.random() > 0.4 for _ in range(64)))
+            components = graph.components
+            components.rebuild()
+            for _ in range(40):
+                cell = rng.randrange(graph.size)
+                graph.set_walkable(cell, not graph.walkable[cell])
+
+            fresh = GridGraph(8, 8, bytes(graph.walkable)).components
+            for a in range(graph.size):
+                for b in range(a, graph.size):
+                    assert components.connected(a, b) == fresh.connected(a, b)
+
+    def test_block_edits_update_index(self):
+        grid = TestGridGraph().create_grid(3)
+        graph = GridGraph.from_blocks(grid)
+        assert graph.components.connected(0, 2)
+
+        for row in range(3):
+            grid[row][1].set_barrier()
+        assert not graph.components.connected(0, 2)
+
+        grid[1][1].reset()
+        assert graph.components.connected(0, 2)
+
+    def test_listener_only_called_on_change(self):
+        graph = GridGraph(2)
+        changes = []
+        graph.add_listener(lambda index, walkable: changes.append((index, walkable)))
+
+        graph.set_walkable(1, True)
+        graph.set_walkable(1, False)
+        graph.set_walkable(1, False)
+
+        assert changes == [(1, False)]
+
+    def test_removed_listener_not_called(self):
+        graph = GridGraph(2)
+        changes = []
+
+        def listener(index, walkable):
+            changes.append((index, walkable))
+
+        graph.add_listener(listener)
+        graph.remove_listener(listener)
+
+        graph.set_walkable(1, False)
+
+        assert changes == []
+
+
+class TestStateCodes:
+    """Test integer state codes and bulk operations on GridGraph.states."""
+
+    def test_codes_index_states(self):
+        for code, state in enumerate(block_state.STATES):
+            assert state.code == code
+
+    def test_graph_states_follow_blocks(self):
+        grid = TestGridGraph().create_grid(3)
+        graph = GridGraph.from_blocks(grid)
+        grid[0][0].set_start()
+        grid[1][1].set_barrier()
+        grid[2][2].set_closed()
+
+        assert graph.states[0] == block_state.START_CODE
+        assert graph.states[4] == block_state.BARRIER_CODE
+        assert graph.states[8] == block_state.CLOSED_CODE
+        assert grid[2][2].is_closed()
+
+    def test_set_walkable_updates_state_code(self):
+        graph = GridGraph(2)
+        graph.set_walkable(3, False)
+        assert graph.states[3] == block_state.BARRIER_CODE
+        graph.set_walkable(3, True)
+        assert graph.states[3] == block_state.EMPTY_CODE
+
+    def test_clear_search_states(self):
+        grid = TestGridGraph().create_grid(3)
+        graph = GridGraph.from_blocks(grid)
+        grid[0][0].set_start()
+        grid[0][1].set_barrier()
+        grid[1][0].set_open()
+        grid[1][1].set_closed()
+        grid[1][2].set_backward_closed()
+        grid[2][0].set_path()
+
+        assert graph.clear_search_states() == 4
+
+        assert grid[0][0].is_start()
+        assert grid[0][1].is_barrier()
+        assert all(grid[1][col].is_empty() for col in range(3))
+        assert grid[2][0].is_empty()
+        assert graph.clear_search_states() == 0
+
+    def test_transitions_after_bulk_clear(self):
+        grid = TestGridGraph().create_grid(2)
+        graph = GridGraph.from_blocks(grid)
+        grid[1][1].set_path()
+        graph.clear_search_states()
+        assert grid[1][1].set_state(block_state.OPEN)
+
+    def test_count_states(self):
+        graph = GridGraph(3)
+        graph.set_walkable(0, False)
+        graph.set_state(1, block_state.CLOSED_CODE)
+        counts = graph.count_states()
+        assert counts[block_state.BARRIER] == 1
+        assert counts[block_state.CLOSED] == 1
+        assert counts[block_state.EMPTY] == 7
+        assert sum(counts.values()) == graph.size
+
+    def test_take_changes_tracks_edits(self):
+        grid = TestGridGraph().create_grid(4)
+        graph = GridGraph.from_blocks(grid)
+        assert graph.take_changes() is None  # First frame draws everything
+
+        grid[0][1].set_barrier()
+        grid[2][3].set_open()
+        grid[2][3].set_open()
+        assert graph.take_changes() == {1, 11}
+        assert graph.take_changes() == set()
+
+    def test_bulk_operations_request_full_redraw(self):
+        graph = GridGraph(4)
+        graph.take_changes()
+        graph.set_state(5, block_state.PATH_CODE)
+        graph.clear_search_states()
+        assert graph.take_changes() is None
+
+        graph.load_walkable(bytes(16))
+        assert graph.take_changes() is None
+
+    def test_many_changes_request_full_redraw(self):
+        graph = GridGraph(4)
+        graph.take_changes()
+        for index in range(8):
+            graph.set_walkable(index, False)
+        assert graph.take_changes() is None
+
+    def test_walkable_mask_matches_occupancy(self):
+        grid = TestGridGraph().create_grid(3)
+        grid[0][2].set_barrier()
+        grid[2][1].set_end()
+        graph = GridGraph.from_blocks(grid)
+        snapshot = GridGraph.from_blocks(grid, attach=False)
+        assert graph.walkable_mask() == graph.walkable
+        assert snapshot.states == graph.states
+        assert snapshot.walkable == graph.walkable
+
 # # All tests
 # pytest tests/test_block.py -v
 #
@@ -3,6 +3,7 @@
 import pytest
 from blocks.block import Block
 from algorithms import AStarPathfinder, DijkstraPathfinder
+from algorithms.base_pathfinder import OPEN, EXPAND, DONE
 
 
 class TestEndToEndPathfinding:
@@ -114,6 +115,32 @@ class TestStateTransitionsDuringPathfinding:
         closed_count = sum(1 for row in grid for block in row if block.is_closed())
         assert closed_count > 0
 
+    def test_blocks_marked_while_streaming(self):
+        grid = self.create_grid(5)
+        for row in grid:
+            for block in row:
+                block.update_neighbors(grid)
+
+        start = grid[0][0]
+        end = grid[4][4]
+        start.set_start()
+        end.set_end()
+
+        # Simulate visualization: mark blocks as events arrive
+        result = None
+        for event in AStarPathfinder().find_path_iter(grid, start, end):
+            if event.kind == DONE:
+                result = event.payload
+            elif event.payload != start and event.payload != end:
+                if event.kind == OPEN and event.payload.is_empty():
+                    event.payload.set_open()
+                elif event.kind == EXPAND:
+                    event.payload.set_closed()
+
+        assert result.get_path_length() == 8
+        assert any(block.is_closed() for row in grid for block in row)
+        assert start.is_start() and end.is_end()
+
 
 class TestAlgorithmComparison:
     """Compare algorithm behavior on same scenarios."""
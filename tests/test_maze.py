@@ -1,8 +1,16 @@
 """Tests for Wilson's maze generation algorithm."""
 
+import io
+import random
+from itertools import islice
+
 import pytest
 from blocks.block import Block
-from maze import WilsonMazeGenerator
+from blocks.grid_graph import GridGraph
+from algorithms import DijkstraPathfinder
+from maze import (
+    WilsonMazeGenerator, EllerMazeGenerator, MazeTreeIndex, MazePool, MAZE_GENERATORS, create_maze_generator
+)
 
 
 class TestWilsonMazeGenerator:
@@ -129,88 +137,258 @@ class TestWilsonMazeGenerator:
         barrier_count = sum(1 for row in grid for block in row if block.is_barrier())
         assert barrier_count > 0, "Maze has no barriers!"
 
+    def test_maze_is_spanning_tree(self):
+        """Walkable blocks form one connected, acyclic component."""
+        grid = self.create_grid(15)
+        WilsonMazeGenerator().generate(grid)
+        graph = GridGraph.from_blocks(grid, attach=False)
 
-class TestWilsonMazeHelpers:
-    """Test helper methods."""
-
-    def create_grid(self, rows=3):
-        grid = []
-        for row in range(rows):
-            grid_row = []
-            for col in range(rows):
-                block = Block(row, col, width=16, total_rows=rows)
-                grid_row.append(block)
-            grid.append(grid_row)
-        return grid
-
-    def test_get_closed_neighbors_center(self):
-        grid = self.create_grid(3)
-        generator = WilsonMazeGenerator()
-
-        # Initialize grid (all blocks closed)
-        for row in grid:
-            for block in row:
-                block.set_closed()
+        index = MazeTreeIndex(graph)
+        assert index.components == 1
+        # Every maze cell (even row and column) is reachable
+        for row in range(0, 15, 2):
+            for col in range(0, 15, 2):
+                assert graph.is_walkable(graph.index(row, col))
 
-        # Center block should have 4 closed neighbors
-        center = grid[1][1]
-        neighbors = generator._get_closed_neighbors(grid, center)
-        assert len(neighbors) == 4
 
-    def test_get_closed_neighbors_corner(self):
-        grid = self.create_grid(3)
-        generator = WilsonMazeGenerator()
+class TestWilsonOnGraph:
+    """Test generation straight into a compact GridGraph."""
 
-        # Initialize grid (all blocks closed)
-        for row in grid:
-            for block in row:
-                block.set_closed()
+    def test_graph_maze_is_spanning_tree(self):
+        graph = GridGraph(41, 37)
+        WilsonMazeGenerator().generate(graph, seed=3)
 
-        # Corner should have 2 closed neighbors
-        corner = grid[0][0]
-        neighbors = generator._get_closed_neighbors(grid, corner)
-        assert len(neighbors) == 2
+        index = MazeTreeIndex(graph)
+        assert index.components == 1
+        cells = (graph.rows + 1) // 2 * ((graph.cols + 1) // 2)
+        # A tree over the maze cells carves one wall per cell but the root
+        assert graph.walkable.count(1) == 2 * cells - 1
 
-    def test_get_empty_neighbors(self):
-        grid = self.create_grid(3)
-        generator = WilsonMazeGenerator()
+    def test_seed_is_deterministic(self):
+        first, second, other = GridGraph(21), GridGraph(21), GridGraph(21)
+        WilsonMazeGenerator().generate(first, seed=5)
+        WilsonMazeGenerator().generate(second, seed=5)
+        WilsonMazeGenerator().generate(other, seed=6)
 
-        # Initialize all blocks as closed
-        for row in grid:
-            for block in row:
-                block.set_closed()
+        assert first.walkable == second.walkable
+        assert first.walkable != other.walkable
 
-        # Center has no empty neighbors initially
-        center = grid[1][1]
-        neighbors = generator._get_empty_neighbors(grid, center)
-        assert len(neighbors) == 0
+    def test_blocks_match_graph_generation(self):
+        grid = TestWilsonMazeGenerator().create_grid(9)
+        graph = GridGraph(9)
+        WilsonMazeGenerator().generate(grid, seed=2)
+        WilsonMazeGenerator().generate(graph, seed=2)
 
-        # Mark adjacent block as empty
-        grid[0][1].reset()
-        neighbors = generator._get_empty_neighbors(grid, center)
-        assert len(neighbors) == 1
+        assert GridGraph.from_blocks(grid, attach=False).walkable == graph.walkable
 
-    def test_get_unvisited_blocks(self):
-        grid = self.create_grid(3)
+    def test_last_walk_is_recorded(self):
         generator = WilsonMazeGenerator()
+        graph = GridGraph(15)
+        generator.generate(graph, seed=1)
 
-        # Initialize all blocks as closed (unvisited)
-        for row in grid:
-            for block in row:
-                block.set_closed()
-
-        # Initially all unvisited
-        unvisited = generator._get_unvisited_blocks(grid)
-        assert len(unvisited) == 9
+        assert generator.path
+        assert all(graph.is_walkable(cell) for cell in generator.path)
 
-        # Mark one as empty (visited)
-        grid[0][0].reset()
-        unvisited = generator._get_unvisited_blocks(grid)
-        assert len(unvisited) == 8
+    def test_uniform_over_spanning_trees(self):
+        """A 3x3 grid has four maze cells on a cycle; each of its four spanning trees is equally likely."""
+        generator = WilsonMazeGenerator()
+        rng = random.Random(11)
+        counts = {}
+        for _ in range(4000):
+            maze = bytes(generator.carve(3, 3, rng))
+            counts[maze] = counts.get(maze, 0) + 1
+
+        assert len(counts) == 4
+        for count in counts.values():
+            assert 850 < count < 1150
+
+
+class TestEllerMazeGenerator:
+    """Test streaming row-by-row generation."""
+
+    @pytest.mark.parametrize("rows, cols", [(1, 1), (2, 2), (9, 9), (10, 7), (31, 40)])
+    def test_maze_is_spanning_tree(self, rows, cols):
+        graph = GridGraph(rows, cols)
+        EllerMazeGenerator().generate(graph, seed=4)
+
+        assert MazeTreeIndex(graph).components == 1
+        cells = (rows + 1) // 2 * ((cols + 1) // 2)
+        assert graph.walkable.count(1) == 2 * cells - 1
+
+    def test_seed_is_deterministic(self):
+        generator = EllerMazeGenerator()
+        first = list(generator.iter_rows(21, seed=8, rows=21))
+        second = list(generator.iter_rows(21, seed=8, rows=21))
+        assert first == second
+        assert first != list(generator.iter_rows(21, seed=9, rows=21))
+
+    def test_row_range_regenerates(self):
+        generator = EllerMazeGenerator()
+        full = list(generator.iter_rows(15, seed=2, rows=40))
+        assert list(generator.iter_rows(15, seed=2, rows=40, start=25)) == full[25:]
+
+    def test_endless_stream(self):
+        rows = list(islice(EllerMazeGenerator().iter_rows(11, seed=1), 500))
+        assert len(rows) == 500
+        assert all(len(row) == 11 for row in rows)
+        # Each maze row leaves at least one passage down
+        assert all(any(row) for row in rows[1::2])
+
+    def test_write_streams_graph_rows(self):
+        generator = EllerMazeGenerator()
+        file = io.BytesIO()
+
+        assert generator.write(file, 17, 13, seed=6) == 17
+
+        graph = GridGraph(17, 13)
+        generator.generate(graph, seed=6)
+        assert file.getvalue() == graph.walkable
+
+    def test_write_from_start_row(self):
+        generator = EllerMazeGenerator()
+        file = io.BytesIO()
+
+        assert generator.write(file, 17, 13, seed=6, start=5) == 12
+
+        graph = GridGraph(17, 13)
+        generator.generate(graph, seed=6)
+        assert file.getvalue() == graph.walkable[5 * 13:]
+
+    def test_height_is_keyword_only(self):
+        with pytest.raises(TypeError):
+            EllerMazeGenerator().iter_rows(13, 6, 17)
+
+    def test_blocks_match_graph(self):
+        grid = TestWilsonMazeGenerator().create_grid(9)
+        graph = GridGraph(9)
+        EllerMazeGenerator().generate(grid, seed=3)
+        EllerMazeGenerator().generate(graph, seed=3)
+        assert GridGraph.from_blocks(grid, attach=False).walkable == graph.walkable
+
+
+class TestMazeRegistry:
+    """Test every registered generator through the shared interface."""
+
+    @pytest.mark.parametrize("kind", sorted(MAZE_GENERATORS))
+    @pytest.mark.parametrize("rows, cols", [(1, 1), (2, 3), (9, 9), (10, 7), (41, 40)])
+    def test_maze_is_spanning_tree(self, kind, rows, cols):
+        graph = GridGraph(rows, cols)
+        create_maze_generator(kind).generate(graph, seed=2)
+
+        assert MazeTreeIndex(graph).components == 1
+        cells = (rows + 1) // 2 * ((cols + 1) // 2)
+        assert graph.walkable.count(1) == 2 * cells - 1
+
+    @pytest.mark.parametrize("kind", sorted(MAZE_GENERATORS))
+    def test_seed_is_deterministic(self, kind):
+        first, second = GridGraph(31), GridGraph(31)
+        create_maze_generator(kind).generate(first, seed=12)
+        create_maze_generator(kind).generate(second, seed=12)
+        assert first.walkable == second.walkable
+
+    @pytest.mark.parametrize("kind", sorted(MAZE_GENERATORS))
+    def test_block_grid(self, kind):
+        grid = TestWilsonMazeGenerator().create_grid(11)
+        grid[0][0].set_start()
+        create_maze_generator(kind).generate(grid, seed=1)
+
+        assert all(block.is_empty() or block.is_barrier() for row in grid for block in row)
+        graph = GridGraph.from_blocks(grid, attach=False)
+        assert MazeTreeIndex(graph).components == 1
+
+    def test_unknown_generator(self):
+        with pytest.raises(ValueError):
+            create_maze_generator('nope')
+
+
+class TestMazePool:
+    """Test background pre-generation of mazes."""
+
+    def test_mazes_match_their_seeds(self):
+        with MazePool(15, 13, kind='kruskal', size=2, seed=40) as pool:
+            taken = [pool.take(wait=True) for _ in range(3)]
+
+        assert [seed for seed, _ in taken] == [40, 41, 42]
+        for seed, walkable in taken:
+            graph = GridGraph(15, 13)
+            create_maze_generator('kruskal').generate(graph, seed=seed)
+            assert walkable == graph.walkable
+
+    def test_refills_after_take(self):
+        with MazePool(9, size=3, seed=1) as pool:
+            pool.take(wait=True)
+            assert len(pool._pending) == 3
+            for future in list(pool._pending):
+                future.result()
+            assert pool.ready() == 3
+            assert pool.take() is not None
+
+    def test_rejects_bad_arguments(self):
+        with pytest.raises(ValueError):
+            MazePool(9, size=0)
+        with pytest.raises(ValueError):
+            MazePool(9, kind='nope')
+
+
+class TestMazeTreeIndex:
+    """Test tree-index queries on perfect mazes."""
 
-        # Mark one as barrier (also visited)
-        grid[1][1].set_barrier()
-        unvisited = generator._get_unvisited_blocks(grid)
-        assert len(unvisited) == 7
+    def create_maze(self, rows=21, seed=1):
+        random.seed(seed)
+        grid = []
+        for row in range(rows):
+            grid_row = []
+            for col in range(rows):
+                block = Block(row, col, width=16, total_rows=rows)
+                grid_row.append(block)
+            grid.append(grid_row)
+        WilsonMazeGenerator().generate(grid)
+        return GridGraph.from_blocks(grid, attach=False)
+
+    def test_distances_match_search(self):
+        graph = self.create_maze()
+        index = MazeTreeIndex(graph)
+        cells = [cell for cell in range(graph.size) if graph.is_walkable(cell)]
+        rng = random.Random(2)
+
+        for _ in range(50):
+            a, b = rng.choice(cells), rng.choice(cells)
+            expected = DijkstraPathfinder().find_path(graph, a, b)
+            assert index.distance(a, b) == expected.get_path_length()
+
+    def test_path_is_walkable_and_connected(self):
+        graph = self.create_maze()
+        index = MazeTreeIndex(graph, root=graph.index(10, 10))
+        start, end = graph.index(0, 0), graph.index(20, 20)
+
+        path = index.path(start, end)
+
+        assert len(path) == index.distance(start, end)
+        assert path[-1] == end
+        previous = start
+        for cell in path:
+            assert cell in graph.neighbors(previous)
+            previous = cell
+
+    def test_same_cell(self):
+        graph = self.create_maze(5)
+        index = MazeTreeIndex(graph)
+        assert index.distance(0, 0) == 0
+        assert index.path(0, 0) == []
+
+    def test_forest_components(self):
+        graph = GridGraph(1, 5)
+        graph.set_walkable(2, False)
+        index = MazeTreeIndex(graph)
+
+        assert index.components == 2
+        assert index.distance(0, 1) == 1
+        assert index.distance(0, 4) is None
+        assert index.path(0, 4) is None
+        assert index.distance(0, 2) is None
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValueError):
+            MazeTreeIndex(GridGraph(2))
 
 # Run: pytest tests/test_maze.py -v
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""Tests for frame-budgeted search playback."""
+
+from blocks import block_state
+from blocks.block import Block
+from blocks.grid_graph import GridGraph
+from algorithms import AStarPathfinder
+from playback import Playback, SPEEDS, event_updates, record_search
+
+
+def create_grid(rows=10):
+    grid = [[Block(row, col, width=16, total_rows=rows) for col in range(rows)] for row in range(rows)]
+    GridGraph.from_blocks(grid)
+    return grid
+
+
+def recorded_run(rows=10):
+    grid = create_grid(rows)
+    start, end = grid[0][0], grid[rows - 1][rows - 1]
+    start.set_start()
+    end.set_end()
+    events = AStarPathfinder().find_path_iter(grid, start, end)
+    updates, result = record_search(events, start, end)
+    return grid, start, end, updates, result
+
+
+class TestRecordSearch:
+    """Search events become an ordered list of cell updates."""
+
+    def test_records_result_and_path_last(self):
+        _, start, end, updates, result = recorded_run()
+        assert result.found
+        path_updates = [block for block, code in updates if code == block_state.PATH_CODE]
+        assert path_updates == [block for block in result.path if block not in (start, end)]
+        assert all(code == block_state.PATH_CODE for _, code in updates[-len(path_updates):])
+
+    def test_start_and_end_never_updated(self):
+        _, start, end, updates, _ = recorded_run()
+        assert all(block is not start and block is not end for block, _ in updates)
+
+    def test_recording_leaves_grid_untouched(self):
+        grid, _, _, _, _ = recorded_run()
+        assert all(not block.is_closed() and not block.is_open() for row in grid for block in row)
+
+
+class TestPlayback:
+    """Playback applies a speed-dependent number of updates per frame."""
+
+    def test_any_search_plays_in_fixed_frames(self):
+        for rows in (10, 40):
+            _, _, _, updates, _ = recorded_run(rows)
+            playback = Playback(fps=60, seconds=2.0)
+            playback.load(updates)
+            frames = 0
+            while playback.active:
+                playback.advance()
+                frames += 1
+            assert frames <= 120
+
+    def test_speed_scales_budget(self):
+        playback = Playback(fps=10, seconds=1.0)
+        _, _, _, updates, _ = recorded_run()
+        playback.load(updates)
+        base = playback.per_frame()
+        playback.faster()
+        assert playback.speed == 2.0
+        assert playback.per_frame() >= 2 * base - 1
+
+        for _ in range(len(SPEEDS)):
+            playback.slower()
+        assert playback.speed == SPEEDS[0]
+        assert playback.per_frame() >= 1
+
+    def test_pause_and_step(self):
+        _, _, _, updates, _ = recorded_run()
+        playback = Playback()
+        playback.load(updates)
+        playback.toggle_pause()
+        assert playback.advance() == 0
+        assert playback.step() == 1
+        assert playback.remaining == len(updates) - 1
+
+    def test_skip_matches_playing_through(self):
+        grid, _, _, updates, result = recorded_run()
+        playback = Playback()
+        playback.load(updates)
+        assert playback.skip() == len(updates)
+        assert not playback.active
+        path = {block.get_position() for row in grid for block in row if block.code == block_state.PATH_CODE}
+        assert path == {block.get_position() for block in result.path if not block.is_start() and not block.is_end()}
+        assert grid[0][0].is_start() and grid[-1][-1].is_end()
+
+    def test_load_replaces_pending(self):
+        _, _, _, updates, _ = recorded_run()
+        playback = Playback()
+        playback.load(updates)
+        playback.toggle_pause()
+        playback.load(updates[:3])
+        assert playback.remaining == 3
+        assert not playback.paused
+        playback.clear()
+        assert not playback.active
+
+
+class TestStreamingPlayback:
+    """Updates fed in while the search is still running play back as they arrive."""
+
+    def test_plays_before_search_finishes(self):
+        grid = create_grid(40)
+        start, end = grid[0][0], grid[-1][-1]
+        start.set_start()
+        end.set_end()
+        events = AStarPathfinder().find_path_iter(grid, start, end)
+
+        playback = Playback(fps=60, seconds=2.0)
+        playback.begin()
+        for _ in range(50):
+            playback.extend(event_updates(next(events), start, end))
+
+        assert playback.advance() > 0
+        assert playback.active
+        assert any(block.is_open() or block.is_closed() for row in grid for block in row)
+
+        for event in events:
+            playback.extend(event_updates(event, start, end))
+        playback.finish()
+        playback.skip()
+        assert not playback.active
+        assert any(block.code == block_state.PATH_CODE for row in grid for block in row)
+
+    def test_stream_stays_active_until_finished(self):
+        _, _, _, updates, _ = recorded_run()
+        playback = Playback()
+        playback.begin()
+        assert playback.active and playback.remaining == 0
+        assert playback.advance() == 0
+
+        playback.extend(updates[:5])
+        playback.skip()
+        assert playback.active
+
+        playback.finish()
+        assert not playback.active
+
+    def test_budget_follows_received_updates(self):
+        _, _, _, updates, _ = recorded_run(40)
+        playback = Playback(fps=10, seconds=1.0)
+        playback.begin()
+        playback.extend(updates[:10])
+        early = playback.per_frame()
+        playback.extend(updates[10:])
+
+        assert playback.total == len(updates)
+        assert playback.per_frame() > early
+
+    def test_record_search_matches_event_updates(self):
+        grid = create_grid()
+        start, end = grid[0][0], grid[-1][-1]
+        recorded, _ = record_search(AStarPathfinder().find_path_iter(grid, start, end), start, end)
+        streamed = [update for event in AStarPathfinder().find_path_iter(grid, start, end)
+                    for update in event_updates(event, start, end)]
+        assert recorded == streamed
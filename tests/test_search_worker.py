@@ -0,0 +1,153 @@
+"""Tests for background searches posted back as pygame events."""
+
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+from blocks import block_state
+from algorithms import AStarPathfinder, DStarLitePathfinder
+from search_worker import SEARCH_DONE, SearchWorker
+from visualizer import create_grid
+
+
+@pytest.fixture
+def worker():
+    pygame.init()
+    worker = SearchWorker()
+    yield worker
+    worker.close()
+    pygame.quit()
+
+
+def wait_done(job):
+    """Wait for a job to finish and return the SEARCH_DONE events posted so far."""
+    job.future.result(timeout=30)
+    return pygame.event.get(SEARCH_DONE)
+
+
+def hold(worker):
+    """Keep the worker thread busy until the returned event is set, so submissions queue up."""
+    gate = threading.Event()
+    worker._executor.submit(gate.wait, 30)
+    return gate
+
+
+class GatedPathfinder(AStarPathfinder):
+    """A* whose event stream stops after a number of events until the gate opens."""
+
+    def __init__(self, gate, after):
+        super().__init__()
+        self.gate = gate
+        self.after = after
+
+    def find_path_iter(self, grid, start, end, trace='summary'):
+        for count, event in enumerate(super().find_path_iter(grid, start, end, trace)):
+            if count == self.after:
+                self.gate.wait(30)
+            yield event
+
+
+def place(grid):
+    start, end = grid[0][0], grid[0][-1]
+    start.set_start()
+    end.set_end()
+    return start, end
+
+
+class TestSearchWorker:
+    """Searches run on a snapshot and come back as SEARCH_DONE events."""
+
+    def test_result_posted_as_event(self, worker):
+        grid = create_grid()
+        start, end = place(grid)
+        job = worker.submit(AStarPathfinder(), grid, start, end)
+        events = wait_done(job)
+
+        assert len(events) == 1
+        event = events[0]
+        assert event.job is job and event.error is None
+        assert event.result.found
+        assert job.expanded > 0
+        updates = job.take_updates()
+        path = {block.index for block, code in updates if code == block_state.PATH_CODE}
+        assert path == set(event.result.path) - {start.index, end.index}
+        assert all(block.graph is grid[0][0].graph for block, _ in updates)
+        assert job.take_updates() == []
+
+    def test_updates_arrive_before_search_finishes(self, worker):
+        worker.flush_seconds = 0
+        grid = create_grid()
+        start, end = place(grid)
+        gate = threading.Event()
+        job = worker.submit(GatedPathfinder(gate, after=20), grid, start, end)
+
+        partial = []
+        deadline = time.monotonic() + 30
+        while not partial and time.monotonic() < deadline:
+            partial = job.take_updates()
+        assert partial
+        assert not job.future.done()
+        assert pygame.event.get(SEARCH_DONE) == []
+
+        gate.set()
+        event, = wait_done(job)
+        rest = job.take_updates()
+        assert event.result.found
+        assert any(code == block_state.PATH_CODE for _, code in rest)
+        assert not any(code == block_state.PATH_CODE for _, code in partial)
+
+    def test_search_leaves_live_grid_untouched(self, worker):
+        grid = create_grid()
+        start, end = place(grid)
+        wait_done(worker.submit(AStarPathfinder(), grid, start, end))
+        assert all(not block.is_closed() and not block.is_open() for row in grid for block in row)
+
+    def test_snapshot_taken_at_submit(self, worker):
+        grid = create_grid()
+        start, end = place(grid)
+        job = worker.submit(AStarPathfinder(), grid, start, end)
+        for block in grid[0][1:-1]:
+            block.set_barrier()
+        event, = wait_done(job)
+        assert len(event.result.path) == len(grid) - 1
+
+    def test_cancelled_job_posts_nothing(self, worker):
+        grid = create_grid()
+        start, end = place(grid)
+        gate = hold(worker)
+        job = worker.submit(AStarPathfinder(), grid, start, end)
+        worker.cancel()
+        gate.set()
+        assert job.cancelled
+        assert wait_done(job) == []
+
+    def test_new_submission_cancels_previous(self, worker):
+        grid = create_grid()
+        start, end = place(grid)
+        gate = hold(worker)
+        first = worker.submit(AStarPathfinder(), grid, start, end)
+        second = worker.submit(AStarPathfinder(), grid, start, end)
+        gate.set()
+        first.future.result(timeout=30)
+        events = wait_done(second)
+        assert first.cancelled
+        assert [event.job for event in events] == [second]
+
+    def test_incremental_pathfinder_sees_edits(self, worker):
+        grid = create_grid()
+        start, end = place(grid)
+        dstar = DStarLitePathfinder()
+        first, = wait_done(worker.submit(dstar, grid, start, end, notify=[dstar]))
+
+        wall = [grid[row][len(grid) // 2] for row in range(len(grid) - 1)]
+        for block in wall:
+            block.set_barrier()
+        second, = wait_done(worker.submit(dstar, grid, start, end, changed=wall, notify=[dstar]))
+
+        fresh, = wait_done(worker.submit(AStarPathfinder(), grid, start, end))
+        assert len(second.result.path) == len(fresh.result.path) > len(first.result.path)
@@ -0,0 +1,145 @@
+"""Tests for the pygame visualizer, run on SDL's dummy video driver."""
+
+import os
+import random
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+from blocks.block import Block
+from blocks.grid_graph import GridGraph
+from visualizer import PathfindingVisualizer, create_grid
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def paint(grid, seed=1):
+    """Give the grid a random mix of every block state."""
+    rng = random.Random(seed)
+    for row in grid:
+        for block in row:
+            roll = rng.random()
+            if roll < 0.2:
+                block.set_barrier()
+            elif roll < 0.3:
+                block.set_open()
+            elif roll < 0.4:
+                block.set_closed()
+            elif roll < 0.45:
+                block.set_backward_closed()
+            elif roll < 0.5:
+                block.set_path()
+    grid[0][1].reset()
+    grid[0][1].set_start()
+    grid[-1][-2].reset()
+    grid[-1][-2].set_end()
+
+
+def frame(visualizer):
+    return pygame.image.tostring(visualizer.window, 'RGB')
+
+
+class TestRenderers:
+    """The array renderer must draw exactly what the blocks renderer draws."""
+
+    def test_unknown_renderer_rejected(self):
+        with pytest.raises(ValueError):
+            PathfindingVisualizer('sprites')
+
+    def test_array_matches_blocks(self):
+        grid = create_grid()
+        paint(grid)
+
+        blocks = PathfindingVisualizer('blocks')
+        blocks.draw_grid(grid)
+        expected = frame(blocks)
+
+        array = PathfindingVisualizer('array')
+        array.draw_grid(grid)
+        assert frame(array) == expected
+
+    def test_array_matches_blocks_for_other_block_size(self):
+        grid = [[Block(row, col, 20, 10) for col in range(10)] for row in range(10)]
+        GridGraph.from_blocks(grid)
+        paint(grid)
+
+        blocks = PathfindingVisualizer('blocks')
+        blocks.draw_grid(grid)
+        expected = frame(blocks)
+
+        array = PathfindingVisualizer('array')
+        array.draw_grid(grid)
+        assert frame(array) == expected
+
+    def test_array_follows_state_changes(self):
+        grid = create_grid()
+        array = PathfindingVisualizer('array')
+        array.draw_grid(grid)
+
+        paint(grid, seed=2)
+        array.draw_grid(grid)
+
+        blocks = PathfindingVisualizer('blocks')
+        blocks.draw_grid(grid)
+        assert frame(array) == frame(blocks)
+
+
+class TestCachedLayers:
+    """Static layers are rendered once; status text only when it changes."""
+
+    def test_status_rendered_only_on_change(self):
+        grid = create_grid()
+        visualizer = PathfindingVisualizer()
+        visualizer.draw_grid(grid, "A*", "Place Start")
+        status = visualizer._status
+
+        visualizer.draw_grid(grid, "A*", "Place Start")
+        assert visualizer._status is status
+
+        visualizer.draw_grid(grid, "A*", "Searching...")
+        assert visualizer._status is not status
+
+    def test_maze_name_change_updates_status(self):
+        grid = create_grid()
+        visualizer = PathfindingVisualizer()
+        visualizer.draw_grid(grid)
+        status = visualizer._status
+
+        visualizer.maze_name = "Kruskal"
+        visualizer.draw_grid(grid)
+        assert visualizer._status is not status
+
+    def test_layers_rebuilt_for_new_grid_size(self):
+        visualizer = PathfindingVisualizer()
+        visualizer.draw_grid(create_grid())
+        lines, controls = visualizer._grid_lines, visualizer._controls
+
+        visualizer.draw_grid(create_grid())
+        assert visualizer._grid_lines is lines and visualizer._controls is controls
+
+        small = [[Block(row, col, 20, 10) for col in range(10)] for row in range(10)]
+        visualizer.draw_grid(small)
+        assert visualizer._grid_lines is not lines
+        assert visualizer._grid_lines.get_size() == (200, 200)
+
+    def test_incremental_frame_matches_full_frame(self):
+        grid = create_grid()
+        visualizer = PathfindingVisualizer()
+        visualizer.draw_grid(grid, "A*", "Place Start")
+
+        for col in range(5):
+            grid[3][col].set_closed()
+        grid[4][4].set_barrier()
+        visualizer.draw_grid(grid, "Dijkstra", "Searching...")
+        incremental = frame(visualizer)
+
+        fresh = PathfindingVisualizer()
+        fresh.draw_grid(grid, "Dijkstra", "Searching...")
+        assert incremental == frame(fresh)
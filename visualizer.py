@@ -2,116 +2,216 @@
 Visualization layer for pathfinding algorithms.
 
 Handles pygame rendering and animation separate from main logic.
+
+Two grid renderers are available:
+- 'blocks': draws each block that changed since the last frame
+- 'array':  wraps the graph's state codes in an 8-bit palette surface, so
+  the palette is the colour lookup table, then scales it up and blits the
+  whole grid at once; frame time barely grows with ROWS
+
+Everything else on screen is cached in layers: the grid-line overlay and
+the controls panel are rendered once, the status text only when it
+changes, and frames are composed by blitting them.
 """
 
 import pygame
 from typing import List, Optional, Tuple
+from blocks import block_state
 from blocks.block import Block
+from blocks.grid_graph import GridGraph
 from config import constants
-from algorithms.base_pathfinder import PathfindingResult
+
+RENDERERS = ('blocks', 'array')
+
+# Height of the status section at the top of the side panel; the controls follow
+STATUS_HEIGHT = 150
+
+CONTROLS = [
+    "Left Click: Place blocks",
+    "Right Click: Erase blocks",
+    "",
+    "SPACE: Run",
+    "X: Cancel search",
+    "C: Clear grid",
+    "M: Generate maze",
+    "G: Next maze generator",
+    "",
+    "1: A* algorithm",
+    "2: Dijkstra",
+    "3: Jump Point Search",
+    "4: Bidirectional A*",
+    "5: Bidirectional Dijkstra",
+    "6: D* Lite (replanning)",
+    "7: HPA* (hierarchical)",
+    "",
+    "P: Pause / resume",
+    "RIGHT: Step",
+    "UP / DOWN: Speed",
+    "ENTER: Skip to end",
+    "",
+    "ESC: Quit"
+]
+
+# Colour of every state code, padded to a full 8-bit palette
+PALETTE = [state.get_color() for state in block_state.STATES]
+PALETTE += [constants.BLACK] * (256 - len(PALETTE))
 
 
 class PathfindingVisualizer:
     """Handles visualization of pathfinding algorithms."""
 
-    def __init__(self):
+    def __init__(self, renderer: str = constants.RENDERER):
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unknown renderer '{renderer}', expected one of {RENDERERS}")
+        self.renderer = renderer
         self.window = pygame.display.set_mode((constants.WIDTH + 250, constants.WIDTH))
         pygame.display.set_caption("Pathfinding Visualizer")
         self.clock = pygame.time.Clock()
         pygame.font.init()
         self.font = pygame.font.SysFont('Arial', 18)
         self.title_font = pygame.font.SysFont('Arial', 22, bold=True)
+        self.maze_name = "Wilson"
 
-    def draw_grid(self, grid: List[List[Block]], algorithm_name: str = "A*",
-                  next_action: str = "Place Start") -> None:
-        """Draw blocks, grid lines, and side panel."""
-        self.window.fill(constants.BLACK)
+        # Grid currently on screen; its graph's changes are drawn incrementally
+        self._drawn_grid: Optional[List[List[Block]]] = None
 
-        for row in grid:
-            for block in row:
-                block.draw(self.window)
+        # Cached layers, rebuilt when their key (sizes, or the status text) changes
+        self._layers_key: Optional[Tuple[int, ...]] = None
+        self._grid_lines: Optional[pygame.Surface] = None
+        self._controls: Optional[pygame.Surface] = None
+        self._status_key: Optional[Tuple[str, str, str]] = None
+        self._status: Optional[pygame.Surface] = None
 
-        self._draw_grid_lines()
-        self._draw_side_panel(algorithm_name, next_action)
-        pygame.display.update()
+    def draw_grid(self, grid: List[List[Block]], algorithm_name: str = "A*",
+                  next_action: str = "Place Start") -> None:
+        """
+        Draw blocks, grid lines, and side panel.
+
+        When the same attached grid was drawn last frame, only blocks whose
+        state changed since then are redrawn and only their rects (plus the
+        status text, if it changed) are pushed to the display.
+        """
+        graph = grid[0][0].graph if grid and grid[0] else None
+        attached = graph is not None and graph.blocks is grid
+        changed = graph.take_changes() if attached else None
+        rebuilt = self._build_layers(grid)
+
+        if attached and self.renderer == 'array':
+            self.window.fill(constants.BLACK)
+            self._draw_array_grid(graph)
+            self._draw_grid_lines()
+            self._draw_side_panel(algorithm_name, next_action)
+            pygame.display.update()
+            return
+
+        if changed is None or grid is not self._drawn_grid or rebuilt:
+            self.window.fill(constants.BLACK)
+            for row in grid:
+                for block in row:
+                    block.draw(self.window)
+            self._draw_grid_lines()
+            self._draw_side_panel(algorithm_name, next_action)
+            pygame.display.update()
+            self._drawn_grid = grid if attached else None
+            return
+
+        rects = [self._redraw_block(graph.block(index)) for index in changed]
+        status = self._redraw_status(algorithm_name, next_action)
+        if status is not None:
+            rects.append(status)
+        pygame.display.update(rects)
+
+    def invalidate(self) -> None:
+        """Redraw the whole window on the next draw_grid, e.g. after it was uncovered."""
+        self._drawn_grid = None
+
+    @staticmethod
+    def _block_size(grid: List[List[Block]]) -> int:
+        """Pixel size of one block, taken from the blocks themselves (GAP for an empty grid)."""
+        return grid[0][0].width if grid and grid[0] else constants.GAP
+
+    def _build_layers(self, grid: List[List[Block]]) -> bool:
+        """
+        Render the grid-line overlay and controls panel if the window or grid size changed.
+
+        Returns True when the layers were rebuilt, so the caller redraws the whole frame.
+        """
+        rows = len(grid)
+        cols = len(grid[0]) if grid else 0
+        gap = self._block_size(grid)
+        width, height = self.window.get_size()
+        key = (width, height, rows, cols, gap)
+        if key == self._layers_key:
+            return False
+        self._layers_key = key
+
+        # Grid lines on a black colour key, so blitting them leaves the blocks visible
+        lines = pygame.Surface((rows * gap, cols * gap))
+        lines.set_colorkey(constants.BLACK)
+        for i in range(cols):
+            pygame.draw.line(lines, constants.GREY, (0, i * gap), (rows * gap - 1, i * gap))
+        for i in range(rows):
+            pygame.draw.line(lines, constants.GREY, (i * gap, 0), (i * gap, cols * gap - 1))
+        self._grid_lines = lines
+
+        panel_x = 10
+        controls = pygame.Surface((width - constants.WIDTH, max(height - STATUS_HEIGHT, 0)))
+        controls.blit(self.title_font.render("CONTROLS", True, constants.WHITE), (panel_x, 0))
+        for i, text in enumerate(CONTROLS):
+            controls.blit(self.font.render(text, True, constants.WHITE), (panel_x, 40 + i * 25))
+        self._controls = controls
+
+        self._status_key = None
+        return True
+
+    def _status_layer(self, algorithm_name: str, next_action: str) -> Tuple[pygame.Surface, bool]:
+        """Return the status section and whether it was re-rendered for new text."""
+        key = (algorithm_name, next_action, self.maze_name)
+        if key == self._status_key:
+            return self._status, False
+        self._status_key = key
+
+        panel_x = 10
+        status = pygame.Surface((self.window.get_width() - constants.WIDTH, STATUS_HEIGHT))
+        status.blit(self.title_font.render("STATUS", True, constants.WHITE), (panel_x, 20))
+        status.blit(self.font.render(f"Algorithm: {algorithm_name}", True, constants.GREEN), (panel_x, 60))
+        status.blit(self.font.render(f"Next: {next_action}", True, constants.YELLOW), (panel_x, 90))
+        status.blit(self.font.render(f"Maze: {self.maze_name}", True, constants.WHITE), (panel_x, 120))
+        self._status = status
+        return status, True
+
+    def _draw_array_grid(self, graph: GridGraph) -> None:
+        """Draw every block in one blit, colouring the graph's state codes through PALETTE."""
+        rows, cols, gap = graph.rows, graph.cols, self._block_size(graph.blocks)
+        # One palette pixel per block; the image runs row by row, so transpose it to x = row
+        image = pygame.image.frombuffer(graph.states, (cols, rows), 'P')
+        image.set_palette(PALETTE)
+        image = pygame.transform.flip(pygame.transform.rotate(image, -90), True, False)
+        self.window.blit(pygame.transform.scale(image, (rows * gap, cols * gap)), (0, 0))
+
+    def _redraw_block(self, block: Block) -> pygame.Rect:
+        """Draw one block with its top and left grid lines and return its rect."""
+        block.draw(self.window)
+        rect = pygame.Rect(block.x, block.y, block.width, block.width)
+        self.window.blit(self._grid_lines, rect, rect)
+        return rect
+
+    def _redraw_status(self, algorithm_name: str, next_action: str) -> Optional[pygame.Rect]:
+        """Redraw the status section if its text changed, returning its rect (None if unchanged)."""
+        status, rendered = self._status_layer(algorithm_name, next_action)
+        if not rendered:
+            return None
+        return self.window.blit(status, (constants.WIDTH, 0))
 
     def _draw_grid_lines(self) -> None:
-        """Draw grid lines."""
-        for i in range(constants.ROWS):
-            pygame.draw.line(
-                self.window,
-                constants.GREY,
-                (0, i * constants.GAP),
-                (constants.WIDTH, i * constants.GAP)
-            )
-            pygame.draw.line(
-                self.window,
-                constants.GREY,
-                (i * constants.GAP, 0),
-                (i * constants.GAP, constants.WIDTH)
-            )
+        """Draw grid lines from the cached overlay."""
+        self.window.blit(self._grid_lines, (0, 0))
 
     def _draw_side_panel(self, algorithm_name: str, next_action: str) -> None:
-        """Draw side panel with controls and status."""
-        panel_x = constants.WIDTH + 10
-
-        # Status section
-        title = self.title_font.render("STATUS", True, constants.WHITE)
-        self.window.blit(title, (panel_x, 20))
-
-        algo_text = self.font.render(f"Algorithm: {algorithm_name}", True, constants.GREEN)
-        self.window.blit(algo_text, (panel_x, 60))
-
-        action_text = self.font.render(f"Next: {next_action}", True, constants.YELLOW)
-        self.window.blit(action_text, (panel_x, 90))
-
-        # Controls section
-        y = 150
-        controls_title = self.title_font.render("CONTROLS", True, constants.WHITE)
-        self.window.blit(controls_title, (panel_x, y))
-
-        controls = [
-            "Left Click:",
-            "  Place blocks",
-            "",
-            "Right Click:",
-            "  Erase blocks",
-            "",
-            "SPACE: Run",
-            "C: Clear grid",
-            "M: Generate maze",
-            "",
-            "1: A* algorithm",
-            "2: Dijkstra",
-            "",
-            "ESC: Quit"
-        ]
-
-        for i, text in enumerate(controls):
-            surface = self.font.render(text, True, constants.WHITE)
-            self.window.blit(surface, (panel_x, y + 40 + i * 25))
-
-    def animate_search(self, grid: List[List[Block]], visited: List[Block],
-                       start: Block, end: Block, algorithm_name: str, delay_ms: int = 10) -> None:
-        """Animate algorithm search process."""
-        for block in visited:
-            if block != start and block != end:
-                block.set_closed()
-                self.draw_grid(grid, algorithm_name, "Searching...")
-                pygame.time.delay(delay_ms)
-
-    def animate_path(self, grid: List[List[Block]], path: List[Block],
-                     start: Block, end: Block, algorithm_name: str, delay_ms: int = 30) -> None:
-        """Animate final path."""
-        for block in path:
-            if block != start and block != end:
-                block.set_path()
-                self.draw_grid(grid, algorithm_name, "Path Found!")
-                pygame.time.delay(delay_ms)
-
-        start.set_start()
-        end.set_end()
-        self.draw_grid(grid, algorithm_name, "Complete")
+        """Draw side panel with controls and status from the cached layers."""
+        status, _ = self._status_layer(algorithm_name, next_action)
+        self.window.blit(status, (constants.WIDTH, 0))
+        self.window.blit(self._controls, (constants.WIDTH, STATUS_HEIGHT))
 
     def get_clicked_block(self, grid: List[List[Block]]) -> Optional[Block]:
         """Get block at mouse position."""
@@ -125,7 +225,7 @@ class PathfindingVisualizer:
 
 
 def create_grid() -> List[List[Block]]:
-    """Create empty grid of blocks."""
+    """Create empty grid of blocks, attached to a GridGraph they sync into."""
     grid = []
     for i in range(constants.ROWS):
         grid_row = []
@@ -133,4 +233,5 @@ def create_grid() -> List[List[Block]]:
             block = Block(i, j, constants.GAP, constants.ROWS)
             grid_row.append(block)
         grid.append(grid_row)
+    GridGraph.from_blocks(grid)
     return grid
\ No newline at end of file